@@ -0,0 +1,168 @@
+import asyncio
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional
+
+from cachetools import LRUCache
+
+from mcp_tourism.concurrency import TokenBucket
+
+
+class AdmissionRejected(Exception):
+    """Raised when a call is turned away instead of being queued"""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class FairScheduler:
+    """
+    Fair queuing and admission control of tool calls across sessions.
+
+    At most `max_concurrent` calls run at a time. Calls beyond that wait in a
+    queue per session (or client address), and a finishing call hands its slot
+    to the next session in round-robin order, so a session issuing many calls
+    at once waits behind itself instead of in front of everybody else. Each
+    session also has a token bucket of `session_rate` calls per second with
+    bursts of `session_burst`.
+
+    Rather than letting latency grow without bound, a call is rejected with
+    `AdmissionRejected` when its session's bucket would make it wait longer
+    than `max_rate_wait`, when the session already has
+    `max_queued_per_session` calls waiting, or when `max_queued` calls are
+    waiting in total.
+
+    Instances are bound to the event loop they are used on.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 16,
+        max_queued: int = 64,
+        max_queued_per_session: int = 8,
+        session_rate: float = 5.0,
+        session_burst: int = 10,
+        max_rate_wait: float = 2.0,
+        max_sessions: int = 1024,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrent: Maximum number of calls running at the same time.
+            max_queued: Maximum number of calls waiting across all sessions.
+            max_queued_per_session: Maximum number of calls waiting per session.
+            session_rate: Calls per second a session may start.
+            session_burst: Calls a session may start at once after being idle.
+            max_rate_wait: Longest wait for a session's rate limit token
+                before the call is rejected.
+            max_sessions: Number of most recently seen sessions whose rate
+                limit state is kept.
+        """
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max_queued
+        self.max_queued_per_session = max_queued_per_session
+        self.session_rate = session_rate
+        self.session_burst = session_burst
+        self.max_rate_wait = max_rate_wait
+
+        self._in_flight = 0
+        self._buckets: LRUCache = LRUCache(maxsize=max_sessions)
+        # Waiting calls per session, in the round-robin order sessions are served in
+        self._queues: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+        self._admitted = 0
+        self._rejected = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently running"""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Number of calls waiting for a slot"""
+        return sum(self._queued(session) for session in self._queues)
+
+    def _queued(self, session: str) -> int:
+        queue = self._queues.get(session)
+        if queue is None:
+            return 0
+        return sum(1 for waiter in queue if not waiter.done())
+
+    def _bucket(self, session: str) -> TokenBucket:
+        bucket = self._buckets.get(session)
+        if bucket is None:
+            bucket = TokenBucket(rate=self.session_rate, capacity=self.session_burst)
+            self._buckets[session] = bucket
+        return bucket
+
+    def _reject(self, message: str, retry_after: Optional[float] = None) -> None:
+        self._rejected += 1
+        raise AdmissionRejected(message, retry_after)
+
+    async def acquire(self, session: str) -> None:
+        """
+        Wait for a slot on behalf of a session.
+
+        Args:
+            session: Identifier of the session (or client) making the call.
+
+        Raises:
+            AdmissionRejected: If the session exceeds its rate limit or the
+                queues are full.
+        """
+        bucket = self._bucket(session)
+        if not await bucket.acquire(timeout=self.max_rate_wait):
+            self._reject(
+                f"Too many calls from this session (limit {self.session_rate:g}/s)",
+                retry_after=(1 - bucket.tokens) / self.session_rate,
+            )
+
+        if self._in_flight < self.max_concurrent and not self.queued:
+            self._in_flight += 1
+            self._admitted += 1
+            return
+
+        if self._queued(session) >= self.max_queued_per_session:
+            bucket.refund()
+            self._reject("Too many calls from this session are already waiting")
+        if self.queued >= self.max_queued:
+            bucket.refund()
+            self._reject("Server is overloaded, too many calls are waiting")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(session, deque()).append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation
+                self.release()
+            raise
+        self._admitted += 1
+
+    def release(self) -> None:
+        """Free the slot of a finished call, handing it to the next session in turn"""
+        while self._queues:
+            session, queue = self._queues.popitem(last=False)
+            while queue and queue[0].done():
+                queue.popleft()
+            if not queue:
+                continue
+            queue.popleft().set_result(None)
+            if queue:
+                # The session goes to the back of the line for its next call
+                self._queues[session] = queue
+            return
+        self._in_flight -= 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of the scheduler state for metrics export"""
+        return {
+            "max_concurrent": self.max_concurrent,
+            "in_flight": self._in_flight,
+            "queued": self.queued,
+            "queued_sessions": sum(1 for s in self._queues if self._queued(s)),
+            "admitted": self._admitted,
+            "rejected": self._rejected,
+        }
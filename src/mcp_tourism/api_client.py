@@ -4,15 +4,61 @@ import asyncio
 import urllib.parse
 import json
 import codecs
-from typing import Dict, Optional, Any, Literal, ClassVar
-from cachetools import TTLCache
-from tenacity import (
-    retry,
-    stop_after_attempt,
-    wait_exponential,
-    retry_if_exception_type,
+import copy
+import heapq
+import math
+import re
+import socket
+import threading
+import time
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Deque,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    TypeVar,
 )
-from ratelimit import limits, sleep_and_retry
+from cachetools import LRUCache, TTLCache
+
+from mcp_tourism.concurrency import (
+    BACKGROUND,
+    INTERACTIVE,
+    AdaptiveConcurrencyLimiter,
+    SingleFlight,
+    current_lane,
+    request_lane,
+)
+from mcp_tourism.geo import (
+    MAX_QUERY_RADIUS_M,
+    CoverageIndex,
+    Point,
+    Route,
+    grid_cover,
+    haversine_m,
+    in_bbox,
+    item_point,
+    validate_bbox,
+    validate_point,
+)
+from mcp_tourism.key_pool import ApiKeyPool
+from mcp_tourism.memo import note_cache_key
+from mcp_tourism.overload import LoadShedder
+from mcp_tourism.quota import QuotaAccountant, key_fingerprint
+from mcp_tourism.resilience import (
+    CircuitBreaker,
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+T = TypeVar("T")
 
 
 # Map of content type IDs to their human-readable names
@@ -27,6 +73,27 @@ CONTENTTYPE_ID_MAP = {
     "77": "Transportation",
 }
 
+# Map of top-level area codes to their names
+AREA_CODE_MAP = {
+    "1": "Seoul",
+    "2": "Incheon",
+    "3": "Daejeon",
+    "4": "Daegu",
+    "5": "Gwangju",
+    "6": "Busan",
+    "7": "Ulsan",
+    "8": "Sejong",
+    "31": "Gyeonggi-do",
+    "32": "Gangwon-do",
+    "33": "Chungcheongbuk-do",
+    "34": "Chungcheongnam-do",
+    "35": "Gyeongsangbuk-do",
+    "36": "Gyeongsangnam-do",
+    "37": "Jeonbuk-do",
+    "38": "Jeollanam-do",
+    "39": "Jeju-do",
+}
+
 # Map of supported languages to their service endpoints
 LANGUAGE_SERVICE_MAP = {
     "en": "EngService2",  # English
@@ -66,6 +133,82 @@ def decode_unicode_escapes(obj: Any) -> Any:
         return obj
 
 
+# Text fields that are always reported per language, even where they match
+LOCALIZED_FIELDS = frozenset(
+    {"title", "addr1", "addr2", "overview", "tel", "telname", "homepage"}
+)
+
+
+def merge_localized_items(
+    items_by_language: Dict[str, List[Dict[str, Any]]],
+) -> List[Dict[str, Any]]:
+    """
+    Join the items of several language services by content ID.
+
+    Fields with the same value in every language an item was found in (IDs,
+    coordinates, categories, images) are kept at the top level; text fields
+    and any field that differs go under "localized", keyed by language. The
+    language services do not always share content IDs, so items that cannot
+    be joined are returned on their own.
+
+    Args:
+        items_by_language: Items per language code, in the desired order.
+
+    Returns:
+        Merged items in order of first appearance, each with structure:
+        {
+            "contentid": str,
+            "languages": [str],             # Languages the item was found in
+            ...                             # Fields shared by all of them
+            "localized": {"<language>": {...}},
+        }
+    """
+    grouped: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for language, items in items_by_language.items():
+        for index, item in enumerate(items):
+            # Items without an ID cannot be joined and stay on their own
+            key = str(item.get("contentid") or f"{language}:{index}")
+            grouped.setdefault(key, {})[language] = item
+
+    merged = []
+    for versions in grouped.values():
+        fields = dict.fromkeys(f for item in versions.values() for f in item)
+        shared = {
+            field: next(iter(versions.values())).get(field)
+            for field in fields
+            if field not in LOCALIZED_FIELDS
+            and len({repr(item.get(field)) for item in versions.values()}) == 1
+        }
+        merged.append(
+            {
+                **shared,
+                "languages": list(versions),
+                "localized": {
+                    language: {k: v for k, v in item.items() if k not in shared}
+                    for language, item in versions.items()
+                },
+            }
+        )
+    return merged
+
+
+def _modified_sort_key(item: Dict[str, Any]) -> int:
+    # Most recently modified first; items without a timestamp go last
+    modified = str(item.get("modifiedtime") or "")
+    return -int(modified) if modified.isdigit() else 0
+
+
+def _title_sort_key(item: Dict[str, Any]) -> str:
+    return str(item.get("title") or "")
+
+
+# Merge keys matching the order of KoreaTourismApiClient.SORT_ARRANGE
+SORT_KEYS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "modified": _modified_sort_key,
+    "title": _title_sort_key,
+}
+
+
 class TourismApiError(Exception):
     """Base exception for Tourism API errors"""
 
@@ -74,11 +217,14 @@ class TourismApiError(Exception):
         message: str,
         response: Optional[httpx.Response] = None,
         request: Optional[httpx.Request] = None,
+        retry_after: Optional[float] = None,
     ):
         super().__init__(message)
         self.message = message
         self.response = response
         self.request = request
+        # Seconds the server asked us to wait before retrying (Retry-After)
+        self.retry_after = retry_after
 
     def __str__(self) -> str:
         base_str = super().__str__()
@@ -103,12 +249,50 @@ class TourismApiClientError(TourismApiError):
     pass
 
 
+class TourismApiRateLimitError(TourismApiClientError):
+    """Too many requests to the Tourism API (429)"""
+
+    pass
+
+
 class TourismApiServerError(TourismApiError):
     """Server-side error with Tourism API operations (5xx)"""
 
     pass
 
 
+class TourismApiDeadlineExceeded(TourismApiError):
+    """The request could not be completed before its deadline"""
+
+    pass
+
+
+class TourismApiKeyError(TourismApiError):
+    """The service key was rejected: quota exceeded, not registered or expired"""
+
+    def __init__(self, message: str, result_code: str):
+        super().__init__(message)
+        self.result_code = result_code
+
+
+class TourismApiQuotaExceededError(TourismApiError):
+    """The daily quota is nearly used up and the response is not cached"""
+
+    pass
+
+
+class TourismApiCircuitOpenError(TourismApiError):
+    """Upstream calls are short-circuited because the endpoint keeps failing"""
+
+    pass
+
+
+class TourismApiOverloadedError(TourismApiError):
+    """The request was shed because the server is overloaded"""
+
+    pass
+
+
 class KoreaTourismApiClient:
     """
     Client for the Korea Tourism Organization API with caching and rate limiting.
@@ -117,8 +301,9 @@ class KoreaTourismApiClient:
     - Multi-language support
     - Response caching with TTL
     - Rate limiting to respect API quotas
-    - Automatic retries for transient errors
-    - Connection pooling
+    - Automatic retries for transient errors, with jitter and a retry budget
+    - Connection pooling, shared per running event loop
+    - Async context manager lifecycle (`async with KoreaTourismApiClient(...)`)
     """
 
     # Base URL for all services
@@ -131,6 +316,13 @@ class KoreaTourismApiClient:
     MOBILE_APP = "MobileApp"
     RESPONSE_FORMAT = "json"
     ARRANGE_MODIFIED_WITH_IMAGE = "Q"  # Sort by modified date with image
+    ARRANGE_TITLE_WITH_IMAGE = "O"  # Sort by title with image
+    ARRANGE_DISTANCE_WITH_IMAGE = "S"  # Sort by distance with image (location only)
+    # Arrange values of the sort orders results can be requested in
+    SORT_ARRANGE = {
+        "modified": ARRANGE_MODIFIED_WITH_IMAGE,
+        "title": ARRANGE_TITLE_WITH_IMAGE,
+    }
     # --- End Constants ---
 
     # Common endpoints (will be prefixed with service name)
@@ -147,11 +339,37 @@ class KoreaTourismApiClient:
     AREA_CODE_LIST_ENDPOINT = "/areaCode2"
     CATEGORY_CODE_LIST_ENDPOINT = "/categoryCode2"
 
-    # Class-level connection pool and semaphore for concurrency control
-    _shared_client: ClassVar[Optional[httpx.AsyncClient]] = None
-    _client_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
-    # Make concurrency limit configurable
-    # _request_semaphore: ClassVar[asyncio.Semaphore] = asyncio.Semaphore(10)
+    # Idle keepalive connections are kept this long, which must outlast the
+    # interval between keep-warm pings for pre-warmed connections to survive
+    KEEPALIVE_EXPIRY = 90.0
+    # Successful requests an endpoint needs before its requests get hedged
+    HEDGE_MIN_SAMPLES = 20
+    # Items fetched per circle of a route or box search, and the most circles
+    # a route or box may need
+    AREA_QUERY_ROWS = 100
+    MAX_ROUTE_QUERIES = 100
+    MAX_BBOX_QUERIES = 25
+    # Most pages fetch_all_pages requests for one list
+    MAX_DRAIN_PAGES = 50
+    # Share of each key's rate limit that background and bulk requests leave
+    # for interactive ones
+    INTERACTIVE_TOKEN_RESERVE = 0.2
+    # Cached responses stay valid this many times longer while quota runs low
+    QUOTA_CACHE_TTL_FACTOR = 4
+    # data.go.kr result codes that reject the service key rather than the request:
+    # access denied, request quota exceeded, key not registered, key expired,
+    # unregistered IP
+    KEY_ERROR_CODES = frozenset({"20", "22", "30", "31", "32"})
+
+    # Shared connection pools, one per running event loop. httpx.AsyncClient and
+    # asyncio primitives are bound to the loop they are first used on, so every
+    # loop (pytest, worker threads, embedding apps) gets its own client and lock.
+    _loop_clients: ClassVar[Dict[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+    _loop_locks: ClassVar[Dict[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+    # Number of open `async with` blocks per loop; the last one to exit closes the pool
+    _loop_refcounts: ClassVar[Dict[asyncio.AbstractEventLoop, int]] = {}
+    # Guards the registries above, which are shared between threads
+    _registry_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(
         self,
@@ -161,6 +379,24 @@ class KoreaTourismApiClient:
         rate_limit_calls: int = 5,
         rate_limit_period: int = 1,
         concurrency_limit: int = 10,
+        min_concurrency: int = 1,
+        max_concurrency: int = 50,
+        breaker_failure_rate: float = 0.5,
+        breaker_minimum_calls: int = 10,
+        breaker_reset_timeout: float = 30.0,
+        retry_attempts: int = 3,
+        retry_base_delay: float = 0.5,
+        retry_max_delay: float = 10.0,
+        retry_budget_ratio: float = 0.2,
+        hedge_requests: bool = False,
+        hedge_budget_ratio: float = 0.1,
+        daily_quota: int = 1000,
+        quota_file: Optional[str] = None,
+        api_keys: Optional[Sequence[str]] = None,
+        shed_queue_depth: int = 50,
+        shed_loop_lag: float = 0.25,
+        shed_latency: float = 10.0,
+        count_cache_ttl: int = 604800,
     ):
         """
         Initialize with API key and optional configurations.
@@ -171,7 +407,42 @@ class KoreaTourismApiClient:
             cache_ttl: Time-to-live for cached responses in seconds.
             rate_limit_calls: Maximum number of API calls allowed.
             rate_limit_period: Time period (in seconds) for the rate limit.
-            concurrency_limit: Maximum number of concurrent API requests.
+            concurrency_limit: Initial number of concurrent API requests. The limit
+                adapts to upstream latency and errors from there.
+            min_concurrency: Lower bound for the adaptive concurrency limit.
+            max_concurrency: Upper bound for the adaptive concurrency limit.
+            breaker_failure_rate: Failure rate (0-1) that opens the circuit breaker
+                of an endpoint and language service.
+            breaker_minimum_calls: Calls recorded before a breaker may open.
+            breaker_reset_timeout: Seconds an open breaker fails fast before it
+                lets a single probe request through.
+            retry_attempts: Maximum attempts per request, including the first one.
+            retry_base_delay: Minimum delay between attempts in seconds.
+            retry_max_delay: Maximum delay between attempts in seconds. Requests
+                whose Retry-After asks for longer are not retried.
+            retry_budget_ratio: Retries allowed per request over the last ten
+                seconds, so an outage does not multiply upstream load.
+            hedge_requests: Send a second copy of a request that has not been
+                answered within the endpoint's 90th percentile latency and use
+                whichever response arrives first.
+            hedge_budget_ratio: Hedged requests allowed per request over the
+                last ten seconds.
+            daily_quota: Upstream calls allowed per language service per day.
+                As usage approaches it, cached responses are kept longer,
+                prefetching stops and finally only cached data is served.
+            quota_file: JSON file today's call counters are persisted to.
+            api_keys: Additional service keys. Calls are spread across all keys,
+                each with its own rate limit and daily quota, and a key rejected
+                by a service is skipped for it until the daily reset.
+            shed_queue_depth: Requests waiting for upstream at which bulk
+                requests are shed. Background requests are shed from 1.5 times
+                this load, new tool calls from twice this load.
+            shed_loop_lag: Event loop lag in seconds counting as the same load.
+            shed_latency: Smoothed upstream latency in seconds counting as the
+                same load.
+            count_cache_ttl: Time-to-live for cached total counts (count_only
+                requests) in seconds. Counts change slowly and are kept apart
+                from the responses, for longer.
         """
         self.api_key = api_key
         if (
@@ -190,14 +461,72 @@ class KoreaTourismApiClient:
         self._rate_limit_calls = rate_limit_calls
         self._rate_limit_period = rate_limit_period
         self._concurrency_limit = concurrency_limit
+        self._min_concurrency = min_concurrency
+        self._max_concurrency = max_concurrency
+        self._breaker_failure_rate = breaker_failure_rate
+        self._breaker_minimum_calls = breaker_minimum_calls
+        self._breaker_reset_timeout = breaker_reset_timeout
 
         # Lazy initialization flags/placeholders
         self.service_name: Optional[str] = None
         self.full_base_url: Optional[str] = None
         self._is_fully_initialized = False
         self._cache: Optional[TTLCache] = None
-        self._request_semaphore: Optional[asyncio.Semaphore] = None
+        # Last good response and its store time (time.monotonic()) per cache key
+        # regardless of TTL, served while a breaker is open or quota runs low
+        self._stale_cache: LRUCache = LRUCache(maxsize=1000)
+        self._quota = QuotaAccountant(daily_quota=daily_quota, path=quota_file)
+        # Circuit breakers keyed by (service name, endpoint)
+        self._circuit_breakers: Dict[tuple[str, str], CircuitBreaker] = {}
+        # Keys with their requests per period, shared by every event loop this
+        # client is used on
+        self._key_pool = ApiKeyPool(
+            [api_key, *(api_keys or [])],
+            rate_limit_calls=rate_limit_calls,
+            rate_limit_period=rate_limit_period,
+            quota=self._quota,
+        )
+        self._retry_policy = RetryPolicy(
+            max_attempts=retry_attempts,
+            base_delay=retry_base_delay,
+            max_delay=retry_max_delay,
+            retry_on=(
+                httpx.TimeoutException,
+                httpx.ConnectError,
+                httpx.RemoteProtocolError,
+                TourismApiRateLimitError,
+                TourismApiServerError,
+            ),
+            budget=RetryBudget(ratio=retry_budget_ratio),
+            on_retry=self._log_retry,
+        )
+        self._hedge_requests = hedge_requests
+        # The reserve allows one hedge per window while traffic is low
+        self._hedge_budget = RetryBudget(
+            ratio=hedge_budget_ratio, min_retries_per_second=0.1
+        )
+        self._hedges_sent = 0
+        self._hedges_won = 0
+        self._load_shedder = LoadShedder(
+            max_queue_depth=shed_queue_depth,
+            max_loop_lag=shed_loop_lag,
+            max_latency=shed_latency,
+        )
+        # Recent successful latencies keyed by (service name, endpoint)
+        self._endpoint_latencies: Dict[tuple[str, str], Deque[float]] = {}
+        # Concurrency limiters, one per event loop this client is used on
+        self._loop_limiters: Dict[
+            asyncio.AbstractEventLoop, AdaptiveConcurrencyLimiter
+        ] = {}
+        # Coalescing of identical concurrent requests, one per event loop
+        self._loop_flights: Dict[asyncio.AbstractEventLoop, SingleFlight] = {}
+        # Circles whose items are all known from location-based responses
+        self._coverage = CoverageIndex(ttl=cache_ttl)
+        # Total counts of lists per cache key of their one-row request
+        self._count_cache: TTLCache = TTLCache(maxsize=5000, ttl=count_cache_ttl)
         self.logger: Optional[logging.Logger] = None  # Add logger type hint
+        # Monotonic time of the last upstream request, used to ping only while idle
+        self._last_request_time = 0.0
 
     def _ensure_full_initialization(self):
         """Ensure all initialization tasks are completed before first API request"""
@@ -228,11 +557,9 @@ class KoreaTourismApiClient:
         self.service_name = LANGUAGE_SERVICE_MAP[self.language]
         self.full_base_url = f"{self.BASE_URL}/{self.service_name}"
 
-        # Initialize cache with configured TTL
-        self._cache = TTLCache(maxsize=1000, ttl=self._cache_ttl)
-
-        # Initialize semaphore with configured concurrency limit
-        self._request_semaphore = asyncio.Semaphore(self._concurrency_limit)
+        # Initialize cache with configured TTL, unless shared with another client
+        if self._cache is None:
+            self._cache = TTLCache(maxsize=1000, ttl=self._cache_ttl)
 
         self._is_fully_initialized = True
 
@@ -242,26 +569,341 @@ class KoreaTourismApiClient:
         self._ensure_full_initialization()
         return self._cache  # type: ignore  # We know it's initialized after _ensure_full_initialization
 
+    def is_cached(self, cache_key: str) -> bool:
+        """Check whether a response is in the cache and has not expired"""
+        return self._cache is not None and cache_key in self._cache
+
+    def with_api_key(self, api_key: str) -> "KoreaTourismApiClient":
+        """
+        Create a client for another tenant's service key.
+
+        The new client has its own key and rate limiter, and shares everything
+        that does not depend on the key with this one: configuration, response
+        caches, quota counters (which are kept per key), circuit breakers,
+        concurrency limiters, retry budget and the connection pools. Request
+        coalescing is kept per tenant, so a tenant's request never rides on an
+        upstream call made with another tenant's key.
+
+        Args:
+            api_key: Service key of the tenant.
+
+        Returns:
+            A client sending every request with `api_key`.
+        """
+        if self._cache is None:
+            self._cache = TTLCache(maxsize=1000, ttl=self._cache_ttl)
+        tenant = copy.copy(self)
+        tenant.api_key = api_key
+        tenant._key_pool = ApiKeyPool(
+            [api_key],
+            rate_limit_calls=self._rate_limit_calls,
+            rate_limit_period=self._rate_limit_period,
+            quota=self._quota,
+        )
+        tenant._hedges_sent = 0
+        tenant._hedges_won = 0
+        tenant._loop_flights = {}
+        # Validates the tenant's key on first use; the shared cache is kept
+        tenant._is_fully_initialized = False
+        return tenant
+
+    async def __aenter__(self) -> "KoreaTourismApiClient":
+        """Initialize the client and open the shared pool of the running loop"""
+        self._ensure_full_initialization()
+        loop = asyncio.get_running_loop()
+        with self._registry_lock:
+            self._loop_refcounts[loop] = self._loop_refcounts.get(loop, 0) + 1
+        await self.get_shared_client()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the running loop's shared pool once its last user has exited"""
+        loop = asyncio.get_running_loop()
+        with self._registry_lock:
+            remaining = self._loop_refcounts.get(loop, 1) - 1
+            if remaining > 0:
+                self._loop_refcounts[loop] = remaining
+            else:
+                self._loop_refcounts.pop(loop, None)
+        if remaining <= 0:
+            await self.close_all_connections()
+            await self.stop_load_monitor()
+        self.save_quota()
+
+    async def stop_load_monitor(self) -> None:
+        """Stop the event loop lag sampling of the load shedder on the running loop"""
+        await self._load_shedder.stop_monitor()
+
+    def save_quota(self) -> None:
+        """Persist today's quota counters, e.g. before shutting down"""
+        self._quota.save()
+
+    def _get_concurrency_limiter(self) -> AdaptiveConcurrencyLimiter:
+        """Get or create this client's concurrency limiter for the running loop"""
+        loop = asyncio.get_running_loop()
+        limiter = self._loop_limiters.get(loop)
+        if limiter is None:
+            # Drop limiters that belong to loops which no longer exist
+            for stale_loop in [lp for lp in self._loop_limiters if lp.is_closed()]:
+                del self._loop_limiters[stale_loop]
+            limiter = AdaptiveConcurrencyLimiter(
+                initial_limit=self._concurrency_limit,
+                min_limit=self._min_concurrency,
+                max_limit=self._max_concurrency,
+            )
+            self._loop_limiters[loop] = limiter
+        return limiter
+
+    def _get_single_flight(self) -> SingleFlight:
+        """Get or create this client's request coalescing for the running loop"""
+        loop = asyncio.get_running_loop()
+        flights = self._loop_flights.get(loop)
+        if flights is None:
+            for stale_loop in [lp for lp in self._loop_flights if lp.is_closed()]:
+                del self._loop_flights[stale_loop]
+            flights = self._loop_flights[loop] = SingleFlight()
+        return flights
+
+    @property
+    def load_level(self) -> str:
+        """Current load shedding level (see `LoadShedder`) on the running loop"""
+        self._load_shedder.ensure_monitor()
+        limiter = self._get_concurrency_limiter()
+        self._load_shedder.observe(
+            limiter.queued + self._key_pool.waiting, limiter.smoothed_latency
+        )
+        return self._load_shedder.level
+
+    def should_shed(self, lane: str = INTERACTIVE) -> bool:
+        """
+        Check whether new work of a priority lane is to be turned away.
+
+        Bulk work is shed first, then background work and finally new
+        interactive tool calls, as the load keeps rising.
+        """
+        if self.load_level == LoadShedder.NORMAL:
+            return False
+        return self._load_shedder.should_shed(lane)
+
+    def _get_circuit_breaker(self, endpoint: str, language: str) -> CircuitBreaker:
+        """Get or create the circuit breaker of an endpoint and language service"""
+        key = (LANGUAGE_SERVICE_MAP[language], endpoint)
+        breaker = self._circuit_breakers.get(key)
+        if breaker is None:
+            breaker = self._circuit_breakers[key] = CircuitBreaker(
+                failure_rate_threshold=self._breaker_failure_rate,
+                minimum_calls=self._breaker_minimum_calls,
+                reset_timeout=self._breaker_reset_timeout,
+            )
+        return breaker
+
+    @staticmethod
+    def _for_current_loop(registry: Dict[asyncio.AbstractEventLoop, T]) -> Optional[T]:
+        """Entry of the running loop, or of the most recent loop outside one"""
+        try:
+            entry = registry.get(asyncio.get_running_loop())
+        except RuntimeError:
+            entry = None
+        if entry is None and registry:
+            entry = list(registry.values())[-1]
+        return entry
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Collect runtime metrics of this client.
+
+        Returns:
+            Dictionary with the adaptive concurrency limiter state of the running
+            event loop (or of the most recently created loop when called outside
+            one), including queued requests and waits per priority lane, under
+            "concurrency", coalesced identical requests (same loop) under
+            "single_flight", the rate limiter and disabled services per key
+            fingerprint under "api_keys", the retry budget under
+            "retry_budget", hedged request counters under "hedging", the load
+            shedding state under "overload", the number of cached list counts
+            under "counts_cached", today's quota usage per service
+            under "quota", and the state of every circuit breaker keyed by
+            "<service><endpoint>" under "circuit_breakers".
+        """
+        limiter = self._for_current_loop(self._loop_limiters)
+        flights = self._for_current_loop(self._loop_flights)
+        return {
+            "concurrency": limiter.get_metrics() if limiter else None,
+            "single_flight": flights.get_metrics() if flights else None,
+            "api_keys": self._key_pool.get_metrics(),
+            "retry_budget": self._retry_policy.budget.get_metrics(),
+            "hedging": {
+                "enabled": self._hedge_requests,
+                "sent": self._hedges_sent,
+                "won": self._hedges_won,
+                "budget": self._hedge_budget.get_metrics(),
+            },
+            "overload": self._load_shedder.get_metrics(),
+            "counts_cached": len(self._count_cache),
+            "quota": self._quota.get_metrics(),
+            "circuit_breakers": {
+                f"{service}{endpoint}": breaker.get_metrics()
+                for (service, endpoint), breaker in self._circuit_breakers.items()
+            },
+        }
+
+    @classmethod
+    def _discard_closed_loops(cls) -> None:
+        """Forget the pools and locks of closed loops. Caller must hold _registry_lock."""
+        for registry in (cls._loop_clients, cls._loop_locks, cls._loop_refcounts):
+            for loop in [lp for lp in registry if lp.is_closed()]:
+                # A closed loop's client can no longer be closed gracefully; its
+                # sockets went away together with the loop's transports.
+                del registry[loop]
+
+    @classmethod
+    def _get_loop_lock(cls, loop: asyncio.AbstractEventLoop) -> asyncio.Lock:
+        """Get or create the lock guarding the shared client of the given loop"""
+        with cls._registry_lock:
+            cls._discard_closed_loops()
+            lock = cls._loop_locks.get(loop)
+            if lock is None:
+                lock = cls._loop_locks[loop] = asyncio.Lock()
+            return lock
+
     @classmethod
     async def get_shared_client(cls) -> httpx.AsyncClient:
-        """Get or create the shared HTTP client with connection pooling"""
-        async with cls._client_lock:
-            if cls._shared_client is None:
-                cls._shared_client = httpx.AsyncClient(
+        """Get or create the shared HTTP client of the running event loop"""
+        loop = asyncio.get_running_loop()
+        async with cls._get_loop_lock(loop):
+            client = cls._loop_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
                     limits=httpx.Limits(
-                        max_connections=100, max_keepalive_connections=20
+                        max_connections=100,
+                        max_keepalive_connections=20,
+                        keepalive_expiry=cls.KEEPALIVE_EXPIRY,
                     ),
                     timeout=httpx.Timeout(30.0),
                 )
-            return cls._shared_client
+                with cls._registry_lock:
+                    cls._loop_clients[loop] = client
+            return client
 
     @classmethod
     async def close_all_connections(cls):
-        """Close the shared client connection - call this when your application is shutting down"""
-        async with cls._client_lock:
-            if cls._shared_client is not None:
-                await cls._shared_client.aclose()
-                cls._shared_client = None
+        """Close the running loop's shared client - call this when your application is shutting down"""
+        loop = asyncio.get_running_loop()
+        async with cls._get_loop_lock(loop):
+            with cls._registry_lock:
+                client = cls._loop_clients.pop(loop, None)
+            if client is not None:
+                await client.aclose()
+
+    @classmethod
+    def close_idle_loop_connections(cls) -> None:
+        """
+        Close the shared clients of all loops from outside any running loop.
+
+        Meant for process shutdown. Clients of closed loops are discarded, clients
+        of open but idle loops are closed on their own loop, and loops still running
+        in other threads get the close scheduled thread-safely.
+        """
+        with cls._registry_lock:
+            cls._discard_closed_loops()
+            clients = list(cls._loop_clients.items())
+            for loop, _ in clients:
+                del cls._loop_clients[loop]
+        for loop, client in clients:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            else:
+                loop.run_until_complete(client.aclose())
+
+    async def warm_up(self, connections: int = 2) -> None:
+        """
+        Pre-warm the running loop's shared connection pool.
+
+        Resolves the API host once so the system resolver has it cached, then
+        issues `connections` concurrent `areaCode2` requests so that as many
+        keepalive connections sit in the pool before the first real tool call.
+
+        Args:
+            connections: Number of keepalive connections to open.
+        """
+        self._ensure_full_initialization()
+        assert self.logger is not None
+        if self._quota_saving_prefetch():
+            self.logger.info("Skipping connection warm-up to save the daily quota")
+            return
+
+        base_url = urllib.parse.urlsplit(self.BASE_URL)
+        port = base_url.port or (443 if base_url.scheme == "https" else 80)
+        addresses = await asyncio.get_running_loop().getaddrinfo(
+            base_url.hostname, port, type=socket.SOCK_STREAM
+        )
+        self.logger.info(
+            f"Resolved {base_url.hostname} to {sorted({a[4][0] for a in addresses})}"
+        )
+
+        with request_lane(BACKGROUND):
+            await asyncio.gather(
+                *(self._refresh_area_codes() for _ in range(max(connections, 1)))
+            )
+        self.logger.info(
+            f"Warmed up {connections} connection(s) to {base_url.hostname}"
+        )
+
+    async def keep_warm(self, connections: int = 2, interval: float = 60.0) -> None:
+        """
+        Keep pre-warmed connections alive until cancelled.
+
+        Every `interval` seconds without upstream traffic, `connections` concurrent
+        `areaCode2` requests are sent so the pooled connections are not expired by
+        either side. Busy periods keep the pool warm on their own and send nothing.
+
+        Args:
+            connections: Number of keepalive connections to maintain.
+            interval: Seconds of idleness before the connections are pinged.
+        """
+        self._ensure_full_initialization()
+        assert self.logger is not None
+        while True:
+            await asyncio.sleep(interval)
+            if time.monotonic() - self._last_request_time < interval:
+                continue
+            if self._quota_saving_prefetch():
+                continue
+            try:
+                with request_lane(BACKGROUND):
+                    await asyncio.gather(
+                        *(
+                            self._refresh_area_codes()
+                            for _ in range(max(connections, 1))
+                        )
+                    )
+            except (TourismApiError, httpx.HTTPError) as e:
+                self.logger.warning(f"Keep-warm request failed: {e}")
+
+    def _quota_saving_prefetch(self) -> bool:
+        """Check whether the default service's quota is too low for prefetching"""
+        assert self.service_name is not None
+        return self._quota_at_least(self.service_name, QuotaAccountant.NO_PREFETCH)
+
+    def _quota_at_least(self, service_name: str, level: str) -> bool:
+        """Check whether even the best key of a service has reached a quota level"""
+        levels = QuotaAccountant.LEVELS
+        return levels.index(self._key_pool.quota_level(service_name)) >= levels.index(
+            level
+        )
+
+    async def _refresh_area_codes(self) -> None:
+        """Fetch the top-level area codes upstream and store them in the cache."""
+        # Same parameters as the get_area_codes tool defaults, so the refreshed
+        # entry also serves that tool from the cache
+        params: Dict[str, Any] = {"numOfRows": "100", "pageNo": "1"}
+        result = await self._make_request(
+            self.AREA_CODE_LIST_ENDPOINT, params, use_cache=False
+        )
+        cache_key = self._get_cache_key(
+            self.AREA_CODE_LIST_ENDPOINT, params, self.language or "en"
+        )
+        self.cache[cache_key] = result
 
     def _process_response_error(self, response: httpx.Response):
         """Process HTTP errors and raise appropriate exceptions"""
@@ -280,7 +922,15 @@ class KoreaTourismApiClient:
                 pass
 
             # Map status code to exception type
-            if status_code >= 400 and status_code < 500:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if status_code == 429:
+                raise TourismApiRateLimitError(
+                    f"Rate limited: {error_msg}",
+                    response=response,
+                    request=request,
+                    retry_after=retry_after,
+                )
+            elif status_code >= 400 and status_code < 500:
                 # Pass response and request to the exception
                 raise TourismApiClientError(
                     f"Client error: {error_msg}", response=response, request=request
@@ -288,9 +938,18 @@ class KoreaTourismApiClient:
             else:
                 # Pass response and request to the exception
                 raise TourismApiServerError(
-                    f"Server error: {error_msg}", response=response, request=request
+                    f"Server error: {error_msg}",
+                    response=response,
+                    request=request,
+                    retry_after=retry_after,
                 )
 
+    def _request_language(self, language_override: Optional[str]) -> str:
+        """Language a request is made in: a supported override, else the default"""
+        if language_override and language_override.lower() in LANGUAGE_SERVICE_MAP:
+            return language_override.lower()
+        return self.language or "en"  # Fallback to English if None
+
     def _get_cache_key(
         self, endpoint: str, params: Dict[str, Any], language: str
     ) -> str:
@@ -309,141 +968,526 @@ class KoreaTourismApiClient:
         )
         return f"{endpoint}?{param_str}"
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type(
-            (httpx.ConnectTimeout, httpx.ConnectError, TourismApiServerError)
-        ),
-        reraise=True,
-    )
+    def _get_stale(
+        self, cache_key: str, max_age: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Last good response for a cache key, if it is at most `max_age` seconds old"""
+        entry = self._stale_cache.get(cache_key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if max_age is not None and time.monotonic() - stored_at > max_age:
+            return None
+        return response
+
+    def _log_retry(self, error: BaseException, delay: float) -> None:
+        """Log a retry scheduled by the retry policy"""
+        if self.logger:
+            self.logger.warning(f"Retrying in {delay:.2f}s after error: {error!r}")
+
     async def _make_request(
         self,
         endpoint: str,
         params: Dict[str, Any],
         use_cache: bool = True,
         language_override: Optional[str] = None,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Make a request to the API with caching, rate limiting, and language override."""
+        """
+        Make a request with caching, rate limiting, retries and language override.
+
+        With a `deadline` (absolute time.monotonic()), the caller stops waiting
+        when it passes, raising TourismApiDeadlineExceeded. Cacheable requests
+        are shared by concurrent callers and keep running as long as one of
+        them still waits; uncached ones also cut their waits for rate limit
+        tokens and concurrency slots, retries and backoff sleeps short once the
+        deadline cannot be met.
+        """
         # Ensure all initialization is completed
         self._ensure_full_initialization()
-        # After initialization, these are guaranteed to be not None
-        assert self._request_semaphore is not None
 
         # Determine the language and base URL for this specific request
-        request_language = self.language or "en"  # Fallback to English if None
-        if language_override:
-            lang_lower = language_override.lower()
-            if lang_lower in LANGUAGE_SERVICE_MAP:
-                request_language = lang_lower
-
-        request_service_name = LANGUAGE_SERVICE_MAP[request_language]
-        request_full_base_url = f"{self.BASE_URL}/{request_service_name}"
+        request_language = self._request_language(language_override)
 
         # Check cache first if caching is enabled, using the request-specific language
+        cache_key = self._get_cache_key(endpoint, params, request_language)
         if use_cache:
-            cache_key = self._get_cache_key(endpoint, params, request_language)
+            # Lets a memoized tool result expire together with this response
+            note_cache_key(cache_key)
             cached_response = self.cache.get(cache_key)
             if cached_response:
                 return cached_response
 
-        # Apply rate limiting dynamically here using instance attributes
-        @sleep_and_retry
-        @limits(calls=self._rate_limit_calls, period=self._rate_limit_period)
-        async def rate_limited_request() -> Dict[str, Any]:
-            # Use concurrency semaphore to limit simultaneous requests
-            semaphore = self._request_semaphore
-            assert semaphore is not None, "Semaphore should be initialized"
-            async with semaphore:
-                # Add common parameters using constants
-                full_params = {
-                    "MobileOS": self.MOBILE_OS,
-                    "MobileApp": self.MOBILE_APP,
-                    # Defaults like numOfRows/pageNo are better set by calling methods or API defaults
-                    "_type": self.RESPONSE_FORMAT,
-                    **params,
-                }
-
-                # API key handling remains the same for now
-                serviceKey = (
-                    self.api_key
-                )  # Already validated in _ensure_full_initialization
-
-                # Build the full URL with the determined service for this request
-                url = f"{request_full_base_url}{endpoint}"
-
-                client = await self.get_shared_client()
-
-                # First, encode the parameters
-                encoded_params = urllib.parse.urlencode(full_params)
-
-                # Then append the already-encoded service key
-                full_url = f"{url}?serviceKey={serviceKey}&{encoded_params}"
-                response = await client.get(full_url)
-
-                self._process_response_error(response)
-
-                # Parse the response with better error handling
-                try:
-                    # Check if the response has content
-                    if not response.content or len(response.content.strip()) == 0:
-                        raise TourismApiError(
-                            "Empty response received from tourism API"
-                        )
+        # Save the daily quota as it runs low: keep serving expired responses
+        # for longer, and once it is nearly used up, serve cached data only
+        service_name = LANGUAGE_SERVICE_MAP[request_language]
+        quota_level = self._key_pool.quota_level(service_name)
+        if use_cache and quota_level != QuotaAccountant.NORMAL:
+            max_age = (
+                None
+                if quota_level == QuotaAccountant.CACHE_ONLY
+                else self._cache_ttl * self.QUOTA_CACHE_TTL_FACTOR
+            )
+            stale_response = self._get_stale(cache_key, max_age)
+            if stale_response is not None:
+                return stale_response
+        if quota_level == QuotaAccountant.CACHE_ONLY:
+            raise TourismApiQuotaExceededError(
+                f"Daily quota of {service_name} is nearly used up and "
+                f"{endpoint} is not cached"
+            )
 
-                    result = response.json()
-                except json.JSONDecodeError as e:
-                    raise TourismApiError(f"Invalid JSON response: {str(e)}")
+        if deadline is not None and deadline <= time.monotonic():
+            raise TourismApiDeadlineExceeded(
+                f"Deadline passed before requesting {endpoint}"
+            )
 
-                # Extract the items from the nested response structure
-                try:
-                    response_header = result["response"]["header"]
-                    response_body = result["response"]["body"]
+        # Under overload, bulk and background work is turned away first. New
+        # tool calls are rejected by the server before they get this far.
+        lane = current_lane()
+        if lane != INTERACTIVE and self.should_shed(lane):
+            raise TourismApiOverloadedError(
+                f"Server is overloaded, {lane} request to {endpoint} was shed"
+            )
 
-                    result_code = response_header.get("resultCode")
-                    if result_code != "0000":
-                        raise TourismApiError(
-                            f"API error: {response_header.get('resultMsg', 'Unknown error')}"
-                        )
+        if not use_cache:
+            return await self._fetch(
+                endpoint, params, request_language, cache_key, use_cache, deadline
+            )
+        # Concurrent requests for the same response share one upstream call.
+        # The shared call has no deadline of its own, since its callers may
+        # have different ones: each caller bounds its own wait below, and the
+        # call is cancelled once every caller has given up.
+        flight = self._get_single_flight().do(
+            cache_key,
+            lambda: self._fetch(
+                endpoint, params, request_language, cache_key, use_cache
+            ),
+        )
+        if deadline is None:
+            return await flight
+        try:
+            async with asyncio.timeout(deadline - time.monotonic()):
+                return await flight
+        except TimeoutError as e:
+            raise TourismApiDeadlineExceeded(
+                f"Deadline exceeded while requesting {endpoint}"
+            ) from e
+
+    async def _count(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        language: Optional[str],
+        deadline: Optional[float],
+    ) -> Dict[str, Any]:
+        """
+        Total count of a list, from a request for a single row.
 
-                    total_count = response_body.get("totalCount", 0)
-                    items = []
-
-                    if total_count > 0:
-                        items_container = response_body.get("items", {})
-                        if "item" in items_container:
-                            items = items_container["item"]
-                            if not isinstance(items, list):
-                                items = [
-                                    items
-                                ]  # Ensure items is a list even if there's only one result
-
-                    # Structure the results
-                    result_data = {
-                        "total_count": total_count,
-                        "num_of_rows": response_body.get("numOfRows", 0),
-                        "page_no": response_body.get("pageNo", 1),
-                        "items": items,
-                    }
+        Counts are cached for count_cache_ttl, apart from the responses, so
+        they outlive the response cache and its evictions.
+        """
+        self._ensure_full_initialization()
+        params = {**params, "pageNo": "1", "numOfRows": "1"}
+        count_key = self._get_cache_key(
+            endpoint, params, self._request_language(language)
+        )
+        total_count = self._count_cache.get(count_key)
+        if total_count is None:
+            response = await self._make_request(
+                endpoint, params, language_override=language, deadline=deadline
+            )
+            total_count = response.get("total_count", 0)
+            self._count_cache[count_key] = total_count
+        return {"total_count": total_count}
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        request_language: str,
+        cache_key: str,
+        use_cache: bool,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Request a response from upstream, retrying failed attempts until the deadline."""
+        self._retry_policy.budget.record_request()
+        attempts = self._retry_policy.retrying(deadline)(
+            self._attempt_request,
+            endpoint,
+            params,
+            request_language,
+            cache_key,
+            use_cache,
+            deadline,
+        )
+        if deadline is None:
+            return await attempts
+        try:
+            async with asyncio.timeout(deadline - time.monotonic()):
+                return await attempts
+        except TimeoutError as e:
+            raise TourismApiDeadlineExceeded(
+                f"Deadline exceeded while requesting {endpoint}"
+            ) from e
+
+    async def _attempt_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        request_language: str,
+        cache_key: str,
+        use_cache: bool,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Make one attempt of a request, moving on to the next key if one is rejected."""
+        service_name = LANGUAGE_SERVICE_MAP[request_language]
+        while True:
+            try:
+                return await self._attempt_with_key(
+                    endpoint, params, request_language, cache_key, use_cache, deadline
+                )
+            except TourismApiKeyError:
+                # The rejected key is out of rotation now; try the others at once
+                if not self._key_pool.usable_keys(service_name):
+                    raise
+
+    async def _attempt_with_key(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        request_language: str,
+        cache_key: str,
+        use_cache: bool,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Send a request with the next key, guarded by the breaker and limiters."""
+        service_name = LANGUAGE_SERVICE_MAP[request_language]
+        # Fail fast while the endpoint's breaker is open, rather than tying up
+        # concurrency slots and retries on an upstream that keeps failing
+        breaker = self._get_circuit_breaker(endpoint, request_language)
+        if not breaker.allow_request():
+            stale_response = self._get_stale(cache_key) if use_cache else None
+            if stale_response is not None:
+                assert self.logger is not None
+                self.logger.warning(
+                    f"Circuit open for {endpoint}, serving stale cached response"
+                )
+                return stale_response
+            raise TourismApiCircuitOpenError(
+                f"Circuit open for {LANGUAGE_SERVICE_MAP[request_language]}{endpoint}: "
+                f"upstream is failing, retry in {breaker.retry_after:.0f}s"
+            )
 
-                    # Apply unicode decoding to handle Korean character encoding issues
-                    result_data = decode_unicode_escapes(result_data)
+        # Wait for a rate limit token of a key, then for a slot of the adaptive
+        # concurrency limiter that caps simultaneous requests. Both favour
+        # interactive requests over background and bulk ones.
+        lane = current_lane()
+        limiter = self._get_concurrency_limiter()
+        try:
+            # Give up right away if the next token is due after the deadline
+            timeout = None if deadline is None else deadline - time.monotonic()
+            api_key = await self._key_pool.acquire(
+                service_name,
+                timeout=timeout,
+                reserve_share=0.0
+                if lane == INTERACTIVE
+                else self.INTERACTIVE_TOKEN_RESERVE,
+            )
+            if api_key is None:
+                if not self._key_pool.usable_keys(service_name):
+                    raise TourismApiQuotaExceededError(
+                        f"No API key has quota left for {service_name}"
+                    )
+                raise TourismApiDeadlineExceeded(
+                    f"Rate limit allows no request to {endpoint} before the deadline"
+                )
+            await limiter.acquire(lane)
+        except BaseException:
+            breaker.release()
+            raise
+        started = time.monotonic()
+        try:
+            if self._hedge_requests:
+                result_data = await self._send_hedged_request(
+                    endpoint, params, request_language, api_key
+                )
+            else:
+                result_data = await self._send_request(
+                    endpoint, params, request_language, api_key
+                )
+        except TourismApiRateLimitError:
+            # Being throttled says nothing about the endpoint's health
+            limiter.release(dropped=True)
+            breaker.release()
+            raise
+        except (httpx.TimeoutException, TourismApiServerError):
+            # Upstream is struggling; shrink the concurrency limit
+            limiter.release(dropped=True)
+            breaker.record_failure()
+            raise
+        except httpx.TransportError:
+            limiter.release()
+            breaker.record_failure()
+            raise
+        except BaseException:
+            limiter.release()
+            breaker.release()
+            raise
+        limiter.release(latency=time.monotonic() - started)
+        breaker.record_success()
+
+        # Cache the response if caching is enabled, using the request-specific language
+        if use_cache:
+            self.cache[cache_key] = result_data
+            self._stale_cache[cache_key] = (time.monotonic(), result_data)
 
-                    # Cache the response if caching is enabled, using the request-specific language
-                    if use_cache:
-                        cache_key = self._get_cache_key(
-                            endpoint, params, request_language
+        return result_data
+
+    def _hedge_delay(self, key: tuple[str, str]) -> Optional[float]:
+        """90th percentile latency of an endpoint, None until enough samples exist"""
+        samples = self._endpoint_latencies.get(key)
+        if not samples or len(samples) < self.HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        return ordered[int(len(ordered) * 0.9)]
+
+    async def _send_hedged_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        request_language: str,
+        api_key: str,
+    ) -> Dict[str, Any]:
+        """
+        Send a request and hedge it with a second copy if it is slow to answer.
+
+        The hedge is only sent when the hedge budget, the rate limiter of some
+        key and the concurrency limiter all allow it without waiting. The first
+        successful response wins and the other request is cancelled; if both
+        fail, the error of the original request is raised.
+        """
+        key = (LANGUAGE_SERVICE_MAP[request_language], endpoint)
+        self._hedge_budget.record_request()
+        # Hedges are extra calls the daily quota may not be able to afford
+        may_hedge = not self._quota_at_least(key[0], QuotaAccountant.NO_PREFETCH)
+        primary = asyncio.ensure_future(
+            self._send_timed_request(endpoint, params, request_language, api_key)
+        )
+        pending = {primary}
+        try:
+            delay = self._hedge_delay(key) if may_hedge else None
+            if delay is not None:
+                done, _ = await asyncio.wait(pending, timeout=delay)
+                hedge_key = None if done else self._try_start_hedge(key[0])
+                if hedge_key is not None:
+                    pending.add(
+                        asyncio.ensure_future(
+                            self._send_hedge(
+                                endpoint, params, request_language, hedge_key
+                            )
                         )
-                        self.cache[cache_key] = result_data
+                    )
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not primary:
+                            self._hedges_won += 1
+                        return task.result()
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def _try_start_hedge(self, service_name: str) -> Optional[str]:
+        """
+        Reserve budget, a rate limit token and a concurrency slot for a hedge.
 
-                    return result_data
+        Returns:
+            The key the hedge is sent with, or None if it cannot be sent now.
+        """
+        if self._hedge_budget.available <= 0:
+            return None
+        api_key = self._key_pool.try_acquire(service_name)
+        if api_key is None:
+            return None
+        if not self._get_concurrency_limiter().try_acquire(current_lane()):
+            self._key_pool.bucket(api_key).refund()
+            return None
+        self._hedge_budget.try_spend()
+        self._hedges_sent += 1
+        return api_key
+
+    async def _send_hedge(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        request_language: str,
+        api_key: str,
+    ) -> Dict[str, Any]:
+        """Send a hedged copy of a request, holding the slot reserved for it"""
+        try:
+            return await self._send_timed_request(
+                endpoint, params, request_language, api_key
+            )
+        finally:
+            self._get_concurrency_limiter().release()
 
-                except (KeyError, TypeError) as e:
-                    raise TourismApiError(f"Failed to parse API response: {e}")
+    async def _send_timed_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        request_language: str,
+        api_key: str,
+    ) -> Dict[str, Any]:
+        """Send a request and record its latency for the hedging threshold."""
+        started = time.monotonic()
+        result = await self._send_request(endpoint, params, request_language, api_key)
+        key = (LANGUAGE_SERVICE_MAP[request_language], endpoint)
+        samples = self._endpoint_latencies.get(key)
+        if samples is None:
+            samples = self._endpoint_latencies[key] = deque(maxlen=100)
+        samples.append(time.monotonic() - started)
+        return result
+
+    async def _send_request(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        request_language: str,
+        api_key: str,
+    ) -> Dict[str, Any]:
+        """
+        Send a single request upstream with a key and parse the response body.
+
+        A 429 response pauses the key's rate limiter for as long as upstream
+        asks, and a rejected key is taken out of rotation for the service.
+        """
+        request_service_name = LANGUAGE_SERVICE_MAP[request_language]
+        request_full_base_url = f"{self.BASE_URL}/{request_service_name}"
+
+        # Add common parameters using constants
+        full_params = {
+            "MobileOS": self.MOBILE_OS,
+            "MobileApp": self.MOBILE_APP,
+            # Defaults like numOfRows/pageNo are better set by calling methods or API defaults
+            "_type": self.RESPONSE_FORMAT,
+            **params,
+        }
+
+        # The primary key was validated in _ensure_full_initialization
+        serviceKey = api_key
 
-        # Call the inner function that has the decorators applied
-        result = rate_limited_request()
-        return await result  # type: ignore[misc]
+        # Build the full URL with the determined service for this request
+        url = f"{request_full_base_url}{endpoint}"
+
+        client = await self.get_shared_client()
+        self._last_request_time = time.monotonic()
+        self._quota.record(request_service_name, serviceKey)
+
+        # First, encode the parameters
+        encoded_params = urllib.parse.urlencode(full_params)
+
+        # Then append the already-encoded service key
+        full_url = f"{url}?serviceKey={serviceKey}&{encoded_params}"
+        response = await client.get(full_url)
+
+        try:
+            self._process_response_error(response)
+        except TourismApiRateLimitError as e:
+            # Back-pressure: hold this key's callers off as long as upstream asks
+            bucket = self._key_pool.bucket(api_key)
+            bucket.pause(
+                e.retry_after
+                if e.retry_after is not None
+                else bucket.capacity / bucket.rate
+            )
+            raise
+
+        # Parse the response with better error handling
+        try:
+            # Check if the response has content
+            if not response.content or len(response.content.strip()) == 0:
+                raise TourismApiError("Empty response received from tourism API")
+
+            result = response.json()
+        except json.JSONDecodeError as e:
+            # Key errors come back as XML regardless of the requested format
+            reason = re.search(
+                r"<returnReasonCode>\s*(\d+)\s*</returnReasonCode>", response.text
+            )
+            if reason:
+                self._check_key_error(
+                    reason.group(1),
+                    "Service key rejected",
+                    api_key,
+                    request_service_name,
+                )
+            raise TourismApiError(f"Invalid JSON response: {str(e)}")
+
+        # Extract the items from the nested response structure
+        try:
+            response_header = result["response"]["header"]
+
+            result_code = response_header.get("resultCode")
+            if result_code != "0000":
+                self._check_key_error(
+                    str(result_code),
+                    response_header.get("resultMsg", "Unknown error"),
+                    api_key,
+                    request_service_name,
+                )
+                raise TourismApiError(
+                    f"API error: {response_header.get('resultMsg', 'Unknown error')}"
+                )
+
+            # Error responses come without a body
+            response_body = result["response"]["body"]
+            total_count = response_body.get("totalCount", 0)
+            items = []
+
+            if total_count > 0:
+                items_container = response_body.get("items", {})
+                if "item" in items_container:
+                    items = items_container["item"]
+                    if not isinstance(items, list):
+                        items = [
+                            items
+                        ]  # Ensure items is a list even if there's only one result
+
+            # Structure the results
+            result_data = {
+                "total_count": total_count,
+                "num_of_rows": response_body.get("numOfRows", 0),
+                "page_no": response_body.get("pageNo", 1),
+                "items": items,
+            }
+
+            # Apply unicode decoding to handle Korean character encoding issues
+            return decode_unicode_escapes(result_data)
+
+        except (KeyError, TypeError) as e:
+            raise TourismApiError(f"Failed to parse API response: {e}")
+
+    def _check_key_error(
+        self, result_code: str, message: str, api_key: str, service_name: str
+    ) -> None:
+        """Take a key out of rotation and raise if a result code rejects it"""
+        code = result_code.lstrip("0") or "0"
+        if code not in self.KEY_ERROR_CODES:
+            return
+        self._key_pool.disable(api_key, service_name, code)
+        assert self.logger is not None
+        self.logger.warning(
+            f"API key {key_fingerprint(api_key)} rejected by {service_name} "
+            f"(code {code}: {message}), disabled until the daily reset"
+        )
+        raise TourismApiKeyError(f"API key rejected: {message}", result_code=code)
 
     async def search_by_keyword(
         self,
@@ -457,6 +1501,9 @@ class KoreaTourismApiClient:
         language: Optional[str] = None,
         page: int = 1,
         rows: int = 20,
+        deadline: Optional[float] = None,
+        count_only: bool = False,
+        languages: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Search tourism information by keyword.
@@ -473,6 +1520,11 @@ class KoreaTourismApiClient:
             language: Override the client's default language
             page: Page number for pagination
             rows: Number of items per page
+            deadline: Absolute time.monotonic() after which the request is abandoned
+            count_only: Return only {"total_count": int}, see `_count`
+            languages: Query these language services concurrently instead of
+                `language`; the result then has the structure of `for_languages`,
+                with the items joined by content ID.
 
         Returns:
             Dictionary containing search results with structure:
@@ -506,6 +1558,24 @@ class KoreaTourismApiClient:
                 ]
             }
         """
+        if languages:
+            return await self.for_languages(
+                languages,
+                lambda lang: self.search_by_keyword(
+                    keyword=keyword,
+                    content_type_id=content_type_id,
+                    area_code=area_code,
+                    sigungu_code=sigungu_code,
+                    cat1=cat1,
+                    cat2=cat2,
+                    cat3=cat3,
+                    language=lang,
+                    page=page,
+                    rows=rows,
+                    deadline=deadline,
+                    count_only=count_only,
+                ),
+            )
         if not keyword:
             raise ValueError("Keyword must be provided for search_by_keyword")
 
@@ -534,9 +1604,17 @@ class KoreaTourismApiClient:
                 if cat3:
                     params["cat3"] = cat3
 
+        if count_only:
+            return await self._count(
+                self.SEARCH_KEYWORD_ENDPOINT, params, language, deadline
+            )
+
         # Pass language override directly to _make_request
         return await self._make_request(
-            self.SEARCH_KEYWORD_ENDPOINT, params, language_override=language
+            self.SEARCH_KEYWORD_ENDPOINT,
+            params,
+            language_override=language,
+            deadline=deadline,
         )
 
     async def get_area_based_list(
@@ -550,6 +1628,10 @@ class KoreaTourismApiClient:
         language: Optional[str] = None,
         page: int = 1,
         rows: int = 20,
+        deadline: Optional[float] = None,
+        arrange: Optional[str] = None,
+        count_only: bool = False,
+        languages: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Get a list of tourism information by area.
@@ -564,6 +1646,12 @@ class KoreaTourismApiClient:
             page: Page number for pagination
             rows: Number of items per page
             sigunguCode: Sigungu code to filter results, areaCode is required
+            deadline: Absolute time.monotonic() after which the request is abandoned
+            arrange: Sort order, see SORT_ARRANGE (default: by modified date)
+            count_only: Return only {"total_count": int}, see `_count`
+            languages: Query these language services concurrently instead of
+                `language`; the result then has the structure of `for_languages`,
+                with the items joined by content ID.
         Returns:
             Dictionary containing area-based tourism information with structure:
             {
@@ -596,8 +1684,26 @@ class KoreaTourismApiClient:
                 ]
             }
         """
+        if languages:
+            return await self.for_languages(
+                languages,
+                lambda lang: self.get_area_based_list(
+                    area_code=area_code,
+                    content_type_id=content_type_id,
+                    sigunguCode=sigunguCode,
+                    cat1=cat1,
+                    cat2=cat2,
+                    cat3=cat3,
+                    language=lang,
+                    page=page,
+                    rows=rows,
+                    deadline=deadline,
+                    arrange=arrange,
+                    count_only=count_only,
+                ),
+            )
         params: Dict[str, Any] = {
-            "arrange": self.ARRANGE_MODIFIED_WITH_IMAGE,
+            "arrange": arrange or self.ARRANGE_MODIFIED_WITH_IMAGE,
             "pageNo": str(page),
             "numOfRows": str(rows),
             # "_type": self.RESPONSE_FORMAT, # Added in _make_request
@@ -622,9 +1728,17 @@ class KoreaTourismApiClient:
                 if cat3:
                     params["cat3"] = cat3
 
+        if count_only:
+            return await self._count(
+                self.AREA_BASED_LIST_ENDPOINT, params, language, deadline
+            )
+
         # Pass language override directly to _make_request
         return await self._make_request(
-            self.AREA_BASED_LIST_ENDPOINT, params, language_override=language
+            self.AREA_BASED_LIST_ENDPOINT,
+            params,
+            language_override=language,
+            deadline=deadline,
         )
 
     async def get_location_based_list(
@@ -636,6 +1750,9 @@ class KoreaTourismApiClient:
         language: Optional[str] = None,
         page: int = 1,
         rows: int = 20,
+        deadline: Optional[float] = None,
+        arrange: Optional[str] = None,
+        languages: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Get a list of tourism information by location.
@@ -648,6 +1765,12 @@ class KoreaTourismApiClient:
             language: Override the client's default language
             page: Page number for pagination
             rows: Number of items per page
+            deadline: Absolute time.monotonic() after which the request is abandoned
+            arrange: Sort order (default: by modified date), or
+                ARRANGE_DISTANCE_WITH_IMAGE for the nearest items first
+            languages: Query these language services concurrently instead of
+                `language`; the result then has the structure of `for_languages`,
+                with the items joined by content ID.
 
         Returns:
             Dictionary containing location-based tourism information with structure:
@@ -681,6 +1804,21 @@ class KoreaTourismApiClient:
                 ]
             }
         """
+        if languages:
+            return await self.for_languages(
+                languages,
+                lambda lang: self.get_location_based_list(
+                    mapx=mapx,
+                    mapy=mapy,
+                    radius=radius,
+                    content_type_id=content_type_id,
+                    language=lang,
+                    page=page,
+                    rows=rows,
+                    deadline=deadline,
+                    arrange=arrange,
+                ),
+            )
         # Parameter validation
         if mapx is None or mapy is None or radius is None:
             raise ValueError(
@@ -697,7 +1835,7 @@ class KoreaTourismApiClient:
         params: Dict[str, Any] = {
             "pageNo": str(page),
             "numOfRows": str(rows),
-            "arrange": self.ARRANGE_MODIFIED_WITH_IMAGE,
+            "arrange": arrange or self.ARRANGE_MODIFIED_WITH_IMAGE,
             "mapX": str(mapx),
             "mapY": str(mapy),
             "radius": str(radius_int),
@@ -707,8 +1845,58 @@ class KoreaTourismApiClient:
             params["contentTypeId"] = content_type_id
 
         # Pass language override directly to _make_request
-        return await self._make_request(
-            self.LOCATION_BASED_LIST_ENDPOINT, params, language_override=language
+        response = await self._make_request(
+            self.LOCATION_BASED_LIST_ENDPOINT,
+            params,
+            language_override=language,
+            deadline=deadline,
+        )
+        if page == 1:
+            self._note_coverage(
+                (float(mapx), float(mapy)),
+                radius_int,
+                content_type_id,
+                language,
+                params["arrange"],
+                response,
+            )
+        return response
+
+    def _coverage_scope(
+        self, content_type_id: Optional[str], language: Optional[str]
+    ) -> tuple[str, Optional[str]]:
+        """Language and content type that location-based items were found for"""
+        return self._request_language(language), content_type_id or None
+
+    def _note_coverage(
+        self,
+        center: Point,
+        radius: int,
+        content_type_id: Optional[str],
+        language: Optional[str],
+        arrange: str,
+        response: Dict[str, Any],
+    ) -> None:
+        """Record the circle a first page of location-based items is complete for"""
+        if arrange not in (
+            self.ARRANGE_MODIFIED_WITH_IMAGE,
+            self.ARRANGE_DISTANCE_WITH_IMAGE,
+        ):
+            # Other orders include items without images, a different set
+            return
+        items = response.get("items", [])
+        if response.get("total_count", 0) <= len(items):
+            covered = float(radius)
+        elif arrange == self.ARRANGE_DISTANCE_WITH_IMAGE and items:
+            # The nearest items are complete up to the farthest of them
+            last = item_point(items[-1])
+            if last is None:
+                return
+            covered = haversine_m(center, last)
+        else:
+            return
+        self._coverage.add(
+            self._coverage_scope(content_type_id, language), center, covered, items
         )
 
     async def search_festival(
@@ -720,6 +1908,8 @@ class KoreaTourismApiClient:
         language: Optional[str] = None,
         page: int = 1,
         rows: int = 20,
+        deadline: Optional[float] = None,
+        languages: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Search for festivals by date and location.
@@ -732,6 +1922,10 @@ class KoreaTourismApiClient:
             language: Override the client's default language
             page: Page number for pagination
             rows: Number of items per page
+            deadline: Absolute time.monotonic() after which the request is abandoned
+            languages: Query these language services concurrently instead of
+                `language`; the result then has the structure of `for_languages`,
+                with the items joined by content ID.
 
         Returns:
             Dictionary containing festival information with structure:
@@ -764,6 +1958,20 @@ class KoreaTourismApiClient:
                 ]
             }
         """
+        if languages:
+            return await self.for_languages(
+                languages,
+                lambda lang: self.search_festival(
+                    event_start_date=event_start_date,
+                    event_end_date=event_end_date,
+                    area_code=area_code,
+                    sigungu_code=sigungu_code,
+                    language=lang,
+                    page=page,
+                    rows=rows,
+                    deadline=deadline,
+                ),
+            )
         if not event_start_date:
             raise ValueError("event_start_date (YYYYMMDD) is required")
         # Basic format check (can be improved with regex)
@@ -798,7 +2006,10 @@ class KoreaTourismApiClient:
 
         # Pass language override directly to _make_request
         return await self._make_request(
-            self.SEARCH_FESTIVAL_ENDPOINT, params, language_override=language
+            self.SEARCH_FESTIVAL_ENDPOINT,
+            params,
+            language_override=language,
+            deadline=deadline,
         )
 
     async def search_stay(
@@ -808,6 +2019,10 @@ class KoreaTourismApiClient:
         rows: int = 20,
         page: int = 1,
         language: Optional[str] = None,
+        deadline: Optional[float] = None,
+        arrange: Optional[str] = None,
+        count_only: bool = False,
+        languages: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Search for stays by area and sigungu.
@@ -818,6 +2033,12 @@ class KoreaTourismApiClient:
             rows: Number of items per page
             page: Page number for pagination
             language: Override the client's default language
+            deadline: Absolute time.monotonic() after which the request is abandoned
+            arrange: Sort order, see SORT_ARRANGE (default: by modified date)
+            count_only: Return only {"total_count": int}, see `_count`
+            languages: Query these language services concurrently instead of
+                `language`; the result then has the structure of `for_languages`,
+                with the items joined by content ID.
 
         Returns:
             Dictionary containing accommodation information with structure:
@@ -852,10 +2073,24 @@ class KoreaTourismApiClient:
                 ]
             }
         """
+        if languages:
+            return await self.for_languages(
+                languages,
+                lambda lang: self.search_stay(
+                    area_code=area_code,
+                    sigungu_code=sigungu_code,
+                    rows=rows,
+                    page=page,
+                    language=lang,
+                    deadline=deadline,
+                    arrange=arrange,
+                    count_only=count_only,
+                ),
+            )
         params: Dict[str, Any] = {
             "pageNo": str(page),
             "numOfRows": str(rows),
-            "arrange": self.ARRANGE_MODIFIED_WITH_IMAGE,  # Default arrange added
+            "arrange": arrange or self.ARRANGE_MODIFIED_WITH_IMAGE,
         }
 
         if area_code:
@@ -864,9 +2099,17 @@ class KoreaTourismApiClient:
             if sigungu_code:
                 params["sigunguCode"] = sigungu_code
 
+        if count_only:
+            return await self._count(
+                self.SEARCH_STAY_ENDPOINT, params, language, deadline
+            )
+
         # Pass language override directly to _make_request
         return await self._make_request(
-            self.SEARCH_STAY_ENDPOINT, params, language_override=language
+            self.SEARCH_STAY_ENDPOINT,
+            params,
+            language_override=language,
+            deadline=deadline,
         )
 
     async def get_detail_common(
@@ -875,6 +2118,8 @@ class KoreaTourismApiClient:
         language: Optional[str] = None,
         rows: int = 20,
         page: int = 1,
+        deadline: Optional[float] = None,
+        languages: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Get common information by type basic information, schematic image,
@@ -887,6 +2132,10 @@ class KoreaTourismApiClient:
             language: Override the client's default language
             rows: Number of items per page
             page: Page number for pagination
+            deadline: Absolute time.monotonic() after which the request is abandoned
+            languages: Query these language services concurrently instead of
+                `language`; the result then has the structure of `for_languages`,
+                with the items joined by content ID.
 
         Returns:
             Dictionary containing common details about a tourism item with structure:
@@ -922,6 +2171,17 @@ class KoreaTourismApiClient:
                 ]
             }
         """
+        if languages:
+            return await self.for_languages(
+                languages,
+                lambda lang: self.get_detail_common(
+                    content_id=content_id,
+                    language=lang,
+                    rows=rows,
+                    page=page,
+                    deadline=deadline,
+                ),
+            )
         if not content_id:
             raise ValueError("content_id is required")
 
@@ -933,7 +2193,10 @@ class KoreaTourismApiClient:
 
         # Pass language override directly to _make_request
         return await self._make_request(
-            self.DETAIL_COMMON_ENDPOINT, params, language_override=language
+            self.DETAIL_COMMON_ENDPOINT,
+            params,
+            language_override=language,
+            deadline=deadline,
         )
 
     async def get_detail_images(
@@ -942,6 +2205,8 @@ class KoreaTourismApiClient:
         language: Optional[str] = None,
         rows: int = 20,
         page: int = 1,
+        deadline: Optional[float] = None,
+        languages: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Get images for a tourism item.
@@ -951,6 +2216,10 @@ class KoreaTourismApiClient:
             language: Override the client's default language
             rows: Number of items per page
             page: Page number for pagination
+            deadline: Absolute time.monotonic() after which the request is abandoned
+            languages: Query these language services concurrently instead of
+                `language`; the result then has the structure of `for_languages`,
+                with the items joined by content ID.
 
         Returns:
             Dictionary containing images for a tourism item with structure:
@@ -971,6 +2240,17 @@ class KoreaTourismApiClient:
                 ]
             }
         """
+        if languages:
+            return await self.for_languages(
+                languages,
+                lambda lang: self.get_detail_images(
+                    content_id=content_id,
+                    language=lang,
+                    rows=rows,
+                    page=page,
+                    deadline=deadline,
+                ),
+            )
         if not content_id:
             raise ValueError("content_id is required")
 
@@ -982,7 +2262,10 @@ class KoreaTourismApiClient:
 
         # Pass language override directly to _make_request
         return await self._make_request(
-            self.DETAIL_IMAGE_ENDPOINT, params, language_override=language
+            self.DETAIL_IMAGE_ENDPOINT,
+            params,
+            language_override=language,
+            deadline=deadline,
         )
 
     async def get_detail_intro(
@@ -992,6 +2275,8 @@ class KoreaTourismApiClient:
         language: Optional[str] = None,
         rows: int = 20,
         page: int = 1,
+        deadline: Optional[float] = None,
+        languages: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Function to check detailed introduction (off day, opening period, etc.)
@@ -1002,6 +2287,10 @@ class KoreaTourismApiClient:
             language: Override the client's default language
             rows: Number of items per page
             page: Page number for pagination
+            deadline: Absolute time.monotonic() after which the request is abandoned
+            languages: Query these language services concurrently instead of
+                `language`; the result then has the structure of `for_languages`,
+                with the items joined by content ID.
 
         Returns:
             Dictionary containing detailed introduction information with structure:
@@ -1052,6 +2341,18 @@ class KoreaTourismApiClient:
 
             Note: The actual fields returned depend on the content_type_id and will vary between different types of tourism items.
         """
+        if languages:
+            return await self.for_languages(
+                languages,
+                lambda lang: self.get_detail_intro(
+                    content_id=content_id,
+                    content_type_id=content_type_id,
+                    language=lang,
+                    rows=rows,
+                    page=page,
+                    deadline=deadline,
+                ),
+            )
         if not content_id:
             raise ValueError("content_id is required")
         if not content_type_id:
@@ -1065,7 +2366,10 @@ class KoreaTourismApiClient:
 
         # Pass language override directly to _make_request
         return await self._make_request(
-            self.DETAIL_INTRO_ENDPOINT, params, language_override=language
+            self.DETAIL_INTRO_ENDPOINT,
+            params,
+            language_override=language,
+            deadline=deadline,
         )
 
     async def get_detail_info(
@@ -1075,6 +2379,8 @@ class KoreaTourismApiClient:
         language: Optional[str] = None,
         rows: int = 20,
         page: int = 1,
+        deadline: Optional[float] = None,
+        languages: Optional[Sequence[str]] = None,
     ) -> Dict[str, Any]:
         """
         Check the details of additional tourism information.
@@ -1085,6 +2391,10 @@ class KoreaTourismApiClient:
             language: Override the client's default language
             rows: Number of items per page
             page: Page number for pagination
+            deadline: Absolute time.monotonic() after which the request is abandoned
+            languages: Query these language services concurrently instead of
+                `language`; the result then has the structure of `for_languages`,
+                with the items joined by content ID.
 
         Returns:
             Dictionary containing additional detailed information with structure:
@@ -1107,6 +2417,18 @@ class KoreaTourismApiClient:
 
             Note: Each item in the 'items' list represents a specific piece of additional information about the tourism item.
         """
+        if languages:
+            return await self.for_languages(
+                languages,
+                lambda lang: self.get_detail_info(
+                    content_id=content_id,
+                    content_type_id=content_type_id,
+                    language=lang,
+                    rows=rows,
+                    page=page,
+                    deadline=deadline,
+                ),
+            )
         if not content_id:
             raise ValueError("content_id is required")
         if not content_type_id:
@@ -1121,7 +2443,10 @@ class KoreaTourismApiClient:
 
         # Pass language override directly to _make_request
         return await self._make_request(
-            self.DETAIL_INFO_ENDPOINT, params, language_override=language
+            self.DETAIL_INFO_ENDPOINT,
+            params,
+            language_override=language,
+            deadline=deadline,
         )
 
     async def get_area_based_sync_list(
@@ -1136,6 +2461,7 @@ class KoreaTourismApiClient:
         show_flag: Optional[Literal["0", "1"]] = None,
         rows: int = 20,
         page: int = 1,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Detailed function of inquiring about the tourism information synchronization list (provided whether the contents are displayed or not)
@@ -1151,6 +2477,7 @@ class KoreaTourismApiClient:
             show_flag: Show flag from the tourism API
             rows: Number of items per page
             page: Page number for pagination
+            deadline: Absolute time.monotonic() after which the request is abandoned
 
         Returns:
             Dictionary containing synchronized tourism information with structure:
@@ -1212,7 +2539,10 @@ class KoreaTourismApiClient:
 
         # Pass language override directly to _make_request
         return await self._make_request(
-            self.AREA_BASED_SYNC_LIST_ENDPOINT, params, language_override=language
+            self.AREA_BASED_SYNC_LIST_ENDPOINT,
+            params,
+            language_override=language,
+            deadline=deadline,
         )
 
     async def get_area_code_list(
@@ -1221,6 +2551,7 @@ class KoreaTourismApiClient:
         language: Optional[str] = None,
         rows: int = 20,
         page: int = 1,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Get the list of area codes.
@@ -1230,6 +2561,7 @@ class KoreaTourismApiClient:
             language: Override the client's default language
             rows: Number of items per page
             page: Page number for pagination
+            deadline: Absolute time.monotonic() after which the request is abandoned
 
         Returns:
             Dictionary containing area code information with structure:
@@ -1259,7 +2591,10 @@ class KoreaTourismApiClient:
 
         # Pass language override directly to _make_request
         return await self._make_request(
-            self.AREA_CODE_LIST_ENDPOINT, params, language_override=language
+            self.AREA_CODE_LIST_ENDPOINT,
+            params,
+            language_override=language,
+            deadline=deadline,
         )
 
     async def get_category_code_list(
@@ -1271,6 +2606,7 @@ class KoreaTourismApiClient:
         cat3: Optional[str] = None,
         rows: int = 20,
         page: int = 1,
+        deadline: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Get the list of category codes.
@@ -1283,6 +2619,7 @@ class KoreaTourismApiClient:
             cat3: Category 3 from the tourism API
             rows: Number of items per page
             page: Page number for pagination
+            deadline: Absolute time.monotonic() after which the request is abandoned
 
         Returns:
             Dictionary containing category code information with structure:
@@ -1324,9 +2661,538 @@ class KoreaTourismApiClient:
 
         # Pass language override directly to _make_request
         return await self._make_request(
-            self.CATEGORY_CODE_LIST_ENDPOINT, params, language_override=language
+            self.CATEGORY_CODE_LIST_ENDPOINT,
+            params,
+            language_override=language,
+            deadline=deadline,
         )
 
+    async def for_languages(
+        self,
+        languages: Sequence[str],
+        request: Callable[[str], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Run the same request against several language services concurrently.
+
+        Args:
+            languages: Language codes, see LANGUAGE_SERVICE_MAP. Duplicates are
+                ignored.
+            request: Makes the request for one language, e.g.
+                `lambda lang: client.search_by_keyword("Hanok", language=lang)`.
+
+        Returns:
+            Dictionary with structure:
+            {
+                "languages": [str],             # Languages that were queried
+                "total_count": {"<language>": int},
+                "items": [...],                 # See merge_localized_items
+                "errors": {"<language>": str},  # Languages that failed
+            }
+
+        Raises:
+            ValueError: If a language is not supported.
+        """
+        languages = list(dict.fromkeys(lang.lower() for lang in languages))
+        unsupported = [lang for lang in languages if lang not in LANGUAGE_SERVICE_MAP]
+        if unsupported:
+            raise ValueError(
+                f"Unsupported languages: {', '.join(unsupported)}. "
+                f"Supported: {', '.join(LANGUAGE_SERVICE_MAP)}"
+            )
+
+        responses = await asyncio.gather(
+            *(request(lang) for lang in languages), return_exceptions=True
+        )
+        items_by_language: Dict[str, List[Dict[str, Any]]] = {}
+        total_count: Dict[str, int] = {}
+        errors: Dict[str, str] = {}
+        for lang, response in zip(languages, responses):
+            if isinstance(response, BaseException):
+                if not isinstance(response, Exception):
+                    raise response
+                errors[lang] = str(response) or type(response).__name__
+                continue
+            items = items_by_language[lang] = response.get("items", [])
+            total_count[lang] = response.get("total_count", len(items))
+        return {
+            "languages": languages,
+            "total_count": total_count,
+            "items": merge_localized_items(items_by_language),
+            "errors": errors,
+        }
+
+    async def merge_areas(
+        self,
+        area_codes: Sequence[str],
+        request: Callable[[str, int, int], Awaitable[Dict[str, Any]]],
+        sort_by: str = "modified",
+        page: int = 1,
+        rows: int = 20,
+    ) -> Dict[str, Any]:
+        """
+        Page through the results of several areas as one sorted list.
+
+        The first page of every area is fetched concurrently, then the areas
+        are merged k-way on the sort key: only the current page of each area
+        is held, and an area's next page is fetched when the merge reaches its
+        end. A page of `rows` items therefore never needs more than `page`
+        pages per area, whatever the areas' total sizes. Areas that fail are
+        reported instead of failing the whole list.
+
+        Args:
+            area_codes: Top-level area codes, see AREA_CODE_MAP. Duplicates
+                are ignored.
+            request: Fetches one page of one area, called with the area code,
+                page number and rows, sorted in the upstream order of
+                `sort_by` (see SORT_ARRANGE).
+            sort_by: "modified" (most recently modified first) or "title".
+            page: Page number of the merged list.
+            rows: Number of items per page.
+
+        Returns:
+            Dictionary with structure:
+            {
+                "total_count": int,     # Items across all areas that answered
+                "num_of_rows": int,
+                "page_no": int,
+                "area_codes": [str],    # Areas that were queried
+                "items": [...],
+                "errors": {"<area code>": str},  # Areas that failed
+            }
+
+        Raises:
+            ValueError: If an area code or the sort order is not supported.
+        """
+        area_codes = list(dict.fromkeys(str(code) for code in area_codes))
+        unknown = [code for code in area_codes if code not in AREA_CODE_MAP]
+        if unknown:
+            raise ValueError(
+                f"Unknown area codes: {', '.join(unknown)}. "
+                f"Valid codes: {', '.join(AREA_CODE_MAP)}"
+            )
+        if sort_by not in SORT_KEYS:
+            raise ValueError(
+                f"Invalid sort_by: '{sort_by}'. Valid values: {', '.join(SORT_KEYS)}"
+            )
+        sort_key = SORT_KEYS[sort_by]
+        page, rows = max(page, 1), max(rows, 1)
+        errors: Dict[str, str] = {}
+
+        def failed(code: str, error: BaseException) -> None:
+            if not isinstance(error, Exception):
+                raise error
+            errors[code] = str(error) or type(error).__name__
+
+        first_pages = await asyncio.gather(
+            *(request(code, 1, rows) for code in area_codes), return_exceptions=True
+        )
+
+        async def stream(code: str, response: Dict[str, Any]):
+            page_no, seen = 1, 0
+            while True:
+                items = response.get("items", [])
+                for item in items:
+                    yield item
+                seen += len(items)
+                if not items or seen >= response.get("total_count", 0):
+                    return
+                page_no += 1
+                try:
+                    response = await request(code, page_no, rows)
+                except Exception as e:
+                    failed(code, e)
+                    return
+
+        streams = []
+        total_count = 0
+        for code, response in zip(area_codes, first_pages):
+            if isinstance(response, BaseException):
+                failed(code, response)
+                continue
+            total_count += response.get("total_count", 0)
+            streams.append(stream(code, response))
+
+        heap: List[tuple] = []
+
+        async def advance(index: int) -> None:
+            item = await anext(streams[index], None)
+            if item is not None:
+                heapq.heappush(heap, (sort_key(item), index, item))
+
+        try:
+            for index in range(len(streams)):
+                await advance(index)
+            skip = (page - 1) * rows
+            items: List[Dict[str, Any]] = []
+            while heap and len(items) < rows:
+                _, index, item = heapq.heappop(heap)
+                if skip:
+                    skip -= 1
+                else:
+                    items.append(item)
+                if len(items) < rows:
+                    # Only refill when another item is needed, so the last
+                    # item of the page does not fetch the area's next page
+                    await advance(index)
+        finally:
+            for area_stream in streams:
+                await area_stream.aclose()
+
+        return {
+            "total_count": total_count,
+            "num_of_rows": rows,
+            "page_no": page,
+            "area_codes": area_codes,
+            "items": items,
+            "errors": errors,
+        }
+
+    async def fetch_all_pages(
+        self,
+        request: Callable[[int, int], Awaitable[Dict[str, Any]]],
+        rows: int = 100,
+        max_pages: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Fetch every page of a list.
+
+        The first page tells how many pages there are, then all the others
+        are requested concurrently; each goes through the cache and rate
+        limiter like any other request. Items that shift between pages
+        while they are fetched are deduplicated by content ID.
+
+        Args:
+            request: Fetches one page, called with the page number and rows,
+                e.g. `lambda page, rows: client.search_stay(page=page, rows=rows)`.
+            rows: Items per page.
+            max_pages: Most pages fetched (default: MAX_DRAIN_PAGES).
+
+        Returns:
+            Dictionary with structure:
+            {
+                "total_count": int,     # As reported by the first page
+                "page_count": int,      # Pages requested
+                "failed_pages": int,    # Pages that could not be fetched
+                "truncated": bool,      # Whether there were more than max_pages
+                "items": [...],
+            }
+        """
+        max_pages = max_pages or self.MAX_DRAIN_PAGES
+        first = await request(1, rows)
+        total_count = first.get("total_count", 0)
+        needed = max(1, math.ceil(total_count / rows))
+        page_count = min(needed, max_pages)
+        rest = await asyncio.gather(
+            *(request(page, rows) for page in range(2, page_count + 1)),
+            return_exceptions=True,
+        )
+
+        items: Dict[str, Dict[str, Any]] = {}
+        failed = 0
+        for index, response in enumerate([first, *rest]):
+            if isinstance(response, BaseException):
+                if not isinstance(response, Exception):
+                    raise response
+                failed += 1
+                continue
+            for position, item in enumerate(response.get("items", [])):
+                key = str(item.get("contentid") or f"{index}:{position}")
+                items.setdefault(key, item)
+        return {
+            "total_count": total_count,
+            "page_count": page_count,
+            "failed_pages": failed,
+            "truncated": needed > page_count,
+            "items": list(items.values()),
+        }
+
+    async def _query_circles(
+        self,
+        centers: Sequence[Point],
+        radius: float,
+        content_type_id: Optional[str],
+        language: Optional[str],
+        deadline: Optional[float],
+    ) -> tuple[List[Dict[str, Any]], int, int]:
+        """
+        Run a location-based query per circle concurrently.
+
+        Returns:
+            Items of all circles in order, the number of failed queries and
+            the number of queries with more than AREA_QUERY_ROWS items.
+
+        Raises:
+            Exception: The first error, if every query failed.
+        """
+        responses = await asyncio.gather(
+            *(
+                self.get_location_based_list(
+                    mapx=lon,
+                    mapy=lat,
+                    radius=math.ceil(radius),
+                    content_type_id=content_type_id,
+                    language=language,
+                    rows=self.AREA_QUERY_ROWS,
+                    deadline=deadline,
+                )
+                for lon, lat in centers
+            ),
+            return_exceptions=True,
+        )
+        errors = [r for r in responses if isinstance(r, BaseException)]
+        for error in errors:
+            if not isinstance(error, Exception):
+                raise error
+        if errors and len(errors) == len(responses):
+            raise errors[0]
+
+        items: List[Dict[str, Any]] = []
+        truncated = 0
+        for response in responses:
+            if isinstance(response, BaseException):
+                continue
+            page = response.get("items", [])
+            if response.get("total_count", 0) > len(page):
+                truncated += 1
+            items += page
+        return items, len(errors), truncated
+
+    async def search_along_route(
+        self,
+        route: Sequence[Sequence[float]],
+        buffer_m: float,
+        content_type_id: Optional[str] = None,
+        language: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Find tourism items within a distance of a route.
+
+        The corridor is covered with overlapping location-based queries (see
+        Route.cover) that run concurrently. Every query goes through the
+        cache and the rate limiter like any other request; centers are
+        rounded, so the same route is served from cache when asked again.
+        Items are deduplicated by content ID, clipped to the corridor and
+        ranked by how far along the route they are.
+
+        Args:
+            route: [longitude, latitude] points in travel order.
+            buffer_m: Maximum distance from the route in meters.
+            content_type_id: Content type ID to filter results
+            language: Override the client's default language
+            deadline: Absolute time.monotonic() after which the requests are abandoned
+
+        Returns:
+            Dictionary with structure:
+            {
+                "total_count": int,         # Items within the corridor
+                "route_length_m": int,
+                "query_count": int,         # Location queries made
+                "query_radius": int,        # Radius of every query
+                "failed_queries": int,      # Queries that failed
+                "truncated_queries": int,   # Queries with more than AREA_QUERY_ROWS items
+                "items": [
+                    {
+                        ...,                        # Fields of the API item
+                        "distance_along_m": int,    # From the start of the route
+                        "offset_m": int,            # From the route
+                    },
+                    # ... more items, in travel order
+                ]
+            }
+
+        Raises:
+            ValueError: If the route or buffer is invalid, or the route needs
+                more than MAX_ROUTE_QUERIES queries.
+        """
+        path = Route(route)
+        centers, radius = path.cover(buffer_m)
+        if len(centers) > self.MAX_ROUTE_QUERIES:
+            raise ValueError(
+                f"The route needs {len(centers)} queries with a buffer of "
+                f"{buffer_m:g}m, at most {self.MAX_ROUTE_QUERIES} are allowed. "
+                "Use a wider buffer or a shorter route."
+            )
+
+        items, failed, truncated = await self._query_circles(
+            centers, radius, content_type_id, language, deadline
+        )
+        found: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            point = item_point(item)
+            content_id = str(item.get("contentid") or "")
+            if point is None or not content_id or content_id in found:
+                continue
+            along, offset = path.locate(point)
+            if offset > buffer_m:
+                continue
+            # "dist" is the distance from the query center, meaningless here
+            ranked = {k: v for k, v in item.items() if k != "dist"}
+            ranked["distance_along_m"] = round(along)
+            ranked["offset_m"] = round(offset)
+            found[content_id] = ranked
+
+        return {
+            "total_count": len(found),
+            "route_length_m": round(path.length_m),
+            "query_count": len(centers),
+            "query_radius": math.ceil(radius),
+            "failed_queries": failed,
+            "truncated_queries": truncated,
+            "items": sorted(found.values(), key=lambda i: i["distance_along_m"]),
+        }
+
+    async def find_in_bbox(
+        self,
+        min_lon: float,
+        min_lat: float,
+        max_lon: float,
+        max_lat: float,
+        content_type_id: Optional[str] = None,
+        language: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Find tourism items within a bounding box, e.g. a map viewport.
+
+        The API only searches around a point, so the box is covered with the
+        tiles of a fixed grid (see geo.grid_cover) and a location-based query
+        per tile runs concurrently. Tiles do not depend on the exact box, so a
+        panned viewport reuses the cached queries of the tiles it still
+        overlaps and only fetches the new ones. Items are deduplicated by
+        content ID and clipped to the box.
+
+        Args:
+            min_lon: Western edge of the box
+            min_lat: Southern edge of the box
+            max_lon: Eastern edge of the box
+            max_lat: Northern edge of the box
+            content_type_id: Content type ID to filter results
+            language: Override the client's default language
+            deadline: Absolute time.monotonic() after which the requests are abandoned
+
+        Returns:
+            Dictionary with structure:
+            {
+                "total_count": int,         # Items within the box
+                "tile_size_m": int,         # Side of the grid tiles
+                "query_count": int,         # Location queries made
+                "failed_queries": int,      # Queries that failed
+                "truncated_queries": int,   # Queries with more than AREA_QUERY_ROWS items
+                "items": [...],             # Closest to the center of the box first
+            }
+
+        Raises:
+            ValueError: If the box is invalid or needs more than
+                MAX_BBOX_QUERIES queries.
+        """
+        bbox = validate_bbox(min_lon, min_lat, max_lon, max_lat)
+        centers, radius, side = grid_cover(bbox, self.MAX_BBOX_QUERIES)
+        items, failed, truncated = await self._query_circles(
+            centers, radius, content_type_id, language, deadline
+        )
+        middle = ((min_lon + max_lon) / 2, (min_lat + max_lat) / 2)
+        found: Dict[str, tuple[float, Dict[str, Any]]] = {}
+        for item in items:
+            point = item_point(item)
+            content_id = str(item.get("contentid") or "")
+            if point is None or not content_id or content_id in found:
+                continue
+            if in_bbox(point, bbox):
+                item = {k: v for k, v in item.items() if k != "dist"}
+                found[content_id] = (haversine_m(middle, point), item)
+
+        return {
+            "total_count": len(found),
+            "tile_size_m": side,
+            "query_count": len(centers),
+            "failed_queries": failed,
+            "truncated_queries": truncated,
+            "items": [item for _, item in sorted(found.values(), key=lambda f: f[0])],
+        }
+
+    async def find_nearest(
+        self,
+        k: int,
+        longitude: float,
+        latitude: float,
+        content_type_id: Optional[str] = None,
+        language: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Find the k tourism items nearest to a point, without guessing a radius.
+
+        The items of earlier location-based requests (nearby, route and box
+        searches) answer the query locally when they settle it for certain
+        (see CoverageIndex). Otherwise a single query of the largest radius
+        sorted by distance returns the nearest items, and its response
+        settles later queries nearby. Its center is rounded to about 10m so
+        queries close to each other share the cached response.
+
+        Args:
+            k: Number of items, at most AREA_QUERY_ROWS
+            longitude: Longitude of the point
+            latitude: Latitude of the point
+            content_type_id: Content type ID to filter results
+            language: Override the client's default language
+            deadline: Absolute time.monotonic() after which the request is abandoned
+
+        Returns:
+            Dictionary with structure:
+            {
+                "total_count": int,     # k, or fewer if there are fewer within 20km
+                "query_count": int,     # Upstream queries made, 0 or 1
+                "items": [
+                    {
+                        ...,                # Fields of the API item
+                        "distance_m": int,  # From the point
+                    },
+                    # ... more items, nearest first
+                ]
+            }
+
+        Raises:
+            ValueError: If k or the point is out of range.
+        """
+        if not 1 <= k <= self.AREA_QUERY_ROWS:
+            raise ValueError(f"k must be between 1 and {self.AREA_QUERY_ROWS}")
+        point = validate_point((longitude, latitude))
+        self._ensure_full_initialization()
+
+        scope = self._coverage_scope(content_type_id, language)
+        nearest = self._coverage.nearest(scope, point, k)
+        query_count = 0
+        if nearest is None:
+            lon, lat = round(point[0], 4), round(point[1], 4)
+            response = await self.get_location_based_list(
+                mapx=lon,
+                mapy=lat,
+                radius=MAX_QUERY_RADIUS_M,
+                content_type_id=content_type_id,
+                language=language,
+                rows=self.AREA_QUERY_ROWS,
+                deadline=deadline,
+                arrange=self.ARRANGE_DISTANCE_WITH_IMAGE,
+            )
+            query_count = 1
+            located = [
+                (haversine_m(point, p), item)
+                for item in response.get("items", [])
+                if (p := item_point(item)) is not None
+            ]
+            nearest = heapq.nsmallest(k, located, key=lambda pair: pair[0])
+
+        items = [
+            {
+                **{key: value for key, value in item.items() if key != "dist"},
+                "distance_m": round(distance),
+            }
+            for distance, item in nearest
+        ]
+        return {"total_count": len(items), "query_count": query_count, "items": items}
+
 
 if __name__ == "__main__":
     import os
@@ -1335,5 +3201,9 @@ if __name__ == "__main__":
     api_key = os.environ.get("KOREA_TOURISM_API_KEY")
     if not api_key:
         raise ValueError("KOREA_TOURISM_API_KEY environment variable is not set")
-    client = KoreaTourismApiClient(api_key=api_key)
-    print(asyncio.run(client.search_by_keyword(keyword="Gyeongbokgung")))
+
+    async def main():
+        async with KoreaTourismApiClient(api_key=api_key) as client:
+            print(await client.search_by_keyword(keyword="Gyeongbokgung"))
+
+    asyncio.run(main())
@@ -0,0 +1,499 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+# Priority lanes of upstream requests. Interactive requests serve live tool
+# calls; background ones keep caches and connections warm; bulk ones are large
+# jobs such as batch or multi-page fetches.
+INTERACTIVE = "interactive"
+BACKGROUND = "background"
+BULK = "bulk"
+LANES = (INTERACTIVE, BACKGROUND, BULK)
+
+_current_lane: ContextVar[str] = ContextVar("request_lane", default=INTERACTIVE)
+
+
+def current_lane() -> str:
+    """Lane of the upstream requests made by the current task"""
+    return _current_lane.get()
+
+
+@contextmanager
+def request_lane(lane: str) -> Iterator[None]:
+    """Run the requests made inside the block (and tasks started there) in `lane`"""
+    if lane not in LANES:
+        raise ValueError(f"Unknown request lane: {lane}")
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Concurrency limiter whose limit adapts to upstream behaviour (AIMD).
+
+    The limit grows by one after a full limit's worth of successful requests
+    while latency stays flat, i.e. within `latency_tolerance` times the best
+    latency recently observed. It is multiplied by `backoff_ratio` when a
+    request is dropped (server error, timeout) or latency rises beyond that
+    tolerance, at most once per round trip so a burst of failures from the same
+    window only counts once.
+
+    Waiting requests are queued per priority lane. Interactive requests skip
+    ahead of everything else, and background and bulk requests share what is
+    left by weight (`lane_weights`). The latter two only start while fewer than
+    `background_share` of the limit are in flight, so a live tool call always
+    finds a free slot.
+
+    Instances are bound to the event loop they are used on.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 50,
+        backoff_ratio: float = 0.7,
+        latency_tolerance: float = 2.0,
+        smoothing: float = 0.2,
+        baseline_window: int = 100,
+        background_share: float = 0.8,
+        lane_weights: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Concurrency limit to start from.
+            min_limit: The limit never drops below this value.
+            max_limit: The limit never grows above this value.
+            backoff_ratio: Factor applied to the limit on each decrease.
+            latency_tolerance: Smoothed latency above this multiple of the
+                baseline latency counts as congestion.
+            smoothing: Weight of a new sample in the smoothed latency (EWMA).
+            baseline_window: Number of recent samples the baseline (minimum)
+                latency is taken over, so it can follow lasting changes.
+            background_share: Share of the limit background and bulk requests
+                may occupy.
+            lane_weights: Relative dequeue weights of the background and bulk
+                lanes. Defaults to 3:1.
+        """
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.background_share = background_share
+        self.lane_weights = lane_weights or {BACKGROUND: 3, BULK: 1}
+
+        self._in_flight = 0
+        # Waiters with their enqueue time (time.monotonic()) per lane
+        self._waiters: Dict[str, Deque[Tuple[asyncio.Future, float]]] = {
+            lane: deque() for lane in LANES
+        }
+        # Smooth weighted round-robin state of the background and bulk lanes
+        self._lane_credits: Dict[str, float] = {lane: 0.0 for lane in LANES}
+        # Smoothed queue wait and number of granted slots per lane
+        self._lane_wait: Dict[str, float] = {lane: 0.0 for lane in LANES}
+        self._lane_acquired: Dict[str, int] = {lane: 0 for lane in LANES}
+        self._samples: Deque[float] = deque(maxlen=baseline_window)
+        self._smoothed_latency: Optional[float] = None
+        self._successes = 0
+        self._last_decrease = 0.0
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit"""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot"""
+        return self._in_flight
+
+    @property
+    def smoothed_latency(self) -> Optional[float]:
+        """Smoothed latency of successful requests in seconds, None before the first"""
+        return self._smoothed_latency
+
+    @property
+    def queued(self) -> int:
+        """Number of requests waiting for a slot"""
+        return sum(self._queued(lane) for lane in LANES)
+
+    def _queued(self, lane: str) -> int:
+        return sum(1 for waiter, _ in self._waiters[lane] if not waiter.done())
+
+    def _lane_capacity(self, lane: str) -> int:
+        if lane == INTERACTIVE:
+            return self.limit
+        return max(1, int(self.limit * self.background_share))
+
+    def _record_wait(self, lane: str, waited: float) -> None:
+        self._lane_acquired[lane] += 1
+        self._lane_wait[lane] += self.smoothing * (waited - self._lane_wait[lane])
+
+    def try_acquire(self, lane: str = INTERACTIVE) -> bool:
+        """Take a slot only if one is free right away, skipping the queue"""
+        # Never overtake requests of the same or a more urgent lane
+        ahead = LANES[: LANES.index(lane) + 1]
+        if self._in_flight < self._lane_capacity(lane) and not any(
+            self._queued(other) for other in ahead
+        ):
+            self._in_flight += 1
+            self._record_wait(lane, 0.0)
+            return True
+        return False
+
+    async def acquire(self, lane: str = INTERACTIVE) -> None:
+        """Wait for a free slot in a priority lane. Must be paired with `release`."""
+        if self.try_acquire(lane):
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        entry = (waiter, time.monotonic())
+        self._waiters[lane].append(entry)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before the cancellation arrived
+                self._in_flight -= 1
+                self._wake_waiters()
+            else:
+                self._waiters[lane].remove(entry)
+            raise
+
+    def release(self, latency: Optional[float] = None, dropped: bool = False) -> None:
+        """
+        Release a slot and feed the outcome of the request into the limit.
+
+        Args:
+            latency: Duration of a successful request in seconds.
+            dropped: True if the request failed in a way that signals overload
+                (5xx, timeout). Requests that are neither (client errors,
+                cancellations) should pass neither argument.
+        """
+        self._in_flight -= 1
+        if dropped:
+            self._decrease()
+        elif latency is not None:
+            self._on_success(latency)
+        self._wake_waiters()
+
+    def _on_success(self, latency: float) -> None:
+        self._samples.append(latency)
+        if self._smoothed_latency is None:
+            self._smoothed_latency = latency
+        else:
+            self._smoothed_latency += self.smoothing * (
+                latency - self._smoothed_latency
+            )
+
+        if self._smoothed_latency > self.latency_tolerance * min(self._samples):
+            self._decrease()
+            return
+
+        self._successes += 1
+        if self._successes >= self.limit:
+            self._successes = 0
+            self._limit = min(self._limit + 1, float(self.max_limit))
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        # Requests issued before the previous decrease saw the old limit
+        if now - self._last_decrease < (self._smoothed_latency or 0.0):
+            return
+        self._last_decrease = now
+        self._successes = 0
+        self._limit = max(self._limit * self.backoff_ratio, float(self.min_limit))
+
+    def _next_lane(self) -> Optional[str]:
+        """Lane to hand the next free slot to, if any waiter can take one"""
+        if self._waiters[INTERACTIVE] and self._in_flight < self.limit:
+            return INTERACTIVE
+        eligible = [
+            lane
+            for lane in (BACKGROUND, BULK)
+            if self._waiters[lane] and self._in_flight < self._lane_capacity(lane)
+        ]
+        if not eligible:
+            return None
+        # Smooth weighted round-robin between the eligible lanes
+        total = 0
+        for lane in eligible:
+            weight = self.lane_weights.get(lane, 1)
+            self._lane_credits[lane] += weight
+            total += weight
+        chosen = max(eligible, key=lambda lane: self._lane_credits[lane])
+        self._lane_credits[chosen] -= total
+        return chosen
+
+    def _wake_waiters(self) -> None:
+        while (lane := self._next_lane()) is not None:
+            waiter, enqueued_at = self._waiters[lane].popleft()
+            if waiter.done():
+                continue
+            self._in_flight += 1
+            self._record_wait(lane, time.monotonic() - enqueued_at)
+            waiter.set_result(None)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of the limiter state for metrics export"""
+        return {
+            "limit": self.limit,
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "smoothed_latency_ms": round(self._smoothed_latency * 1000, 1)
+            if self._smoothed_latency is not None
+            else None,
+            "baseline_latency_ms": round(min(self._samples) * 1000, 1)
+            if self._samples
+            else None,
+            "lanes": {
+                lane: {
+                    "queued": self._queued(lane),
+                    "acquired": self._lane_acquired[lane],
+                    "smoothed_wait_ms": round(self._lane_wait[lane] * 1000, 1),
+                }
+                for lane in LANES
+            },
+        }
+
+
+class TokenBucket:
+    """
+    Async token bucket rate limiter.
+
+    Holds up to `capacity` tokens refilled at `rate` tokens per second. A caller
+    finding the bucket empty reserves the next token in advance and sleeps
+    until it is due, so waiting callers are served in arrival order without
+    blocking the event loop. `pause` stops the refill for a while, which is how
+    upstream back-pressure (429 Too Many Requests) slows every caller down.
+
+    The bucket only keeps counters, so it can be shared across event loops.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """
+        Initialize the bucket, starting full.
+
+        Args:
+            rate: Tokens added per second.
+            capacity: Maximum burst size. Defaults to one second worth of tokens.
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+
+        self._tokens = self.capacity
+        # Time up to which tokens have been refilled; lies ahead while paused
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available; negative while callers hold reservations"""
+        self._refill(time.monotonic())
+        return self._tokens
+
+    @property
+    def paused_for(self) -> float:
+        """Seconds until a pause requested through `pause` ends"""
+        return max(self._updated - time.monotonic(), 0.0)
+
+    def _refill(self, now: float) -> None:
+        if now > self._updated:
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Take a token, going into debt if none is left.
+
+        Returns:
+            Seconds the caller has to wait before the reserved token is due.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return 0.0
+        return (self._updated - now) + (-self._tokens / self.rate)
+
+    def try_acquire(self, reserve: float = 0.0) -> bool:
+        """Take a token only if one is available right away, leaving `reserve` behind"""
+        self._refill(time.monotonic())
+        if self._tokens >= 1 + reserve:
+            self._tokens -= 1
+            return True
+        return False
+
+    def refund(self) -> None:
+        """Give back a token reserved by a caller that gave up waiting"""
+        self._tokens = min(self._tokens + 1, self.capacity)
+
+    async def acquire(
+        self, timeout: Optional[float] = None, reserve: float = 0.0
+    ) -> bool:
+        """
+        Wait until a token is available and take it.
+
+        Args:
+            timeout: Maximum seconds to wait. If the next token is due later,
+                nothing is taken and the call returns at once.
+            reserve: Tokens that must be left in the bucket. Callers passing a
+                reserve never queue ahead of callers that do not; they wait
+                until the bucket has refilled beyond it instead.
+
+        Returns:
+            True if a token was taken, False if it would not arrive in time.
+        """
+        if reserve > 0:
+            return await self._acquire_above(reserve, timeout)
+        delay = self.reserve()
+        if delay <= 0:
+            return True
+        if timeout is not None and delay > timeout:
+            self.refund()
+            return False
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.refund()
+            raise
+        return True
+
+    async def _acquire_above(self, reserve: float, timeout: Optional[float]) -> bool:
+        waited = 0.0
+        while not self.try_acquire(reserve):
+            delay = max(
+                (1 + reserve - self.tokens) / self.rate + self.paused_for, 0.001
+            )
+            if timeout is not None and waited + delay > timeout:
+                return False
+            await asyncio.sleep(delay)
+            waited += delay
+        return True
+
+    def pause(self, seconds: float) -> None:
+        """
+        Stop handing out new tokens for `seconds`.
+
+        Tokens left in the bucket are dropped, so the next callers wait for the
+        pause to end and are then released at the regular rate.
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = min(self._tokens, 0.0)
+        self._updated = max(self._updated, now + seconds)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of the bucket state for metrics export"""
+        return {
+            "rate_per_second": round(self.rate, 3),
+            "tokens": round(self.tokens, 2),
+            "paused_for": round(self.paused_for, 1),
+        }
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into one.
+
+    The first caller for a key starts the call in a task of its own; callers
+    arriving while it runs wait for the same outcome instead of repeating the
+    work. A caller that gives up (cancellation, timeout) only stops the call
+    when nobody else is waiting for it.
+
+    The call runs in the request lane of its most urgent caller: when a caller
+    from a more urgent lane joins, the run is moved into that lane, so the
+    waits it starts from then on (rate limit tokens, concurrency slots,
+    retries) are no longer those of a less urgent lane.
+
+    Instances are bound to the event loop they are used on.
+    """
+
+    def __init__(self):
+        # Running call per key, with the number of callers waiting for it
+        self._calls: Dict[Hashable, Tuple[asyncio.Task, List[int]]] = {}
+        self._shared = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running"""
+        return len(self._calls)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Run `call`, or join the run already in progress for `key`.
+
+        Args:
+            key: Identifies calls with the same outcome.
+            call: Starts the work when no run for `key` is in progress.
+
+        Returns:
+            The outcome of the shared run.
+        """
+        entry = self._calls.get(key)
+        if entry is None:
+            task = asyncio.ensure_future(call())
+            entry = self._calls[key] = (task, [0])
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self._shared += 1
+            self._promote(entry[0], current_lane())
+        task, waiters = entry
+        waiters[0] += 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if waiters[0] == 1 and not task.done():
+                # Nobody else is waiting; stop the work and let it clean up
+                task.cancel()
+                await asyncio.wait([task])
+            raise
+        finally:
+            waiters[0] -= 1
+
+    @staticmethod
+    def _promote(task: asyncio.Task, lane: str) -> None:
+        """Move a run into `lane` if that lane is more urgent than its own"""
+        context = task.get_context()
+        if not task.done() and LANES.index(lane) < LANES.index(
+            context.get(_current_lane, INTERACTIVE)
+        ):
+            context.run(_current_lane.set, lane)
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        entry = self._calls.get(key)
+        if entry is not None and entry[0] is task:
+            del self._calls[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved, even if every caller gave up
+            task.exception()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of the coalescing state for metrics export"""
+        return {"in_flight": self.in_flight, "shared": self._shared}
@@ -0,0 +1,448 @@
+import heapq
+import math
+import time
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from cachetools import TTLCache
+
+# Mean radius of the Earth in meters
+EARTH_RADIUS_M = 6_371_008.8
+# Largest radius locationBasedList2 accepts, in meters
+MAX_QUERY_RADIUS_M = 20_000
+# Meters per degree of latitude
+METERS_PER_DEGREE = math.radians(1) * EARTH_RADIUS_M
+# Tile sides of the grid that box searches are tiled with, in meters
+GRID_TILE_SIZES_M = (500, 1000, 2000, 4000, 8000, 16000)
+
+# (longitude, latitude) in degrees, the order the API uses (mapx, mapy)
+Point = Tuple[float, float]
+
+
+def validate_point(point: Sequence[float]) -> Point:
+    """
+    Check a (longitude, latitude) pair.
+
+    Raises:
+        ValueError: If it is not a pair of numbers within range.
+    """
+    try:
+        lon, lat = (float(value) for value in point)
+    except (TypeError, ValueError):
+        raise ValueError(f"Invalid point {point!r}: expected [longitude, latitude]")
+    if not (-180 <= lon <= 180 and -90 <= lat <= 90):
+        raise ValueError(f"Invalid point {point!r}: coordinates out of range")
+    return lon, lat
+
+
+def validate_bbox(
+    min_lon: float, min_lat: float, max_lon: float, max_lat: float
+) -> Tuple[float, float, float, float]:
+    """
+    Check a bounding box.
+
+    Raises:
+        ValueError: If a corner is out of range or the minimum exceeds the maximum.
+    """
+    validate_point((min_lon, min_lat))
+    validate_point((max_lon, max_lat))
+    if min_lon > max_lon or min_lat > max_lat:
+        raise ValueError("The minimum of a bounding box must not exceed its maximum")
+    return min_lon, min_lat, max_lon, max_lat
+
+
+def in_bbox(point: Point, bbox: Tuple[float, float, float, float]) -> bool:
+    """Check whether a point lies within a bounding box"""
+    min_lon, min_lat, max_lon, max_lat = bbox
+    return min_lon <= point[0] <= max_lon and min_lat <= point[1] <= max_lat
+
+
+def _column_width(row: int, d_lat: float) -> float:
+    # Degrees of longitude that are as wide as d_lat at the row's center
+    return d_lat / math.cos(math.radians((row + 0.5) * d_lat))
+
+
+def grid_cell(point: Point, side_m: float) -> Tuple[int, int]:
+    """Row and column of the global grid cell, `side_m` wide, holding a point"""
+    d_lat = side_m / METERS_PER_DEGREE
+    row = math.floor(point[1] / d_lat)
+    return row, math.floor(point[0] / _column_width(row, d_lat))
+
+
+def grid_cover(
+    bbox: Tuple[float, float, float, float], max_tiles: int
+) -> Tuple[List[Point], float, int]:
+    """
+    Circles covering a bounding box, from a fixed grid of square tiles.
+
+    The grid is global rather than laid out from the box: rows are
+    `side` meters of latitude apart, and every row is cut into tiles
+    `side` meters wide at its own center latitude. Moving the box therefore
+    mostly hits the same tiles, with the same centers, as before. The
+    smallest tile size in GRID_TILE_SIZES_M needing at most `max_tiles`
+    tiles is used, and every circle is the tile's circumcircle.
+
+    Returns:
+        Circle centers, the radius of every circle and the tile side, in meters.
+
+    Raises:
+        ValueError: If even the largest tiles need more than `max_tiles`.
+    """
+    min_lon, min_lat, max_lon, max_lat = bbox
+    for side in GRID_TILE_SIZES_M:
+        d_lat = side / METERS_PER_DEGREE
+        centers: List[Point] = []
+        for row in range(math.floor(min_lat / d_lat), math.floor(max_lat / d_lat) + 1):
+            lat = (row + 0.5) * d_lat
+            d_lon = _column_width(row, d_lat)
+            centers += [
+                (round((col + 0.5) * d_lon, 6), round(lat, 6))
+                for col in range(
+                    math.floor(min_lon / d_lon), math.floor(max_lon / d_lon) + 1
+                )
+            ]
+            if len(centers) > max_tiles:
+                break
+        if len(centers) <= max_tiles:
+            # 1% extra for the tile being slightly wider at its southern edge
+            return centers, side * math.sqrt(0.5) * 1.01, side
+    raise ValueError(
+        f"The bounding box is too large: it needs more than {max_tiles} queries "
+        f"of {GRID_TILE_SIZES_M[-1] // 1000}km tiles"
+    )
+
+
+def grid_clusters(
+    items: Sequence[Dict[str, Any]], cell_m: float, representatives: int = 3
+) -> List[Dict[str, Any]]:
+    """
+    Group items by the cell of a square grid they fall into, for map display.
+
+    The grid is the global one of `grid_cover`, so a cell keeps its items
+    whatever the area searched. Items without coordinates are left out.
+
+    Args:
+        items: API items with mapx and mapy.
+        cell_m: Side of the grid cells in meters.
+        representatives: Items kept per cluster, those closest to its centroid.
+
+    Returns:
+        Clusters, largest first, each with structure:
+        {
+            "longitude": float,     # Centroid of the items
+            "latitude": float,
+            "count": int,           # Items in the cell
+            "items": [...],         # Representative items
+        }
+    """
+    cells: Dict[Tuple[int, int], List[Tuple[Point, Dict[str, Any]]]] = {}
+    for item in items:
+        point = item_point(item)
+        if point is not None:
+            cells.setdefault(grid_cell(point, cell_m), []).append((point, item))
+
+    clusters = []
+    for members in cells.values():
+        lon = sum(point[0] for point, _ in members) / len(members)
+        lat = sum(point[1] for point, _ in members) / len(members)
+        # Squared degrees, scaled for longitude, are enough to rank by distance
+        scale = math.cos(math.radians(lat)) ** 2
+        closest = heapq.nsmallest(
+            representatives,
+            members,
+            key=lambda m: scale * (m[0][0] - lon) ** 2 + (m[0][1] - lat) ** 2,
+        )
+        clusters.append(
+            {
+                "longitude": round(lon, 6),
+                "latitude": round(lat, 6),
+                "count": len(members),
+                "items": [item for _, item in closest],
+            }
+        )
+    clusters.sort(key=lambda cluster: -cluster["count"])
+    return clusters
+
+
+def item_point(item: Dict[str, Any]) -> Optional[Point]:
+    """Coordinates of an API item, or None if it has none"""
+    try:
+        lon, lat = float(item["mapx"]), float(item["mapy"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if not (math.isfinite(lon) and math.isfinite(lat)) or (lon == 0 and lat == 0):
+        return None
+    return lon, lat
+
+
+def haversine_m(a: Point, b: Point) -> float:
+    """Great-circle distance between two points in meters"""
+    lon1, lat1, lon2, lat2 = map(math.radians, (*a, *b))
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(h)))
+
+
+def distance_matrix(points: Sequence[Point]) -> List[List[float]]:
+    """Great-circle distances between all pairs of points, in meters"""
+    radians = [(math.radians(lon), math.radians(lat)) for lon, lat in points]
+    cosines = [math.cos(lat) for _, lat in radians]
+    matrix = [[0.0] * len(points) for _ in points]
+    for i, (lon1, lat1) in enumerate(radians):
+        row = matrix[i]
+        for j in range(i + 1, len(radians)):
+            lon2, lat2 = radians[j]
+            h = (
+                math.sin((lat2 - lat1) / 2) ** 2
+                + cosines[i] * cosines[j] * math.sin((lon2 - lon1) / 2) ** 2
+            )
+            distance = 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(h)))
+            row[j] = matrix[j][i] = distance
+    return matrix
+
+
+def order_stops(
+    matrix: Sequence[Sequence[float]],
+    round_trip: bool = False,
+    time_budget: float = 0.5,
+) -> List[int]:
+    """
+    Short order to visit every stop in, starting from stop 0.
+
+    A nearest-neighbour tour is improved with 2-opt (reversing a stretch of
+    the tour whenever that shortens it) until no reversal helps or the time
+    budget runs out. Without `round_trip` the tour ends at whichever stop
+    suits it best.
+
+    Args:
+        matrix: Distances between the stops, see `distance_matrix`.
+        round_trip: Whether the tour returns to stop 0.
+        time_budget: Seconds the 2-opt improvement may take.
+
+    Returns:
+        Indexes of the stops in visiting order, starting with 0.
+    """
+    n = len(matrix)
+    if n == 0:
+        return []
+    tour = [0]
+    unvisited = set(range(1, n))
+    while unvisited:
+        row = matrix[tour[-1]]
+        closest = min(unvisited, key=row.__getitem__)
+        unvisited.remove(closest)
+        tour.append(closest)
+
+    deadline = time.monotonic() + time_budget
+    improved = True
+    while improved and time.monotonic() < deadline:
+        improved = False
+        for i in range(1, n - 1):
+            a, b = tour[i - 1], tour[i]
+            row_a = matrix[a]
+            for j in range(i + 1, n):
+                c = tour[j]
+                if j + 1 < n or round_trip:
+                    d = tour[(j + 1) % n]
+                    delta = row_a[c] + matrix[b][d] - row_a[b] - matrix[c][d]
+                else:
+                    # The tour ends at c: reversing only changes the a-b edge
+                    delta = row_a[c] - row_a[b]
+                if delta < -1e-6:
+                    tour[i : j + 1] = tour[i : j + 1][::-1]
+                    b = tour[i]
+                    improved = True
+            if time.monotonic() >= deadline:
+                break
+    return tour
+
+
+class LocalProjection:
+    """
+    Equirectangular projection to meters around a reference point.
+
+    Over the few hundred kilometers Korea spans the error stays well under a
+    percent, which is plenty for tiling queries and ranking results, and
+    distances become plain vector math.
+    """
+
+    def __init__(self, origin: Point):
+        self.lon0, self.lat0 = origin
+        self._ky = METERS_PER_DEGREE
+        self._kx = self._ky * math.cos(math.radians(self.lat0))
+
+    def to_xy(self, point: Point) -> Tuple[float, float]:
+        """Meters east and north of the origin"""
+        return (point[0] - self.lon0) * self._kx, (point[1] - self.lat0) * self._ky
+
+    def to_point(self, x: float, y: float) -> Point:
+        """Inverse of `to_xy`"""
+        return self.lon0 + x / self._kx, self.lat0 + y / self._ky
+
+
+class Route:
+    """
+    Polyline of (longitude, latitude) points, e.g. a road trip.
+
+    Supports covering the corridor along the route with radius queries and
+    locating points relative to the route.
+    """
+
+    def __init__(self, points: Sequence[Sequence[float]]):
+        """
+        Initialize the route.
+
+        Args:
+            points: At least two [longitude, latitude] points, in travel order.
+
+        Raises:
+            ValueError: If there are fewer than two points or one is invalid.
+        """
+        self.points: List[Point] = [validate_point(point) for point in points]
+        if len(self.points) < 2:
+            raise ValueError("A route needs at least two points")
+        self.projection = LocalProjection(
+            (
+                sum(lon for lon, _ in self.points) / len(self.points),
+                sum(lat for _, lat in self.points) / len(self.points),
+            )
+        )
+        self._xy = [self.projection.to_xy(point) for point in self.points]
+        # Distance along the route at which every vertex is reached
+        self._along = [0.0]
+        for (x1, y1), (x2, y2) in zip(self._xy, self._xy[1:]):
+            self._along.append(self._along[-1] + math.hypot(x2 - x1, y2 - y1))
+
+    @property
+    def length_m(self) -> float:
+        """Length of the route in meters"""
+        return self._along[-1]
+
+    def cover(self, buffer_m: float) -> Tuple[List[Point], float]:
+        """
+        Circles covering everything within `buffer_m` of the route.
+
+        Centers are spaced evenly along every segment, vertices included. A
+        circle of radius r reaches the full corridor width b over a stretch of
+        2 * sqrt(r^2 - b^2) of the route, so with r = b * sqrt(2) neighbouring
+        circles overlap just enough, and the spacing is 2b.
+
+        Args:
+            buffer_m: Half-width of the corridor in meters.
+
+        Returns:
+            Circle centers in travel order, and the radius of every circle.
+
+        Raises:
+            ValueError: If the buffer is not positive or too wide for the
+                largest query radius.
+        """
+        if not 0 < buffer_m < MAX_QUERY_RADIUS_M:
+            raise ValueError(
+                f"buffer_m must be between 0 and {MAX_QUERY_RADIUS_M} meters"
+            )
+        radius = min(buffer_m * math.sqrt(2), MAX_QUERY_RADIUS_M)
+        spacing = 2 * math.sqrt(radius**2 - buffer_m**2)
+
+        centers: List[Tuple[float, float]] = []
+        for (x1, y1), (x2, y2) in zip(self._xy, self._xy[1:]):
+            steps = max(1, math.ceil(math.hypot(x2 - x1, y2 - y1) / spacing))
+            centers += [
+                (x1 + (x2 - x1) * i / steps, y1 + (y2 - y1) * i / steps)
+                for i in range(steps)
+            ]
+        centers.append(self._xy[-1])
+        # Rounded to ~1m so repeated points collapse and cache keys are stable
+        points = dict.fromkeys(
+            (round(lon, 5), round(lat, 5))
+            for lon, lat in (self.projection.to_point(x, y) for x, y in centers)
+        )
+        return list(points), radius
+
+    def locate(self, point: Point) -> Tuple[float, float]:
+        """
+        Position of a point relative to the route.
+
+        Returns:
+            Distance along the route to the closest point on it, and the
+            distance from the route, both in meters.
+        """
+        px, py = self.projection.to_xy(point)
+        best = (math.inf, 0.0)
+        for i, ((x1, y1), (x2, y2)) in enumerate(zip(self._xy, self._xy[1:])):
+            dx, dy = x2 - x1, y2 - y1
+            length_sq = dx * dx + dy * dy
+            t = 0.0
+            if length_sq:
+                t = min(1.0, max(0.0, ((px - x1) * dx + (py - y1) * dy) / length_sq))
+            offset = math.hypot(px - x1 - t * dx, py - y1 - t * dy)
+            if offset < best[0]:
+                best = (offset, self._along[i] + t * math.sqrt(length_sq))
+        return best[1], best[0]
+
+
+class CoverageIndex:
+    """
+    Circles of the map whose items are all known, to answer nearest-item
+    queries without upstream calls.
+
+    A location-based response is complete within its circle when it holds
+    every matching item, or, for a response sorted by distance, within the
+    distance of its last item. If the disk around a query point that reaches
+    its k-th nearest known item lies inside such a circle, no unknown item
+    can be closer, so the answer is exact. Entries expire with the response
+    cache they mirror, and are kept per scope (language and filters) since
+    each scope sees different items.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 86400):
+        """
+        Initialize the index.
+
+        Args:
+            maxsize: Number of most recently added circles kept.
+            ttl: Seconds a circle is kept, that of the response cache.
+        """
+        self._circles: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def add(
+        self,
+        scope: Hashable,
+        center: Point,
+        radius_m: float,
+        items: List[Dict[str, Any]],
+    ) -> None:
+        """Record that `items` are all items of a scope within a circle"""
+        key = (scope, center, radius_m)
+        if key in self._circles:
+            # Re-reading a cached response must not extend its lifetime
+            return
+        self._circles[key] = [
+            (point, item) for item in items if (point := item_point(item)) is not None
+        ]
+
+    def nearest(
+        self, scope: Hashable, point: Point, k: int
+    ) -> Optional[List[Tuple[float, Dict[str, Any]]]]:
+        """
+        The k items of a scope nearest to a point, if known for certain.
+
+        Returns:
+            (distance in meters, item) pairs, nearest first, or None if no
+            known circle settles the query.
+        """
+        for (circle_scope, center, radius_m), located in list(self._circles.items()):
+            if circle_scope != scope or len(located) < k:
+                continue
+            from_center = haversine_m(point, center)
+            if from_center >= radius_m:
+                continue
+            nearest = heapq.nsmallest(
+                k,
+                ((haversine_m(point, p), item) for p, item in located),
+                key=lambda pair: pair[0],
+            )
+            if nearest[-1][0] + from_center <= radius_m:
+                return nearest
+        return None
@@ -0,0 +1,143 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from mcp_tourism.concurrency import TokenBucket
+from mcp_tourism.quota import QuotaAccountant, key_fingerprint, kst_today
+
+
+class ApiKeyPool:
+    """
+    Pool of service keys that upstream calls are spread across.
+
+    Every key has its own token bucket, since data.go.kr rate limits and
+    quotas apply per key, and its own quota counters in the shared
+    `QuotaAccountant`. Calls go to the usable key with the most tokens left,
+    then the one with the fewest calls today. A key that is rejected for a
+    language service (quota exceeded, not registered or expired) is taken out
+    of rotation for that service until the quota resets at midnight KST.
+    """
+
+    def __init__(
+        self,
+        api_keys: Sequence[str],
+        rate_limit_calls: int,
+        rate_limit_period: float,
+        quota: QuotaAccountant,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            api_keys: Service keys, duplicates are ignored.
+            rate_limit_calls: Maximum calls per key per period.
+            rate_limit_period: Rate limit period in seconds.
+            quota: Accountant tracking the daily usage of every key.
+        """
+        self.keys: List[str] = list(dict.fromkeys(k for k in api_keys if k))
+        self.quota = quota
+        self._buckets: Dict[str, TokenBucket] = {
+            key: TokenBucket(
+                rate=rate_limit_calls / rate_limit_period, capacity=rate_limit_calls
+            )
+            for key in self.keys
+        }
+        # (key, service) -> (KST day it was disabled on, reason)
+        self._disabled: Dict[tuple[str, str], tuple[str, str]] = {}
+
+    def bucket(self, api_key: str) -> TokenBucket:
+        """Token bucket of a key"""
+        return self._buckets[api_key]
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers waiting for a token, across all keys"""
+        return sum(int(max(-bucket.tokens, 0.0)) for bucket in self._buckets.values())
+
+    def disable(self, api_key: str, service: str, reason: str) -> None:
+        """Take a key out of rotation for a service until the next KST day"""
+        self._disabled[(api_key, service)] = (kst_today(), reason)
+
+    def is_disabled(self, api_key: str, service: str) -> bool:
+        """Check whether a key is out of rotation for a service"""
+        entry = self._disabled.get((api_key, service))
+        if entry is None:
+            return False
+        if entry[0] != kst_today():
+            # The daily reset has passed; the key gets another chance
+            del self._disabled[(api_key, service)]
+            return False
+        return True
+
+    def usable_keys(self, service: str) -> List[str]:
+        """Keys that are in rotation and have quota left for a service"""
+        return [
+            key
+            for key in self.keys
+            if not self.is_disabled(key, service)
+            and not self.quota.is_at_least(service, key, QuotaAccountant.CACHE_ONLY)
+        ]
+
+    def quota_level(self, service: str) -> str:
+        """Degradation level of the best usable key, cache_only if none is left"""
+        levels = [self.quota.level(service, key) for key in self.usable_keys(service)]
+        if not levels:
+            return QuotaAccountant.CACHE_ONLY
+        return min(levels, key=QuotaAccountant.LEVELS.index)
+
+    def _pick(self, keys: List[str], service: str) -> str:
+        return min(
+            keys,
+            key=lambda k: (-self._buckets[k].tokens, self.quota.used(service, k)),
+        )
+
+    async def acquire(
+        self,
+        service: str,
+        timeout: Optional[float] = None,
+        reserve_share: float = 0.0,
+    ) -> Optional[str]:
+        """
+        Pick a key for a call to a service and wait for one of its tokens.
+
+        Args:
+            service: Language service the call goes to.
+            timeout: Maximum seconds to wait for a token.
+            reserve_share: Share of the key's bucket that must be left for
+                other callers, used to keep tokens for interactive requests.
+
+        Returns:
+            The key to use, or None if no key is usable or no token is due in time.
+        """
+        keys = self.usable_keys(service)
+        if not keys:
+            return None
+        key = self._pick(keys, service)
+        bucket = self._buckets[key]
+        reserve = min(bucket.capacity * reserve_share, bucket.capacity - 1)
+        if not await bucket.acquire(timeout=timeout, reserve=reserve):
+            return None
+        return key
+
+    def try_acquire(self, service: str) -> Optional[str]:
+        """Pick a key whose token is available right away, without waiting"""
+        keys = [
+            key for key in self.usable_keys(service) if self._buckets[key].tokens >= 1
+        ]
+        if not keys:
+            return None
+        key = self._pick(keys, service)
+        return key if self._buckets[key].try_acquire() else None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Rate limiter state and disabled services per key fingerprint"""
+        metrics = {}
+        for key in self.keys:
+            disabled = {
+                service: reason
+                for (api_key, service), (day, reason) in list(self._disabled.items())
+                if api_key == key and day == kst_today()
+            }
+            metrics[key_fingerprint(key)] = {
+                "rate_limit": self._buckets[key].get_metrics(),
+                "disabled": disabled,
+            }
+        return metrics
@@ -0,0 +1,106 @@
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+from cachetools import LRUCache
+
+# Cache keys of the upstream responses a tool call is built from, collected
+# while `collect_cache_keys` is active
+_collected_keys: ContextVar[Optional[Set[str]]] = ContextVar(
+    "collected_cache_keys", default=None
+)
+
+
+def note_cache_key(cache_key: str) -> None:
+    """Record that the running tool call depends on a client cache entry"""
+    keys = _collected_keys.get()
+    if keys is not None:
+        keys.add(cache_key)
+
+
+@contextmanager
+def collect_cache_keys() -> Iterator[Set[str]]:
+    """Collect the cache keys of the requests made inside the block"""
+    keys: Set[str] = set()
+    token = _collected_keys.set(keys)
+    try:
+        yield keys
+    finally:
+        _collected_keys.reset(token)
+
+
+def memo_key(tool: str, arguments: Optional[Dict[str, Any]]) -> str:
+    """
+    Normalized key of a tool call.
+
+    Arguments left at None are dropped, since they mean the same as leaving
+    them out, and the rest are serialized with sorted keys.
+    """
+    normalized = {k: v for k, v in (arguments or {}).items() if v is not None}
+    return f"{tool}:{json.dumps(normalized, sort_keys=True, default=str)}"
+
+
+class ToolResultMemo:
+    """
+    Memo of final tool results, valid while their upstream responses are cached.
+
+    Even when every upstream response comes from the client cache, a tool call
+    still resolves its arguments, merges and filters the responses and has the
+    result serialized. The memo keeps the serialized result together with the
+    cache keys of the responses it was built from, and serves it again only
+    while all of those entries are still in the client cache, so it never
+    outlives the data it was built from.
+    """
+
+    def __init__(self, maxsize: int = 1000):
+        """
+        Initialize the memo.
+
+        Args:
+            maxsize: Number of most recently used tool results kept.
+        """
+        self.maxsize = maxsize
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str, is_cached: Callable[[str], bool]) -> Optional[List[Any]]:
+        """
+        Look up a tool result.
+
+        Args:
+            key: Key of the tool call (see `memo_key`).
+            is_cached: Tells whether a client cache entry is still present.
+
+        Returns:
+            The memoized result, or None if there is none or it went stale.
+        """
+        entry: Optional[Tuple[List[Any], Set[str]]] = self._entries.get(key)
+        if entry is not None:
+            result, cache_keys = entry
+            if all(is_cached(cache_key) for cache_key in cache_keys):
+                self._hits += 1
+                return list(result)
+            del self._entries[key]
+        self._misses += 1
+        return None
+
+    def put(
+        self,
+        key: str,
+        result: List[Any],
+        cache_keys: Set[str],
+        is_cached: Callable[[str], bool],
+    ) -> None:
+        """Memoize a tool result if every response it was built from is cached"""
+        if cache_keys and all(is_cached(cache_key) for cache_key in cache_keys):
+            self._entries[key] = (list(result), set(cache_keys))
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of the memo for metrics export"""
+        return {
+            "entries": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+        }
@@ -0,0 +1,146 @@
+import asyncio
+import time
+import weakref
+from contextlib import suppress
+from typing import Any, Dict, Optional
+
+from mcp_tourism.concurrency import BACKGROUND, BULK, INTERACTIVE
+
+
+class LoadShedder:
+    """
+    Overload detector deciding which work to turn away.
+
+    Three signals are compared with their thresholds: the number of requests
+    waiting for upstream (rate limit tokens and concurrency slots), the lag of
+    the event loop (how late a periodic timer fires, smoothed) and the smoothed
+    upstream latency. The highest of the three ratios is the load. Work is
+    shed by priority as the load rises:
+
+    - shed_bulk: load of 1 or more, bulk requests are rejected
+    - shed_background: load of 1.5 or more, background requests as well
+    - shed_interactive: load of 2 or more, new tool calls as well
+
+    Failing fast keeps the queues short, so the calls that are accepted still
+    finish in time instead of all of them timing out together.
+    """
+
+    NORMAL = "normal"
+    SHED_BULK = "shed_bulk"
+    SHED_BACKGROUND = "shed_background"
+    SHED_INTERACTIVE = "shed_interactive"
+    LEVELS = (NORMAL, SHED_BULK, SHED_BACKGROUND, SHED_INTERACTIVE)
+
+    # Load at which each level starts
+    THRESHOLDS = {SHED_BULK: 1.0, SHED_BACKGROUND: 1.5, SHED_INTERACTIVE: 2.0}
+    # Lanes whose new work is rejected at each level
+    _SHED_LANES = {
+        SHED_BULK: (BULK,),
+        SHED_BACKGROUND: (BULK, BACKGROUND),
+        SHED_INTERACTIVE: (BULK, BACKGROUND, INTERACTIVE),
+    }
+
+    def __init__(
+        self,
+        max_queue_depth: int = 50,
+        max_loop_lag: float = 0.25,
+        max_latency: float = 10.0,
+        lag_interval: float = 0.5,
+        smoothing: float = 0.3,
+    ):
+        """
+        Initialize the detector.
+
+        Args:
+            max_queue_depth: Requests waiting for upstream that count as full load.
+            max_loop_lag: Event loop lag in seconds that counts as full load.
+            max_latency: Smoothed upstream latency in seconds that counts as
+                full load.
+            lag_interval: Seconds between two event loop lag samples.
+            smoothing: Weight of a new sample in the smoothed loop lag (EWMA).
+        """
+        self.max_queue_depth = max(1, max_queue_depth)
+        self.max_loop_lag = max_loop_lag
+        self.max_latency = max_latency
+        self.lag_interval = lag_interval
+        self.smoothing = smoothing
+
+        self._queue_depth = 0
+        self._latency = 0.0
+        self._loop_lag = 0.0
+        # Rejected requests per lane
+        self._shed: Dict[str, int] = {
+            lane: 0 for lane in (INTERACTIVE, BACKGROUND, BULK)
+        }
+        # Lag sampling task per event loop
+        self._monitors: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    @property
+    def loop_lag(self) -> float:
+        """Smoothed lag of the event loop in seconds"""
+        return self._loop_lag
+
+    def observe(self, queue_depth: int, latency: Optional[float]) -> None:
+        """Update the upstream signals with the current queue depth and latency"""
+        self._queue_depth = queue_depth
+        self._latency = latency or 0.0
+
+    def ensure_monitor(self) -> None:
+        """Start sampling the lag of the running event loop, once per loop"""
+        loop = asyncio.get_running_loop()
+        task = self._monitors.get(loop)
+        if task is None or task.done():
+            self._monitors[loop] = loop.create_task(self._monitor_loop_lag())
+
+    async def stop_monitor(self) -> None:
+        """Stop sampling the lag of the running event loop, e.g. at shutdown"""
+        task = self._monitors.pop(asyncio.get_running_loop(), None)
+        if task is not None:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    async def _monitor_loop_lag(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.lag_interval)
+            lag = max(time.monotonic() - started - self.lag_interval, 0.0)
+            self._loop_lag += self.smoothing * (lag - self._loop_lag)
+
+    @property
+    def load(self) -> float:
+        """Highest ratio of a signal to its threshold"""
+        return max(
+            self._queue_depth / self.max_queue_depth,
+            self._loop_lag / self.max_loop_lag if self.max_loop_lag > 0 else 0.0,
+            self._latency / self.max_latency if self.max_latency > 0 else 0.0,
+        )
+
+    @property
+    def level(self) -> str:
+        """Current shedding level"""
+        load = self.load
+        current = self.NORMAL
+        for level in self.LEVELS[1:]:
+            if load >= self.THRESHOLDS[level]:
+                current = level
+        return current
+
+    def should_shed(self, lane: str) -> bool:
+        """Check whether new work of a lane is to be rejected, counting it if so"""
+        level = self.level
+        if level == self.NORMAL or lane not in self._SHED_LANES[level]:
+            return False
+        self._shed[lane] += 1
+        return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of the detector state for metrics export"""
+        return {
+            "level": self.level,
+            "load": round(self.load, 2),
+            "queue_depth": self._queue_depth,
+            "loop_lag_ms": round(self._loop_lag * 1000, 1),
+            "latency_ms": round(self._latency * 1000, 1),
+            "shed": dict(self._shed),
+        }
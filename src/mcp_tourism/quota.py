@@ -0,0 +1,189 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
+
+# data.go.kr resets daily quotas at midnight Korea Standard Time
+KST = timezone(timedelta(hours=9))
+
+logger = logging.getLogger(__name__)
+
+
+def key_fingerprint(api_key: str) -> str:
+    """Short, non-reversible identifier of an API key, safe to log and persist"""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:8]
+
+
+def kst_today() -> str:
+    """Current date in Korea Standard Time (YYYY-MM-DD)"""
+    return datetime.now(KST).date().isoformat()
+
+
+class QuotaAccountant:
+    """
+    Counts upstream calls per language service and API key per KST day.
+
+    Every language service of the Tourism API has its own daily quota per key.
+    The share of it used so far maps to a degradation level, which the client
+    uses to save the remaining calls:
+
+    - normal: no restrictions
+    - extended_cache: cached responses are served for longer than their TTL
+    - no_prefetch: additionally, no warm-up, keep-warm or hedged requests
+    - cache_only: only cached responses (fresh or stale) are served
+
+    With a `path`, counters are written to it as JSON at most every
+    `save_interval` seconds and on `save`, so a restart does not forget
+    today's usage. Periodic writes made from an event loop run in a worker
+    thread. Keys are only stored as fingerprints.
+    """
+
+    NORMAL = "normal"
+    EXTENDED_CACHE = "extended_cache"
+    NO_PREFETCH = "no_prefetch"
+    CACHE_ONLY = "cache_only"
+    LEVELS = (NORMAL, EXTENDED_CACHE, NO_PREFETCH, CACHE_ONLY)
+
+    # Share of the daily quota at which each degradation level starts
+    THRESHOLDS = {EXTENDED_CACHE: 0.7, NO_PREFETCH: 0.85, CACHE_ONLY: 0.95}
+
+    def __init__(
+        self,
+        daily_quota: int = 1000,
+        path: Optional[str] = None,
+        save_interval: float = 10.0,
+    ):
+        """
+        Initialize the accountant, loading today's counters from `path`.
+
+        Args:
+            daily_quota: Calls allowed per service and key per day.
+            path: JSON file the counters are persisted to. None keeps them in memory.
+            save_interval: Minimum seconds between two writes of the file.
+        """
+        self.daily_quota = max(1, daily_quota)
+        self.path = path
+        self.save_interval = save_interval
+
+        self._day = kst_today()
+        # Calls of the day keyed by "<service>:<key fingerprint>"
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        # Serializes writes, so an older snapshot never replaces a newer one
+        self._save_lock = threading.Lock()
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self._load()
+
+    @staticmethod
+    def _counter_key(service: str, api_key: str) -> str:
+        return f"{service}:{key_fingerprint(api_key)}"
+
+    def _roll_over(self) -> None:
+        """Reset the counters once midnight KST has passed. Caller holds _lock."""
+        today = kst_today()
+        if today != self._day:
+            self._day = today
+            self._counts.clear()
+            self._dirty = True
+
+    def record(self, service: str, api_key: str) -> None:
+        """Count one upstream call"""
+        with self._lock:
+            self._roll_over()
+            counter_key = self._counter_key(service, api_key)
+            self._counts[counter_key] = self._counts.get(counter_key, 0) + 1
+            self._dirty = True
+            due = (
+                self.path is not None
+                and time.monotonic() - self._last_save >= self.save_interval
+            )
+            if due:
+                self._last_save = time.monotonic()
+        if not due:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.save()
+        else:
+            # Keep the file write off the event loop
+            loop.run_in_executor(None, self.save)
+
+    def used(self, service: str, api_key: str) -> int:
+        """Calls made today with a key on a service"""
+        with self._lock:
+            self._roll_over()
+            return self._counts.get(self._counter_key(service, api_key), 0)
+
+    def _level_for(self, used: int) -> str:
+        usage = used / self.daily_quota
+        current = self.NORMAL
+        for level in self.LEVELS[1:]:
+            if usage >= self.THRESHOLDS[level]:
+                current = level
+        return current
+
+    def level(self, service: str, api_key: str) -> str:
+        """Degradation level of a service and key"""
+        return self._level_for(self.used(service, api_key))
+
+    def is_at_least(self, service: str, api_key: str, level: str) -> bool:
+        """Check whether a service and key have reached a degradation level"""
+        return self.LEVELS.index(self.level(service, api_key)) >= self.LEVELS.index(
+            level
+        )
+
+    def _load(self) -> None:
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read quota counters from {self.path}: {e}")
+            return
+        if isinstance(data, dict) and data.get("day") == self._day:
+            self._counts = {str(k): int(v) for k, v in data.get("counts", {}).items()}
+
+    def save(self) -> None:
+        """Write the counters to `path` if they changed since the last write"""
+        with self._save_lock:
+            with self._lock:
+                self._last_save = time.monotonic()
+                if not self.path or not self._dirty:
+                    return
+                data = {"day": self._day, "counts": dict(self._counts)}
+                self._dirty = False
+            try:
+                directory = os.path.dirname(os.path.abspath(self.path))
+                os.makedirs(directory, exist_ok=True)
+                # Write to a temporary file first so a crash never leaves half
+                # a file
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                logger.warning(f"Could not write quota counters to {self.path}: {e}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of today's usage for metrics export"""
+        with self._lock:
+            self._roll_over()
+            counts = dict(self._counts)
+        services = {
+            counter_key: {
+                "used": used,
+                "remaining": max(self.daily_quota - used, 0),
+                "level": self._level_for(used),
+            }
+            for counter_key, used in counts.items()
+        }
+        return {"day": self._day, "daily_quota": self.daily_quota, "services": services}
@@ -0,0 +1,331 @@
+import random
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Type
+
+from tenacity import AsyncRetrying, RetryCallState
+
+
+class CircuitBreaker:
+    """
+    Error-rate circuit breaker with half-open probing.
+
+    While closed, the outcomes of the last `window_size` calls are tracked and
+    the breaker opens once at least `minimum_calls` of them have been recorded
+    and the share of failures reaches `failure_rate_threshold`. An open breaker
+    rejects every call for `reset_timeout` seconds and then turns half-open,
+    letting a single probe through: a successful probe closes the breaker, a
+    failed one opens it again for another `reset_timeout`.
+
+    The breaker only keeps counters, so it can be shared across event loops.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window_size: int = 20,
+        reset_timeout: float = 30.0,
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_rate_threshold: Failure share (0-1) of the window that opens the breaker.
+            minimum_calls: Calls that must be recorded before the rate is evaluated.
+            window_size: Number of most recent calls the failure rate is taken over.
+            reset_timeout: Seconds the breaker stays open before probing.
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.reset_timeout = reset_timeout
+
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        """Current state; an open breaker turns half-open once its timeout elapsed"""
+        if (
+            self._state == self.OPEN
+            and time.monotonic() - self._opened_at >= self.reset_timeout
+        ):
+            self._state = self.HALF_OPEN
+            self._probe_in_flight = False
+        return self._state
+
+    @property
+    def failure_rate(self) -> float:
+        """Share of failures among the recorded calls of the window"""
+        if not self._outcomes:
+            return 0.0
+        return self._outcomes.count(False) / len(self._outcomes)
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open breaker lets a probe through"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(self.reset_timeout - (time.monotonic() - self._opened_at), 0.0)
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may proceed.
+
+        Every allowed call must be finished with `record_success`,
+        `record_failure` or `release`, so a half-open probe slot is freed.
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return True
+        if state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call"""
+        if self._state == self.HALF_OPEN:
+            self._close()
+            return
+        self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker when the threshold is reached"""
+        if self._state == self.HALF_OPEN:
+            self._open()
+            return
+        self._outcomes.append(False)
+        if (
+            self._state == self.CLOSED
+            and len(self._outcomes) >= self.minimum_calls
+            and self.failure_rate >= self.failure_rate_threshold
+        ):
+            self._open()
+
+    def release(self) -> None:
+        """Finish an allowed call whose outcome says nothing about upstream health"""
+        if self._state == self.HALF_OPEN:
+            self._probe_in_flight = False
+
+    def _open(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+
+    def _close(self) -> None:
+        self._state = self.CLOSED
+        self._outcomes.clear()
+        self._probe_in_flight = False
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of the breaker state for metrics export"""
+        return {
+            "state": self.state,
+            "failure_rate": round(self.failure_rate, 3),
+            "calls": len(self._outcomes),
+            "retry_after": round(self.retry_after, 1),
+        }
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date.
+
+    Returns:
+        Seconds to wait (never negative), or None if the value is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+class RetryBudget:
+    """
+    Caps retries (or other extra calls such as hedged requests) at a share of
+    recent traffic.
+
+    Over a sliding `window`, retries may not exceed `ratio` times the number of
+    requests plus a small reserve of `min_retries_per_second`, which lets
+    retries through while traffic is low. When upstream is down every request
+    fails, so without a budget each one would turn into `max_attempts` calls;
+    with it the extra load stays around `ratio`.
+
+    The budget only keeps timestamps, so it can be shared across event loops.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 0.5,
+        window: float = 10.0,
+    ):
+        """
+        Initialize the budget.
+
+        Args:
+            ratio: Retries allowed per request issued within the window.
+            min_retries_per_second: Retries allowed regardless of traffic.
+            window: Seconds of traffic the budget is computed over.
+        """
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = window
+
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def _trim(self, now: float) -> None:
+        for timestamps in (self._requests, self._retries):
+            while timestamps and now - timestamps[0] > self.window:
+                timestamps.popleft()
+
+    @property
+    def available(self) -> int:
+        """Number of retries that may currently be spent"""
+        self._trim(time.monotonic())
+        allowed = (
+            self.ratio * len(self._requests) + self.min_retries_per_second * self.window
+        )
+        return max(int(allowed) - len(self._retries), 0)
+
+    def record_request(self) -> None:
+        """Record a first attempt, which adds `ratio` retries to the budget"""
+        self._requests.append(time.monotonic())
+
+    def try_spend(self) -> bool:
+        """Withdraw one retry from the budget, returning False if it is exhausted"""
+        if self.available <= 0:
+            return False
+        self._retries.append(time.monotonic())
+        return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Snapshot of the budget for metrics export"""
+        available = self.available
+        return {
+            "requests": len(self._requests),
+            "retries": len(self._retries),
+            "available": available,
+        }
+
+
+class RetryPolicy:
+    """
+    Retry policy with decorrelated jitter, Retry-After support and a retry budget.
+
+    Each delay is drawn uniformly between `base_delay` and three times the
+    previous delay, capped at `max_delay` (decorrelated jitter), so clients
+    that failed together do not retry in lockstep. A Retry-After hint carried
+    by the error (its `retry_after` attribute) is used as the lower bound of
+    the delay; if it asks for more than `max_delay` the call is not retried at
+    all. Every retry is withdrawn from the shared `RetryBudget`, and no retry
+    is made whose delay would end past the deadline of the call.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        retry_on: Tuple[Type[BaseException], ...] = (),
+        budget: Optional[RetryBudget] = None,
+        on_retry: Optional[Callable[[BaseException, float], None]] = None,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            max_attempts: Maximum number of attempts, including the first one.
+            base_delay: Minimum delay between attempts in seconds.
+            max_delay: Maximum delay between attempts in seconds.
+            retry_on: Exception types that are worth retrying.
+            budget: Retry budget shared by all calls using this policy.
+            on_retry: Called with the error and the delay before each retry.
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max(base_delay, max_delay)
+        self.retry_on = retry_on
+        self.budget = budget if budget is not None else RetryBudget()
+        self.on_retry = on_retry
+
+    def retrying(self, deadline: Optional[float] = None) -> AsyncRetrying:
+        """
+        Build a tenacity controller applying this policy to one call.
+
+        Args:
+            deadline: Absolute time.monotonic() by which the call must finish.
+        """
+        return AsyncRetrying(
+            stop=lambda retry_state: self._should_stop(retry_state, deadline),
+            wait=self._wait,
+            retry=self._should_retry,
+            before_sleep=self._before_sleep,
+            reraise=True,
+        )
+
+    @staticmethod
+    def _retry_after(retry_state: RetryCallState) -> Optional[float]:
+        assert retry_state.outcome is not None
+        return getattr(retry_state.outcome.exception(), "retry_after", None)
+
+    def _should_retry(self, retry_state: RetryCallState) -> bool:
+        assert retry_state.outcome is not None
+        error = retry_state.outcome.exception()
+        if error is None or not isinstance(error, self.retry_on):
+            return False
+        retry_after = self._retry_after(retry_state)
+        return retry_after is None or retry_after <= self.max_delay
+
+    def _should_stop(
+        self, retry_state: RetryCallState, deadline: Optional[float] = None
+    ) -> bool:
+        # Runs after `_wait`, so `upcoming_sleep` holds the delay chosen for
+        # the next attempt. The budget is only withdrawn from once every other
+        # check has passed, so a retry that is not made costs nothing.
+        if retry_state.attempt_number >= self.max_attempts:
+            return True
+        if (
+            deadline is not None
+            and time.monotonic() + retry_state.upcoming_sleep >= deadline
+        ):
+            return True
+        return not self.budget.try_spend()
+
+    def _wait(self, retry_state: RetryCallState) -> float:
+        # `upcoming_sleep` still holds the previous delay at this point
+        previous = max(retry_state.upcoming_sleep, self.base_delay)
+        delay = min(self.max_delay, random.uniform(self.base_delay, previous * 3))
+        retry_after = self._retry_after(retry_state)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def _before_sleep(self, retry_state: RetryCallState) -> None:
+        if self.on_retry is not None and retry_state.outcome is not None:
+            error = retry_state.outcome.exception()
+            if error is not None:
+                self.on_retry(error, retry_state.upcoming_sleep)
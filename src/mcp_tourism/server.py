@@ -6,39 +6,131 @@ import signal
 import asyncio
 import argparse
 import sys
-from typing import Dict, Any, Optional
+import time
+from contextlib import asynccontextmanager, suppress
+from contextvars import ContextVar
+from typing import Annotated, AsyncIterator, Dict, Any, Optional
+from cachetools import LRUCache
 from fastmcp import FastMCP
-from mcp_tourism.api_client import KoreaTourismApiClient, CONTENTTYPE_ID_MAP
+from fastmcp.server.dependencies import get_http_headers, get_http_request
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+from fastmcp.utilities.types import get_cached_typeadapter
+from mcp import McpError
+from mcp.types import ErrorData
+from pydantic import Field
+from mcp_tourism.admission import AdmissionRejected, FairScheduler
+from mcp_tourism.api_client import (
+    AREA_CODE_MAP,
+    CONTENTTYPE_ID_MAP,
+    KoreaTourismApiClient,
+)
+from mcp_tourism.concurrency import BULK, request_lane
+from mcp_tourism.geo import (
+    distance_matrix,
+    grid_clusters,
+    item_point,
+    order_stops,
+    validate_point,
+)
+from mcp_tourism.memo import ToolResultMemo, collect_cache_keys, memo_key
+from mcp_tourism.overload import LoadShedder
 import logging
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 
-# Create an MCP server
-mcp = FastMCP(
-    name="Korea Tourism API",
-    dependencies=["httpx", "cachetools", "tenacity", "ratelimit"],
-)
-
 # Configure basic logging
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
 
+# Lifespan state. HTTP transports enter the lifespan once per session, so the
+# keep-warm task is shared and stopped, together with the load shedder's lag
+# monitor, when the last session ends.
+_lifespan_sessions = 0
+_keepalive_task: Optional[asyncio.Task] = None
+
+
+@asynccontextmanager
+async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Optionally pre-warm upstream connections while the server is running.
+
+    Reads configuration from environment variables:
+    - MCP_TOURISM_WARMUP_CONNECTIONS: keepalive connections to open at startup
+      (default: 0, which disables warm-up)
+    - MCP_TOURISM_KEEPALIVE_INTERVAL: seconds of idleness before the warm
+      connections are pinged again (default: 60)
+
+    Background tasks of the API client are stopped when the last session ends.
+    """
+    global _lifespan_sessions, _keepalive_task
+    connections = int(os.environ.get("MCP_TOURISM_WARMUP_CONNECTIONS", 0))
+
+    _lifespan_sessions += 1
+    try:
+        if connections > 0 and _keepalive_task is None:
+            interval = float(os.environ.get("MCP_TOURISM_KEEPALIVE_INTERVAL", 60))
+            try:
+                client = get_api_client()
+                _keepalive_task = asyncio.create_task(
+                    client.keep_warm(connections, interval)
+                )
+                # Bounded so a slow upstream cannot hold up the MCP handshake
+                await asyncio.wait_for(client.warm_up(connections), timeout=10.0)
+            except Exception as e:
+                logger.warning(f"Connection warm-up failed: {e}")
+        yield {}
+    finally:
+        _lifespan_sessions -= 1
+        if _lifespan_sessions == 0:
+            if _keepalive_task is not None:
+                _keepalive_task.cancel()
+                with suppress(asyncio.CancelledError):
+                    await _keepalive_task
+                _keepalive_task = None
+            if _api_client is not None:
+                await _api_client.stop_load_monitor()
+
+
+# Create an MCP server
+mcp = FastMCP(
+    name="Korea Tourism API",
+    dependencies=["httpx", "cachetools", "tenacity"],
+    lifespan=server_lifespan,
+)
+
 # Lazy initialization of the API client
 _api_client: Optional[KoreaTourismApiClient] = None
 
+# Multi-tenant mode: header carrying a tenant's service key, and the clients
+# created for recently seen keys (None while the mode is off)
+_tenant_header: Optional[str] = None
+_tenant_clients: Optional[LRUCache] = None
+
 
 def get_api_client() -> KoreaTourismApiClient:
     """
     Lazily initialize the API client only when needed.
     Reads configuration from environment variables.
+
+    In multi-tenant mode (MCP_TOURISM_MULTI_TENANT) over HTTP transports, a
+    request carrying a service key in the tenant header gets a client for
+    that key, sharing cache and connections with the default client.
     """
-    global _api_client
+    global _api_client, _tenant_header, _tenant_clients
     if _api_client is None:
-        # Get API key from environment variable
-        api_key = os.environ.get("KOREA_TOURISM_API_KEY")
+        # Get API key from environment variable, plus an optional pool of keys
+        # (comma-separated) that upstream calls are spread across
+        api_keys = [
+            key.strip()
+            for key in os.environ.get("KOREA_TOURISM_API_KEYS", "").split(",")
+            if key.strip()
+        ]
+        api_key = os.environ.get("KOREA_TOURISM_API_KEY") or (
+            api_keys[0] if api_keys else None
+        )
 
         if not api_key:
             logger.warning(
@@ -50,15 +142,87 @@ def get_api_client() -> KoreaTourismApiClient:
         # Get configuration from environment variables with defaults
         default_language = os.environ.get("MCP_TOURISM_DEFAULT_LANGUAGE", "en")
         cache_ttl = int(os.environ.get("MCP_TOURISM_CACHE_TTL", 86400))
+        count_cache_ttl = int(os.environ.get("MCP_TOURISM_COUNT_CACHE_TTL", 604800))
         rate_limit_calls = int(os.environ.get("MCP_TOURISM_RATE_LIMIT_CALLS", 5))
         rate_limit_period = int(os.environ.get("MCP_TOURISM_RATE_LIMIT_PERIOD", 1))
         concurrency_limit = int(os.environ.get("MCP_TOURISM_CONCURRENCY_LIMIT", 10))
+        min_concurrency = int(os.environ.get("MCP_TOURISM_CONCURRENCY_MIN", 1))
+        max_concurrency = int(os.environ.get("MCP_TOURISM_CONCURRENCY_MAX", 50))
+        breaker_failure_rate = float(
+            os.environ.get("MCP_TOURISM_BREAKER_FAILURE_RATE", 0.5)
+        )
+        breaker_minimum_calls = int(
+            os.environ.get("MCP_TOURISM_BREAKER_MINIMUM_CALLS", 10)
+        )
+        breaker_reset_timeout = float(
+            os.environ.get("MCP_TOURISM_BREAKER_RESET_TIMEOUT", 30)
+        )
+        retry_attempts = int(os.environ.get("MCP_TOURISM_RETRY_ATTEMPTS", 3))
+        retry_base_delay = float(os.environ.get("MCP_TOURISM_RETRY_BASE_DELAY", 0.5))
+        retry_max_delay = float(os.environ.get("MCP_TOURISM_RETRY_MAX_DELAY", 10))
+        retry_budget_ratio = float(
+            os.environ.get("MCP_TOURISM_RETRY_BUDGET_RATIO", 0.2)
+        )
+        hedge_requests = os.environ.get(
+            "MCP_TOURISM_HEDGE_REQUESTS", "false"
+        ).lower() in ("1", "true", "yes")
+        hedge_budget_ratio = float(
+            os.environ.get("MCP_TOURISM_HEDGE_BUDGET_RATIO", 0.1)
+        )
+        shed_queue_depth = int(os.environ.get("MCP_TOURISM_SHED_QUEUE_DEPTH", 50))
+        shed_loop_lag = float(os.environ.get("MCP_TOURISM_SHED_LOOP_LAG", 0.25))
+        shed_latency = float(os.environ.get("MCP_TOURISM_SHED_LATENCY", 10))
+        multi_tenant = os.environ.get("MCP_TOURISM_MULTI_TENANT", "false").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        max_tenants = int(os.environ.get("MCP_TOURISM_MAX_TENANTS", 100))
+        daily_quota = int(os.environ.get("MCP_TOURISM_DAILY_QUOTA", 1000))
+        quota_file = os.path.expanduser(os.environ.get("MCP_TOURISM_QUOTA_FILE", ""))
 
         logger.info("Initializing KoreaTourismApiClient with:")
         logger.info(f"  Default Language: {default_language}")
-        logger.info(f"  Cache TTL: {cache_ttl}s")
-        logger.info(f"  Rate Limit: {rate_limit_calls} calls / {rate_limit_period}s")
-        logger.info(f"  Concurrency Limit: {concurrency_limit}")
+        logger.info(f"  Cache TTL: {cache_ttl}s (counts {count_cache_ttl}s)")
+        logger.info(
+            f"  Rate Limit: {rate_limit_calls} calls / {rate_limit_period}s per key"
+        )
+        if api_keys:
+            logger.info(f"  API Keys: {len({api_key, *api_keys})} in rotation")
+        logger.info(
+            f"  Concurrency Limit: {concurrency_limit} "
+            f"(adaptive, {min_concurrency}-{max_concurrency})"
+        )
+        logger.info(
+            f"  Circuit Breaker: opens at {breaker_failure_rate:.0%} errors "
+            f"(min {breaker_minimum_calls} calls), probes after {breaker_reset_timeout}s"
+        )
+        logger.info(
+            f"  Retries: up to {retry_attempts} attempts, "
+            f"{retry_base_delay}-{retry_max_delay}s jittered delay, "
+            f"budget {retry_budget_ratio:.0%} of traffic"
+        )
+        logger.info(
+            f"  Daily Quota: {daily_quota} calls per service"
+            + (f", counters in {quota_file}" if quota_file else "")
+        )
+        logger.info(
+            f"  Load Shedding: from {shed_queue_depth} queued requests, "
+            f"{shed_loop_lag}s loop lag or {shed_latency}s upstream latency"
+        )
+        if hedge_requests:
+            logger.info(
+                f"  Hedged Requests: enabled, budget {hedge_budget_ratio:.0%} of traffic"
+            )
+        if multi_tenant:
+            _tenant_header = os.environ.get(
+                "MCP_TOURISM_TENANT_HEADER", "X-Tourism-Api-Key"
+            ).lower()
+            _tenant_clients = LRUCache(maxsize=max_tenants)
+            logger.info(
+                f"  Multi-Tenant: keys from the {_tenant_header} header, "
+                f"up to {max_tenants} tenant clients"
+            )
 
         # Initialize the client
         try:
@@ -69,17 +233,465 @@ def get_api_client() -> KoreaTourismApiClient:
                 rate_limit_calls=rate_limit_calls,
                 rate_limit_period=rate_limit_period,
                 concurrency_limit=concurrency_limit,
+                min_concurrency=min_concurrency,
+                max_concurrency=max_concurrency,
+                breaker_failure_rate=breaker_failure_rate,
+                breaker_minimum_calls=breaker_minimum_calls,
+                breaker_reset_timeout=breaker_reset_timeout,
+                retry_attempts=retry_attempts,
+                retry_base_delay=retry_base_delay,
+                retry_max_delay=retry_max_delay,
+                retry_budget_ratio=retry_budget_ratio,
+                hedge_requests=hedge_requests,
+                hedge_budget_ratio=hedge_budget_ratio,
+                daily_quota=daily_quota,
+                quota_file=quota_file or None,
+                api_keys=api_keys,
+                shed_queue_depth=shed_queue_depth,
+                shed_loop_lag=shed_loop_lag,
+                shed_latency=shed_latency,
+                count_cache_ttl=count_cache_ttl,
             )
-            # Trigger initialization check which also validates API key early
-            _api_client._ensure_full_initialization()
+            # Trigger initialization check which also validates API key early.
+            # Tenants bring their own keys, so a server key is optional for them.
+            if not (multi_tenant and api_key == "missing_api_key"):
+                _api_client._ensure_full_initialization()
             logger.info("KoreaTourismApiClient initialized successfully.")
         except ValueError as e:
             logger.error(f"Failed to initialize KoreaTourismApiClient: {e}")
             # Propagate the error so the MCP tool call fails clearly
             raise
+
+    if _tenant_clients is not None and _tenant_header is not None:
+        tenant_key = get_http_headers().get(_tenant_header)
+        if tenant_key:
+            tenant_client = _tenant_clients.get(tenant_key)
+            if tenant_client is None:
+                tenant_client = _api_client.with_api_key(tenant_key)
+                _tenant_clients[tenant_key] = tenant_client
+            return tenant_client
     return _api_client
 
 
+# Fair queuing of tool calls across sessions (None until first configured,
+# False while turned off)
+_scheduler: Optional[FairScheduler | bool] = None
+_fair_queue_by = "session"
+
+
+def get_scheduler() -> Optional[FairScheduler]:
+    """
+    Lazily create the scheduler that admits tool calls of HTTP sessions.
+
+    Reads configuration from environment variables:
+    - MCP_TOURISM_FAIR_QUEUE: "session" (default) queues per MCP session,
+      "ip" per client address, "off" disables fair queuing and admission control
+    - MCP_TOURISM_MAX_CONCURRENT_CALLS: tool calls running at once (default: 16)
+    - MCP_TOURISM_MAX_QUEUED_CALLS: tool calls waiting in total (default: 64)
+    - MCP_TOURISM_MAX_QUEUED_CALLS_PER_SESSION: tool calls waiting per
+      session (default: 8)
+    - MCP_TOURISM_SESSION_RATE: tool calls per second per session (default: 5)
+    - MCP_TOURISM_SESSION_BURST: burst of tool calls per session (default: 10)
+
+    Returns:
+        The scheduler, or None if fair queuing is off.
+    """
+    global _scheduler, _fair_queue_by
+    if _scheduler is None:
+        _fair_queue_by = os.environ.get("MCP_TOURISM_FAIR_QUEUE", "session").lower()
+        if _fair_queue_by not in ("session", "ip", "off"):
+            raise ValueError(
+                f"Invalid MCP_TOURISM_FAIR_QUEUE: '{_fair_queue_by}'. "
+                "Valid values are: session, ip, off"
+            )
+        if _fair_queue_by == "off":
+            _scheduler = False
+        else:
+            _scheduler = FairScheduler(
+                max_concurrent=int(
+                    os.environ.get("MCP_TOURISM_MAX_CONCURRENT_CALLS", 16)
+                ),
+                max_queued=int(os.environ.get("MCP_TOURISM_MAX_QUEUED_CALLS", 64)),
+                max_queued_per_session=int(
+                    os.environ.get("MCP_TOURISM_MAX_QUEUED_CALLS_PER_SESSION", 8)
+                ),
+                session_rate=float(os.environ.get("MCP_TOURISM_SESSION_RATE", 5)),
+                session_burst=int(os.environ.get("MCP_TOURISM_SESSION_BURST", 10)),
+            )
+            logger.info(
+                f"Fair queuing of tool calls per {_fair_queue_by}: "
+                f"{_scheduler.max_concurrent} at once, "
+                f"{_scheduler.session_rate:g}/s per {_fair_queue_by}"
+            )
+    return _scheduler or None
+
+
+def _admission_key(context: MiddlewareContext) -> Optional[str]:
+    """Session or client address a tool call is queued under, None outside HTTP"""
+    if _fair_queue_by == "ip":
+        try:
+            client = get_http_request().client
+        except RuntimeError:
+            return None
+        return client.host if client else None
+    if context.fastmcp_context is None:
+        return None
+    return context.fastmcp_context.session_id
+
+
+class AdmissionMiddleware(Middleware):
+    """
+    Sheds new tool calls under overload and queues the others fairly across
+    HTTP sessions.
+
+    One session paging through results in a tight loop would otherwise take
+    every upstream slot and starve the others. Calls over the limits are
+    rejected with an MCP error right away, so clients can back off instead of
+    waiting ever longer. The stdio transport serves a single client and is
+    passed through.
+    """
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: Any) -> Any:
+        try:
+            client = get_api_client()
+            overloaded = (
+                client.load_level == LoadShedder.SHED_INTERACTIVE
+                and client.should_shed()
+            )
+        except ValueError:
+            # Misconfigured client; let the tool report the error
+            overloaded = False
+        if overloaded:
+            raise McpError(
+                ErrorData(
+                    code=-32000,
+                    message="Server overloaded: new tool calls are shed. Retry later.",
+                )
+            )
+
+        scheduler = get_scheduler()
+        key = _admission_key(context) if scheduler is not None else None
+        if scheduler is None or key is None:
+            return await call_next(context)
+        try:
+            await scheduler.acquire(key)
+        except AdmissionRejected as e:
+            message = f"Server busy: {e}."
+            if e.retry_after is not None:
+                message += f" Retry after {e.retry_after:.1f}s."
+            raise McpError(ErrorData(code=-32000, message=message)) from e
+        try:
+            return await call_next(context)
+        finally:
+            scheduler.release()
+
+
+# Memo of final tool results (None until first configured, False while off)
+_tool_memo: Optional[ToolResultMemo | bool] = None
+
+
+def get_tool_memo() -> Optional[ToolResultMemo]:
+    """
+    Lazily create the memo of final tool results.
+
+    Reads configuration from environment variables:
+    - MCP_TOURISM_TOOL_MEMO: memoize tool results (default: false)
+    - MCP_TOURISM_TOOL_MEMO_SIZE: tool results kept (default: 1000)
+
+    Returns:
+        The memo, or None if memoization is off.
+    """
+    global _tool_memo
+    if _tool_memo is None:
+        enabled = os.environ.get("MCP_TOURISM_TOOL_MEMO", "false").lower() in (
+            "1",
+            "true",
+            "yes",
+        )
+        if enabled:
+            _tool_memo = ToolResultMemo(
+                maxsize=int(os.environ.get("MCP_TOURISM_TOOL_MEMO_SIZE", 1000))
+            )
+            logger.info(f"Tool result memo: up to {_tool_memo.maxsize} results")
+        else:
+            _tool_memo = False
+    return _tool_memo or None
+
+
+class ToolMemoMiddleware(Middleware):
+    """
+    Serves repeated tool calls from the memo of final, serialized results.
+
+    A result is memoized with the client cache entries it was built from and
+    dropped as soon as one of them expires. Memo hits skip admission control,
+    as they cost no upstream work.
+    """
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next: Any) -> Any:
+        memo = get_tool_memo()
+        if memo is None:
+            return await call_next(context)
+        client = get_api_client()
+        key = memo_key(context.message.name, context.message.arguments)
+        result = memo.get(key, client.is_cached)
+        if result is not None:
+            return result
+        with collect_cache_keys() as cache_keys:
+            result = await call_next(context)
+        memo.put(key, result, cache_keys, client.is_cached)
+        return result
+
+
+mcp.add_middleware(ToolMemoMiddleware())
+mcp.add_middleware(AdmissionMiddleware())
+
+
+def _content_type_id(content_type: Optional[str]) -> Optional[str]:
+    """
+    Look up the ID of a content type name.
+
+    Raises:
+        ValueError: If the name is not a known content type.
+    """
+    if not content_type:
+        return None
+    content_type_id = next(
+        (k for k, v in CONTENTTYPE_ID_MAP.items() if v.lower() == content_type.lower()),
+        None,
+    )
+    if content_type_id is None:
+        valid_types = ", ".join(CONTENTTYPE_ID_MAP.values())
+        raise ValueError(
+            f"Invalid content_type: '{content_type}'. Valid types are: {valid_types}"
+        )
+    return content_type_id
+
+
+def _arrange(sort_by: str) -> str:
+    """
+    Look up the upstream arrange value of a sort order.
+
+    Raises:
+        ValueError: If the sort order is not supported.
+    """
+    arrange = KoreaTourismApiClient.SORT_ARRANGE.get(sort_by)
+    if arrange is None:
+        valid = ", ".join(KoreaTourismApiClient.SORT_ARRANGE)
+        raise ValueError(f"Invalid sort_by: '{sort_by}'. Valid values are: {valid}")
+    return arrange
+
+
+def _area_codes(
+    area_codes: list[str] | str, area_code: Optional[str], sigungu_code: Optional[str]
+) -> List[str]:
+    """
+    Resolve the area_codes argument of a tool to a list of top-level codes.
+
+    Raises:
+        ValueError: If area_code or sigungu_code is given as well.
+    """
+    if area_code or sigungu_code:
+        raise ValueError("area_codes cannot be combined with area_code or sigungu_code")
+    if isinstance(area_codes, str):
+        if area_codes.strip().lower() == "all":
+            return list(AREA_CODE_MAP)
+        return [code.strip() for code in area_codes.split(",") if code.strip()]
+    return list(area_codes)
+
+
+async def _fetch_detailed_information(
+    client: KoreaTourismApiClient,
+    content_id: str,
+    content_type_id: Optional[str],
+    language: Optional[str],
+    deadline: Optional[float],
+) -> Dict[str, Any]:
+    """
+    Fetch and combine the common, intro and additional details of an item.
+
+    The intro and additional details need the content type and are only
+    fetched with one. The up to three requests are independent and run
+    concurrently.
+    """
+    requests = [
+        client.get_detail_common(
+            content_id=content_id, language=language, deadline=deadline
+        )
+    ]
+    if content_type_id:
+        requests += [
+            client.get_detail_intro(
+                content_id=content_id,
+                content_type_id=content_type_id,
+                language=language,
+                deadline=deadline,
+            ),
+            client.get_detail_info(
+                content_id=content_id,
+                content_type_id=content_type_id,
+                language=language,
+                deadline=deadline,
+            ),
+        ]
+    common_details, *type_details = await asyncio.gather(*requests)
+
+    # Get intro and additional details if content_type_id is provided
+    intro_details: Dict[str, Any] = {}
+    additional_details: Dict[str, Any] = {}
+    if type_details:
+        intro_result, additional_result = type_details
+        intro_details = (
+            intro_result.get("items", [{}])[0] if intro_result.get("items") else {}
+        )
+        additional_details = {"additional_info": additional_result.get("items", [])}
+
+    # Combine all details
+    item = common_details.get("items", [{}])[0] if common_details.get("items") else {}
+    return {**item, **intro_details, **additional_details}
+
+
+# The enrich parameter of the list tools, described once for all of them
+EnrichFields = Annotated[
+    list[str] | None,
+    Field(
+        description=(
+            "Detail fields to merge into each item, e.g. "
+            '["overview", "usetime"]. "overview", "homepage", "telname" and '
+            '"zipcode" come from the common details, other fields from the '
+            "type-specific intro details. The details of all items are fetched "
+            "concurrently; items that could not be enriched are listed under "
+            '"enrich_errors" by content ID.'
+        )
+    ),
+]
+
+# Fields only detailCommon2 has; any other field enrich asks for is looked up
+# in detailIntro2, whose fields depend on the content type
+COMMON_DETAIL_FIELDS = {"overview", "homepage", "telname", "zipcode"}
+
+
+async def _enrich_items(
+    client: KoreaTourismApiClient,
+    result: Dict[str, Any],
+    fields: List[str],
+    language: Optional[str],
+    deadline: Optional[float],
+) -> Dict[str, Any]:
+    """
+    Merge the requested detail fields into the items of a list result.
+
+    The details of all items are fetched concurrently, at most
+    MCP_TOURISM_ENRICH_CONCURRENCY items at a time, so the result takes about
+    one upstream round trip. detailCommon2 and detailIntro2 are only asked when
+    a requested field comes from them, and cached details are reused. Once an
+    item has its turn, its detail requests get MCP_TOURISM_ENRICH_TIMEOUT
+    seconds, within the deadline of the tool call, so a slow item does not
+    hold its turn for the whole call while items waiting for a turn are not
+    charged for the wait. Items whose details could not be fetched keep their
+    list fields and are reported under "enrich_errors" by content ID.
+    """
+    common = any(field in COMMON_DETAIL_FIELDS for field in fields)
+    intro = any(field not in COMMON_DETAIL_FIELDS for field in fields)
+    limit = asyncio.Semaphore(
+        max(1, int(os.environ.get("MCP_TOURISM_ENRICH_CONCURRENCY", 10)))
+    )
+    timeout = float(os.environ.get("MCP_TOURISM_ENRICH_TIMEOUT", 5))
+
+    async def details(item: Dict[str, Any]) -> Dict[str, Any]:
+        content_id = item["contentid"]
+        content_type_id = item.get("contenttypeid")
+        async with limit:
+            # The item's time starts once it has its turn
+            item_deadline = deadline
+            if timeout > 0:
+                item_deadline = min(
+                    deadline if deadline is not None else float("inf"),
+                    time.monotonic() + timeout,
+                )
+            requests = []
+            if common:
+                requests.append(
+                    client.get_detail_common(
+                        content_id=content_id,
+                        language=language,
+                        deadline=item_deadline,
+                    )
+                )
+            if intro and content_type_id:
+                requests.append(
+                    client.get_detail_intro(
+                        content_id=content_id,
+                        content_type_id=content_type_id,
+                        language=language,
+                        deadline=item_deadline,
+                    )
+                )
+            responses = await asyncio.gather(*requests)
+        merged: Dict[str, Any] = {}
+        for response in responses:
+            merged.update((response.get("items") or [{}])[0])
+        return {field: merged[field] for field in fields if field in merged}
+
+    targets = [item for item in result.get("items", []) if item.get("contentid")]
+    fetched = await asyncio.gather(
+        *(details(item) for item in targets), return_exceptions=True
+    )
+    details_by_id: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, str] = {}
+    for item, outcome in zip(targets, fetched):
+        if isinstance(outcome, BaseException):
+            if not isinstance(outcome, Exception):
+                raise outcome
+            errors[item["contentid"]] = str(outcome) or type(outcome).__name__
+        else:
+            details_by_id[item["contentid"]] = outcome
+    # The list items belong to a cached response, so merge into copies
+    items = [
+        {**item, **details_by_id.get(item.get("contentid"), {})}
+        for item in result.get("items", [])
+    ]
+    return {**result, "items": items, "enrich_errors": errors}
+
+
+# Deadline of the enclosing tool call, shared by the tools multi_query runs
+_shared_deadline: ContextVar[Optional[float]] = ContextVar(
+    "shared_deadline", default=None
+)
+
+
+def _filter_fields(item: Dict[str, Any], filter: List[str]) -> Dict[str, Any]:
+    """Keep only the whitelisted keys of an item, including its localized fields"""
+    filtered = {k: v for k, v in item.items() if k in filter}
+    if "localized" in item:
+        filtered["languages"] = item["languages"]
+        filtered["localized"] = {
+            lang: {k: v for k, v in fields.items() if k in filter}
+            for lang, fields in item["localized"].items()
+        }
+    return filtered
+
+
+def _tool_deadline() -> Optional[float]:
+    """
+    Deadline for the upstream work of a tool call.
+
+    MCP clients give up on tool calls after a while; past that point nobody
+    reads the result, so the client stops retrying and waiting for rate limit
+    tokens or concurrency slots. Tools run by multi_query share its deadline.
+
+    Returns:
+        Absolute time.monotonic() deadline, or None if MCP_TOURISM_TOOL_TIMEOUT
+        is 0 or less.
+    """
+    shared = _shared_deadline.get()
+    if shared is not None:
+        return shared
+    timeout = float(os.environ.get("MCP_TOURISM_TOOL_TIMEOUT", 50))
+    if timeout <= 0:
+        return None
+    return time.monotonic() + timeout
+
+
 # Resource cleanup functions
 def cleanup_resources():
     """
@@ -88,43 +700,23 @@ def cleanup_resources():
     """
     logger.info("Cleaning up resources...")
     try:
-        # Try to get the current event loop
         try:
-            loop = asyncio.get_event_loop()
-            # Check if the loop is closed
-            if loop.is_closed():
-                logger.info("Event loop is already closed, skipping async cleanup")
-                return
+            loop = asyncio.get_running_loop()
         except RuntimeError:
-            # No event loop exists - this is common during process shutdown
-            logger.info("No event loop available, creating temporary loop for cleanup")
-            try:
-                # Create a temporary event loop for cleanup
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(
-                        KoreaTourismApiClient.close_all_connections()
-                    )
-                    logger.info("Resources cleaned up successfully.")
-                finally:
-                    loop.close()
-                return
-            except Exception as temp_loop_error:
-                logger.warning(f"Temporary loop cleanup failed: {temp_loop_error}")
-                logger.info(
-                    "Skipping resource cleanup - connections will be closed by OS"
-                )
-                return
+            loop = None
 
-        if loop.is_running():
+        if loop is not None:
             # If we're in a running event loop, schedule the cleanup
             # Note: This scenario is tricky - we can't wait for completion
             logger.warning("Event loop is running, scheduling cleanup task")
             loop.create_task(KoreaTourismApiClient.close_all_connections())
         else:
-            # Loop exists and is not running, safe to run_until_complete
-            loop.run_until_complete(KoreaTourismApiClient.close_all_connections())
+            # Shared clients are kept per event loop; close each on its own loop
+            # and drop the ones whose loop has already been closed
+            KoreaTourismApiClient.close_idle_loop_connections()
+
+        if _api_client is not None:
+            _api_client.save_quota()
 
         logger.info("Resources cleaned up successfully.")
     except Exception as e:
@@ -155,6 +747,8 @@ async def search_tourism_by_keyword(
     page: int = 1,
     rows: int = 20,
     filter: List[str] | None = None,
+    languages: List[str] | None = None,
+    enrich: EnrichFields = None,
 ) -> dict:
     """
     Search for tourism information in Korea by keyword.
@@ -206,6 +800,14 @@ async def search_tourism_by_keyword(
         filter (list[str], optional): List of keys to include in each result item (whitelist).
             - If filter is None or an empty list ([]), all fields are returned.
             - If filter contains values, only the specified keys will be included in each item, and all other keys will be removed.
+        languages (list[str], optional): Search in several languages at once
+            (e.g. ["en", "jp"]) instead of `language`. The language services are
+            queried concurrently and items are joined by content ID: fields
+            shared by all languages stay at the top level, text fields go under
+            "localized" per language. The result then has the structure
+            {"languages", "total_count" (per language), "items", "errors"}.
+        enrich (list[str], optional): Detail fields to merge into each item,
+            e.g. ["overview", "usetime"]. Not available with languages.
 
     Returns:
         dict: Search results with structure:
@@ -242,54 +844,55 @@ async def search_tourism_by_keyword(
     Example:
         search_tourism_by_keyword("Gyeongbokgung", "Tourist Attraction", "1", "en", 1, 10)
     """
+    deadline = _tool_deadline()
     # Get the API client lazily
     client = get_api_client()
 
     # Validate and convert content_type
-    content_type_id = None
-    if content_type:
-        content_type_id = next(
-            (
-                k
-                for k, v in CONTENTTYPE_ID_MAP.items()
-                if v.lower() == content_type.lower()
-            ),
-            None,
+    content_type_id = _content_type_id(content_type)
+
+    def search(lang: Optional[str]):
+        return client.search_by_keyword(
+            keyword=keyword,
+            content_type_id=content_type_id,
+            area_code=area_code,
+            language=lang,
+            page=page,
+            rows=rows,
+            deadline=deadline,
         )
-        if content_type_id is None:
-            valid_types = ", ".join(CONTENTTYPE_ID_MAP.values())
-            raise ValueError(
-                f"Invalid content_type: '{content_type}'. Valid types are: {valid_types}"
-            )
+
+    if languages and enrich:
+        raise ValueError("enrich cannot be combined with languages")
 
     # Call the API client and return dict directly
-    result = await client.search_by_keyword(
-        keyword=keyword,
-        content_type_id=content_type_id,
-        area_code=area_code,
-        language=language,
-        page=page,
-        rows=rows,
-    )
+    if languages:
+        result = await client.for_languages(languages, search)
+    else:
+        result = await search(language)
+    if enrich:
+        result = await _enrich_items(client, result, enrich, language, deadline)
+        filter = filter and [*filter, *enrich]
     if filter:
         # Apply additional filtering if provided
-        filter_items = []
-        for item in result.get("items", []):
-            item = {k: v for k, v in item.items() if k in filter}
-            filter_items.append(item)
-        result["items"] = filter_items
+        result["items"] = [
+            _filter_fields(item, filter) for item in result.get("items", [])
+        ]
     return result
 
 
 @mcp.tool
 async def get_tourism_by_area(
-    area_code: str,
+    area_code: str | None = None,
     sigungu_code: str | None = None,
     content_type: str | None = None,
     language: str | None = None,
     page: int = 1,
     rows: int = 20,
     filter: list[str] | None = None,
+    area_codes: list[str] | str | None = None,
+    sort_by: str = "modified",
+    enrich: EnrichFields = None,
 ) -> dict:
     """
     Browse tourism information by geographic areas in Korea.
@@ -299,7 +902,7 @@ async def get_tourism_by_area(
     to find relevant tourism information in a particular region.
 
     Args:
-        area_code (str): Area code. Valid values:
+        area_code (str, optional): Area code, required unless area_codes is given. Valid values:
             - "1" (Seoul)
             - "2" (Incheon)
             - "3" (Daejeon)
@@ -341,6 +944,16 @@ async def get_tourism_by_area(
         filter (list[str], optional): List of keys to include in each result item (whitelist).
             - If filter is None or an empty list ([]), all fields are returned.
             - If filter contains values, only the specified keys will be included in each item, and all other keys will be removed.
+        area_codes (list[str] | str, optional): Several area codes, or "all" for
+            the whole country, instead of area_code. The areas are queried
+            concurrently and merged into one list sorted by sort_by, which is
+            paginated with page and rows. The result also contains
+            "area_codes" and "errors" (areas that could not be fetched).
+        sort_by (str, optional): Sort order of the results (default: "modified"):
+            - "modified" (most recently modified first)
+            - "title" (by name)
+        enrich (list[str], optional): Detail fields to merge into each item,
+            e.g. ["overview", "usetime"].
 
     Returns:
         dict: Area-based tourism information with structure:
@@ -376,33 +989,50 @@ async def get_tourism_by_area(
 
     Example:
         get_tourism_by_area("1", "1", "Tourist Attraction", "en", 1, 20)
+        get_tourism_by_area(area_codes="all", content_type="Festival Event")
     """
+    deadline = _tool_deadline()
+    arrange = _arrange(sort_by)
+    if area_codes is None and not area_code:
+        raise ValueError("Either area_code or area_codes is required")
     # Validate and convert content_type
-    content_type_id = None
-    if content_type:
-        content_type_id = next(
-            (
-                k
-                for k, v in CONTENTTYPE_ID_MAP.items()
-                if v.lower() == content_type.lower()
-            ),
-            None,
-        )
-        if content_type_id is None:
-            valid_types = ", ".join(CONTENTTYPE_ID_MAP.values())
-            raise ValueError(
-                f"Invalid content_type: '{content_type}'. Valid types are: {valid_types}"
-            )
+    content_type_id = _content_type_id(content_type)
 
-    # Call the API client and return dict directly
-    result = await get_api_client().get_area_based_list(
-        area_code=area_code,
-        sigunguCode=sigungu_code,
-        content_type_id=content_type_id,
-        language=language,
-        page=page,
-        rows=rows,
-    )
+    client = get_api_client()
+    if area_codes is not None:
+        codes = _area_codes(area_codes, area_code, sigungu_code)
+        # A nationwide listing is bulk work: it yields to live calls under load
+        with request_lane(BULK):
+            result = await client.merge_areas(
+                codes,
+                lambda code, page_no, page_rows: client.get_area_based_list(
+                    area_code=code,
+                    content_type_id=content_type_id,
+                    language=language,
+                    page=page_no,
+                    rows=page_rows,
+                    deadline=deadline,
+                    arrange=arrange,
+                ),
+                sort_by=sort_by,
+                page=page,
+                rows=rows,
+            )
+    else:
+        # Call the API client and return dict directly
+        result = await client.get_area_based_list(
+            area_code=area_code,
+            sigunguCode=sigungu_code,
+            content_type_id=content_type_id,
+            language=language,
+            page=page,
+            rows=rows,
+            deadline=deadline,
+            arrange=arrange,
+        )
+    if enrich:
+        result = await _enrich_items(client, result, enrich, language, deadline)
+        filter = filter and [*filter, *enrich]
     if filter:
         # Apply additional filtering if provided
         filter_items = []
@@ -423,6 +1053,9 @@ async def find_nearby_attractions(
     page: int = 1,
     rows: int = 20,
     filter: list[str] | None = None,
+    cluster: bool = False,
+    cluster_size_m: int | None = None,
+    enrich: EnrichFields = None,
 ) -> dict:
     """
     Find tourism attractions near a specific location in Korea.
@@ -458,6 +1091,15 @@ async def find_nearby_attractions(
         filter (list[str], optional): List of keys to include in each result item (whitelist).
             - If filter is None or an empty list ([]), all fields are returned.
             - If filter contains values, only the specified keys will be included in each item, and all other keys will be removed.
+        cluster (bool, optional): Group the results for a map instead of paging
+            through them (default: False). All results within the radius (up to
+            5000) are fetched and grouped by the cells of a square grid; the
+            result has "clusters" instead of "items", and page and rows are
+            ignored. filter applies to the items of every cluster.
+        cluster_size_m (int, optional): Side of the grid cells in meters
+            (default: a fifth of the radius, at least 50)
+        enrich (list[str], optional): Detail fields to merge into each item,
+            e.g. ["overview", "usetime"]. Not available with cluster.
 
     Returns:
         dict: Nearby tourism attractions with structure:
@@ -494,26 +1136,47 @@ async def find_nearby_attractions(
 
     Example:
         find_nearby_attractions(126.9780, 37.5665, 1000, "Tourist Attraction", "en", 1, 10)
+        find_nearby_attractions(126.9780, 37.5665, 20000, cluster=True)
+
+    Clustered result:
+        {
+            "total_count": int,     # Items within the radius
+            "search_radius": int,   # Search radius used
+            "cluster_size_m": int,  # Side of the grid cells
+            "truncated": bool,      # Whether items beyond the first 5000 were left out
+            "failed_pages": int,    # Pages that could not be fetched
+            "clusters": [           # Largest first
+                {
+                    "longitude": float,     # Centroid of the cluster
+                    "latitude": float,
+                    "count": int,           # Items in the cluster
+                    "items": [...]          # Up to 3 items closest to the centroid
+                }
+                # ... more clusters
+            ]
+        }
     """
+    deadline = _tool_deadline()
     # Validate and convert content_type
-    content_type_id = None
-    if content_type:
-        content_type_id = next(
-            (
-                k
-                for k, v in CONTENTTYPE_ID_MAP.items()
-                if v.lower() == content_type.lower()
-            ),
-            None,
+    content_type_id = _content_type_id(content_type)
+
+    if cluster and enrich:
+        raise ValueError("enrich cannot be combined with cluster")
+    if cluster:
+        return await _cluster_nearby(
+            longitude,
+            latitude,
+            radius,
+            content_type_id,
+            language,
+            filter,
+            cluster_size_m or max(50, radius // 5),
+            deadline,
         )
-        if content_type_id is None:
-            valid_types = ", ".join(CONTENTTYPE_ID_MAP.values())
-            raise ValueError(
-                f"Invalid content_type: '{content_type}'. Valid types are: {valid_types}"
-            )
 
     # Call the API client and return dict directly
-    results = await get_api_client().get_location_based_list(
+    client = get_api_client()
+    results = await client.get_location_based_list(
         mapx=longitude,
         mapy=latitude,
         radius=radius,
@@ -521,7 +1184,11 @@ async def find_nearby_attractions(
         language=language,
         page=page,
         rows=rows,
+        deadline=deadline,
     )
+    if enrich:
+        results = await _enrich_items(client, results, enrich, language, deadline)
+        filter = filter and [*filter, *enrich]
     # Apply filter if provided
     if filter:
         filter_items = []
@@ -533,6 +1200,258 @@ async def find_nearby_attractions(
     return {**results, "search_radius": radius}
 
 
+async def _cluster_nearby(
+    longitude: float,
+    latitude: float,
+    radius: int,
+    content_type_id: Optional[str],
+    language: Optional[str],
+    filter: Optional[List[str]],
+    cluster_size_m: int,
+    deadline: Optional[float],
+) -> Dict[str, Any]:
+    """Fetch every item within a radius and group them with grid_clusters"""
+    client = get_api_client()
+    # Draining up to 50 pages is bulk work: it yields to live calls under load
+    with request_lane(BULK):
+        result = await client.fetch_all_pages(
+            lambda page, rows: client.get_location_based_list(
+                mapx=longitude,
+                mapy=latitude,
+                radius=radius,
+                content_type_id=content_type_id,
+                language=language,
+                page=page,
+                rows=rows,
+                deadline=deadline,
+            )
+        )
+    clusters = grid_clusters(result["items"], cluster_size_m)
+    if filter:
+        for group in clusters:
+            group["items"] = [
+                {k: v for k, v in item.items() if k in filter}
+                for item in group["items"]
+            ]
+    return {
+        "total_count": result["total_count"],
+        "search_radius": radius,
+        "cluster_size_m": cluster_size_m,
+        "truncated": result["truncated"],
+        "failed_pages": result["failed_pages"],
+        "clusters": clusters,
+    }
+
+
+@mcp.tool
+async def find_attractions_along_route(
+    polyline: list[list[float]],
+    buffer_m: int = 2000,
+    content_type: str | None = None,
+    language: str | None = None,
+    page: int = 1,
+    rows: int = 20,
+    filter: list[str] | None = None,
+) -> dict:
+    """
+    Find tourism attractions along a route in Korea, e.g. for a road trip.
+
+    Unlike find_nearby_attractions, which searches around a single point, this
+    tool searches a corridor along a whole route and lists the results in
+    travel order.
+
+    Args:
+        polyline (list[list[float]]): Points of the route as [longitude, latitude]
+            pairs in travel order, at least two (e.g. [[126.9780, 37.5665],
+            [128.8761, 37.7519]] for Seoul to Gangneung). More points follow
+            the roads more closely.
+        buffer_m (int, optional): Maximum distance from the route in meters
+            (default: 2000, max: 19999). Narrow buffers need more upstream
+            queries; a route needing more than 100 is rejected.
+        content_type (str, optional): Type of content to filter. Same values
+            as for find_nearby_attractions.
+        language (str, optional): Language for results (default: "en"). Same
+            values as for find_nearby_attractions.
+        page (int, optional): Page number for pagination (default: 1, min: 1)
+        rows (int, optional): Number of items per page (default: 20)
+        filter (list[str], optional): List of keys to include in each result item
+            (whitelist). If None or empty, all fields are returned.
+
+    Returns:
+        dict: Attractions along the route with structure:
+        {
+            "total_count": int,         # Items within buffer_m of the route
+            "num_of_rows": int,         # Number of items per page
+            "page_no": int,             # Current page number
+            "route_length_m": int,      # Length of the route in meters
+            "query_count": int,         # Location queries made
+            "query_radius": int,        # Radius of every query in meters
+            "failed_queries": int,      # Queries that failed
+            "truncated_queries": int,   # Queries that hit the 100 item limit;
+                                        # narrow content_type or buffer_m if > 0
+            "items": [                  # Items in travel order
+                {
+                    ...,                        # Same fields as find_nearby_attractions
+                    "distance_along_m": int,    # From the start of the route
+                    "offset_m": int,            # From the route
+                }
+                # ... more items
+            ]
+        }
+
+    Example:
+        find_attractions_along_route([[126.9780, 37.5665], [128.8761, 37.7519]], 3000, "Tourist Attraction")
+    """
+    deadline = _tool_deadline()
+    content_type_id = _content_type_id(content_type)
+    # Up to a hundred queries for one call: bulk work that yields under load
+    with request_lane(BULK):
+        result = await get_api_client().search_along_route(
+            polyline,
+            buffer_m,
+            content_type_id=content_type_id,
+            language=language,
+            deadline=deadline,
+        )
+    page, rows = max(page, 1), max(rows, 1)
+    items = result.pop("items")[(page - 1) * rows : page * rows]
+    if filter:
+        items = [{k: v for k, v in item.items() if k in filter} for item in items]
+    return {**result, "num_of_rows": rows, "page_no": page, "items": items}
+
+
+@mcp.tool
+async def find_in_bbox(
+    min_lon: float,
+    min_lat: float,
+    max_lon: float,
+    max_lat: float,
+    content_type: str | None = None,
+    language: str | None = None,
+    page: int = 1,
+    rows: int = 20,
+    filter: list[str] | None = None,
+) -> dict:
+    """
+    Find tourism attractions within a bounding box in Korea, e.g. a map viewport.
+
+    Use this instead of find_nearby_attractions to list everything visible on
+    a map. Panning the box reuses the queries of the area still in view.
+
+    Args:
+        min_lon (float): Western edge of the box (longitude)
+        min_lat (float): Southern edge of the box (latitude)
+        max_lon (float): Eastern edge of the box (longitude)
+        max_lat (float): Northern edge of the box (latitude). Boxes up to
+            about 60km across are supported.
+        content_type (str, optional): Type of content to filter. Same values
+            as for find_nearby_attractions.
+        language (str, optional): Language for results (default: "en"). Same
+            values as for find_nearby_attractions.
+        page (int, optional): Page number for pagination (default: 1, min: 1)
+        rows (int, optional): Number of items per page (default: 20)
+        filter (list[str], optional): List of keys to include in each result item
+            (whitelist). If None or empty, all fields are returned.
+
+    Returns:
+        dict: Attractions within the box with structure:
+        {
+            "total_count": int,         # Items within the box
+            "num_of_rows": int,         # Number of items per page
+            "page_no": int,             # Current page number
+            "tile_size_m": int,         # Side of the tiles the box was split into
+            "query_count": int,         # Location queries made
+            "failed_queries": int,      # Queries that failed
+            "truncated_queries": int,   # Queries that hit the 100 item limit;
+                                        # narrow content_type or the box if > 0
+            "items": [...]              # Same fields as find_nearby_attractions,
+                                        # closest to the center of the box first
+        }
+
+    Example:
+        find_in_bbox(126.97, 37.55, 127.00, 37.58, "Restaurant")
+    """
+    deadline = _tool_deadline()
+    content_type_id = _content_type_id(content_type)
+    with request_lane(BULK):
+        result = await get_api_client().find_in_bbox(
+            min_lon,
+            min_lat,
+            max_lon,
+            max_lat,
+            content_type_id=content_type_id,
+            language=language,
+            deadline=deadline,
+        )
+    page, rows = max(page, 1), max(rows, 1)
+    items = result.pop("items")[(page - 1) * rows : page * rows]
+    if filter:
+        items = [{k: v for k, v in item.items() if k in filter} for item in items]
+    return {**result, "num_of_rows": rows, "page_no": page, "items": items}
+
+
+@mcp.tool
+async def find_nearest(
+    k: int,
+    longitude: float,
+    latitude: float,
+    content_type: str | None = None,
+    language: str | None = None,
+    filter: list[str] | None = None,
+) -> dict:
+    """
+    Find the k tourism items nearest to a location in Korea.
+
+    Use this for questions like "the 5 closest restaurants": unlike
+    find_nearby_attractions it needs no search radius and always returns the
+    nearest items first. Results of earlier searches nearby are reused, so
+    follow-up questions are often answered without new upstream queries.
+
+    Args:
+        k (int): Number of items to return (1 to 100)
+        longitude (float): Longitude coordinate (e.g., 126.9780 for Seoul)
+        latitude (float): Latitude coordinate (e.g., 37.5665 for Seoul)
+        content_type (str, optional): Type of content to filter. Same values
+            as for find_nearby_attractions.
+        language (str, optional): Language for results (default: "en"). Same
+            values as for find_nearby_attractions.
+        filter (list[str], optional): List of keys to include in each result item
+            (whitelist). If None or empty, all fields are returned.
+
+    Returns:
+        dict: Nearest items with structure:
+        {
+            "total_count": int,     # k, or fewer if there are fewer within 20km
+            "query_count": int,     # Upstream queries made (0 if answered locally)
+            "items": [              # Nearest first
+                {
+                    ...,                # Same fields as find_nearby_attractions
+                    "distance_m": int,  # Distance from the location in meters
+                }
+                # ... more items
+            ]
+        }
+
+    Example:
+        find_nearest(5, 126.9780, 37.5665, "Restaurant")
+    """
+    deadline = _tool_deadline()
+    result = await get_api_client().find_nearest(
+        k,
+        longitude,
+        latitude,
+        content_type_id=_content_type_id(content_type),
+        language=language,
+        deadline=deadline,
+    )
+    if filter:
+        result["items"] = [
+            {key: value for key, value in item.items() if key in filter}
+            for item in result["items"]
+        ]
+    return result
+
+
 @mcp.tool
 async def search_festivals_by_date(
     start_date: str,
@@ -542,6 +1461,7 @@ async def search_festivals_by_date(
     page: int = 1,
     rows: int = 20,
     filter: list[str] | None = None,
+    enrich: EnrichFields = None,
 ) -> dict:
     """
     Find festivals in Korea by date range.
@@ -586,6 +1506,8 @@ async def search_festivals_by_date(
         filter (list[str], optional): List of keys to include in each result item (whitelist).
             - If filter is None or an empty list ([]), all fields are returned.
             - If filter contains values, only the specified keys will be included in each item, and all other keys will be removed.
+        enrich (list[str], optional): Detail fields to merge into each item,
+            e.g. ["overview", "usetime"].
 
     Returns:
         dict: Festivals within the specified date range with structure:
@@ -623,15 +1545,21 @@ async def search_festivals_by_date(
     Example:
         search_festivals_by_date("20250501", "20250531", "1", "en", 1, 20)
     """
+    deadline = _tool_deadline()
     # Call the API client and return dict directly
-    results = await get_api_client().search_festival(
+    client = get_api_client()
+    results = await client.search_festival(
         event_start_date=start_date,
         event_end_date=end_date,
         area_code=area_code,
         language=language,
         page=page,
         rows=rows,
+        deadline=deadline,
     )
+    if enrich:
+        results = await _enrich_items(client, results, enrich, language, deadline)
+        filter = filter and [*filter, *enrich]
     # Apply filter if provided
     if filter:
         filter_items = []
@@ -655,6 +1583,9 @@ async def find_accommodations(
     page: int = 1,
     rows: int = 20,
     filter: list[str] | None = None,
+    area_codes: list[str] | str | None = None,
+    sort_by: str = "modified",
+    enrich: EnrichFields = None,
 ) -> dict:
     """
     Find accommodations in Korea by area.
@@ -697,6 +1628,16 @@ async def find_accommodations(
         filter (list[str], optional): List of keys to include in each result item (whitelist).
             - If filter is None or an empty list ([]), all fields are returned.
             - If filter contains values, only the specified keys will be included in each item, and all other keys will be removed.
+        area_codes (list[str] | str, optional): Several area codes, or "all" for
+            the whole country, instead of area_code. The areas are queried
+            concurrently and merged into one list sorted by sort_by, which is
+            paginated with page and rows. The result also contains
+            "area_codes" and "errors" (areas that could not be fetched).
+        sort_by (str, optional): Sort order of the results (default: "modified"):
+            - "modified" (most recently modified first)
+            - "title" (by name)
+        enrich (list[str], optional): Detail fields to merge into each item,
+            e.g. ["overview", "usetime"].
 
     Returns:
         dict: Accommodation options with structure:
@@ -733,15 +1674,42 @@ async def find_accommodations(
 
     Example:
         find_accommodations("1", "1", "en", 1, 20)
+        find_accommodations(area_codes=["6", "39"], sort_by="title")
     """
-    # Call the API client and return dict directly
-    result = await get_api_client().search_stay(
-        area_code=area_code,
-        sigungu_code=sigungu_code,
-        language=language,
-        page=page,
-        rows=rows,
-    )
+    deadline = _tool_deadline()
+    arrange = _arrange(sort_by)
+    client = get_api_client()
+    if area_codes is not None:
+        codes = _area_codes(area_codes, area_code, sigungu_code)
+        with request_lane(BULK):
+            result = await client.merge_areas(
+                codes,
+                lambda code, page_no, page_rows: client.search_stay(
+                    area_code=code,
+                    language=language,
+                    page=page_no,
+                    rows=page_rows,
+                    deadline=deadline,
+                    arrange=arrange,
+                ),
+                sort_by=sort_by,
+                page=page,
+                rows=rows,
+            )
+    else:
+        # Call the API client and return dict directly
+        result = await client.search_stay(
+            area_code=area_code,
+            sigungu_code=sigungu_code,
+            language=language,
+            page=page,
+            rows=rows,
+            deadline=deadline,
+            arrange=arrange,
+        )
+    if enrich:
+        result = await _enrich_items(client, result, enrich, language, deadline)
+        filter = filter and [*filter, *enrich]
     if filter:
         filter_items = []
         for item in result.get("items", []):
@@ -756,6 +1724,7 @@ async def get_detailed_information(
     content_id: str,
     content_type: str | None = None,
     language: str | None = None,
+    languages: list[str] | None = None,
 ) -> dict:
     """
     Get detailed information about a specific tourism item in Korea.
@@ -784,6 +1753,11 @@ async def get_detailed_information(
             - "fr" (French)
             - "es" (Spanish)
             - "ru" (Russian)
+        languages (list[str], optional): Fetch the details in several languages
+            at once (e.g. ["en", "jp"]) instead of `language`. The result then
+            has the structure {"languages", "total_count", "items", "errors"},
+            where the single item keeps shared fields at the top level and text
+            fields under "localized" per language.
 
     Returns:
         dict: Detailed information with structure:
@@ -834,50 +1808,255 @@ async def get_detailed_information(
     Example:
         get_detailed_information("126508", "Tourist Attraction", "en")
     """
-    # Validate and convert content_type
-    content_type_id = None
-    if content_type:
-        content_type_id = next(
-            (
-                k
-                for k, v in CONTENTTYPE_ID_MAP.items()
-                if v.lower() == content_type.lower()
-            ),
-            None,
-        )
-        if content_type_id is None:
-            valid_types = ", ".join(CONTENTTYPE_ID_MAP.values())
-            raise ValueError(
-                f"Invalid content_type: '{content_type}'. Valid types are: {valid_types}"
+    deadline = _tool_deadline()
+    content_type_id = _content_type_id(content_type)
+    client = get_api_client()
+    if languages:
+
+        async def fetch(lang: str) -> Dict[str, Any]:
+            item = await _fetch_detailed_information(
+                client, content_id, content_type_id, lang, deadline
             )
+            return {"items": [item] if item else []}
 
-    # Get common details
-    common_details = await get_api_client().get_detail_common(
-        content_id=content_id,
-        language=language,
+        return await client.for_languages(languages, fetch)
+    return await _fetch_detailed_information(
+        client, content_id, content_type_id, language, deadline
     )
 
-    # Get intro details if content_type_id is provided
-    intro_details: Dict[str, Any] = {}
-    if content_type_id:
-        intro_result = await get_api_client().get_detail_intro(
-            content_id=content_id, content_type_id=content_type_id, language=language
+
+# Most content IDs get_detailed_information_batch accepts per call
+MAX_BATCH_SIZE = 50
+
+
+@mcp.tool
+async def get_detailed_information_batch(
+    content_ids: list[str],
+    content_types: list[str] | None = None,
+    language: str | None = None,
+    filter: list[str] | None = None,
+) -> dict:
+    """
+    Get detailed information about many tourism items in Korea at once.
+
+    Use this instead of calling get_detailed_information repeatedly, e.g. for
+    the results of a search. Duplicate IDs are fetched once, cached items are
+    returned right away and the rest are fetched concurrently.
+
+    Args:
+        content_ids (list[str]): Content IDs of the tourism items (at most 50)
+        content_types (list[str], optional): Type of each item, in the order of
+            content_ids, or a single type for all of them. Valid values are the
+            same as for get_detailed_information. Without a type only the
+            common information is returned.
+        language (str, optional): Language for results (default: "en"). Same
+            values as for get_detailed_information.
+        filter (list[str], optional): List of keys to include in each result
+            (whitelist). If None or empty, all fields are returned.
+
+    Returns:
+        dict: Results in the order of content_ids, with structure:
+        {
+            "total_count": int,     # Number of requested items
+            "error_count": int,     # Number of items that could not be fetched
+            "items": [
+                {
+                    "content_id": str,
+                    "result": dict,     # As returned by get_detailed_information
+                }
+                # or, if the item could not be fetched:
+                {
+                    "content_id": str,
+                    "error": str,       # What went wrong
+                }
+                # ... more items
+            ]
+        }
+
+    Example:
+        get_detailed_information_batch(["126508", "264337"], ["Tourist Attraction"], "en")
+    """
+    deadline = _tool_deadline()
+    if len(content_ids) > MAX_BATCH_SIZE:
+        raise ValueError(
+            f"Too many content_ids: {len(content_ids)}. At most {MAX_BATCH_SIZE} "
+            "are accepted per call."
         )
-        intro_details = (
-            intro_result.get("items", [{}])[0] if intro_result.get("items") else {}
+    if not content_types:
+        type_ids: list[Optional[str]] = [None] * len(content_ids)
+    elif len(content_types) == 1:
+        type_ids = [_content_type_id(content_types[0])] * len(content_ids)
+    elif len(content_types) == len(content_ids):
+        type_ids = [_content_type_id(content_type) for content_type in content_types]
+    else:
+        raise ValueError(
+            "content_types must have one entry per content ID, or a single entry "
+            "applying to all of them"
         )
+    requests = list(zip(content_ids, type_ids))
 
-    # Get additional details
-    additional_details: Dict[str, Any] = {}
-    if content_type_id:
-        additional_result = await get_api_client().get_detail_info(
-            content_id=content_id, content_type_id=content_type_id, language=language
+    client = get_api_client()
+
+    async def fetch(content_id: str, content_type_id: Optional[str]) -> Dict[str, Any]:
+        try:
+            result = await _fetch_detailed_information(
+                client, content_id, content_type_id, language, deadline
+            )
+        except Exception as e:
+            return {"content_id": content_id, "error": str(e) or type(e).__name__}
+        if filter:
+            result = {k: v for k, v in result.items() if k in filter}
+        return {"content_id": content_id, "result": result}
+
+    # A batch stands in for the single-item calls an agent would otherwise make,
+    # so it stays in the caller's lane. Every upstream request still takes a
+    # slot of the client's concurrency limiter, which bounds the fan-out.
+    unique = list(dict.fromkeys(requests))
+    fetched = await asyncio.gather(*(fetch(*request) for request in unique))
+    results = dict(zip(unique, fetched))
+    items = [results[request] for request in requests]
+    return {
+        "total_count": len(items),
+        "error_count": sum(1 for item in items if "error" in item),
+        "items": items,
+    }
+
+
+MAX_ITINERARY_STOPS = 300
+
+
+@mcp.tool
+async def optimize_itinerary(
+    content_ids: list[str],
+    start: str | list[float] | None = None,
+    round_trip: bool = False,
+    language: str | None = None,
+    time_budget_ms: int = 500,
+) -> dict:
+    """
+    Suggest a short order to visit tourism items in Korea.
+
+    Use this after collecting candidates (e.g. from searches) to plan a day or
+    a trip. The locations of the items are looked up concurrently and the
+    order minimizing the total straight-line distance is approximated.
+
+    Args:
+        content_ids (list[str]): Content IDs of the items to visit (at most 300)
+        start (str | list[float], optional): Where the tour starts: a content ID
+            (from content_ids or not), or a [longitude, latitude] point such as
+            a hotel. Defaults to the first of content_ids.
+        round_trip (bool, optional): Whether to return to the start at the end
+            (default: False; the tour then ends wherever is shortest)
+        language (str, optional): Language for results (default: "en"). Same
+            values as for get_detailed_information.
+        time_budget_ms (int, optional): Time allowed for improving the order
+            in milliseconds (default: 500). A few hundred stops usually
+            settle well within it.
+
+    Returns:
+        dict: Visiting order with structure:
+        {
+            "total_distance_m": int,    # Straight-line length of the tour
+            "round_trip": bool,
+            "stops": [                  # In visiting order, starting at start
+                {
+                    "content_id": str,      # Absent for a [longitude, latitude] start
+                    "title": str,
+                    "longitude": float,
+                    "latitude": float,
+                    "leg_distance_m": int,          # From the previous stop
+                    "cumulative_distance_m": int,   # From the start
+                }
+                # ... more stops; with round_trip the start again at the end
+            ],
+            "unresolved": [             # Items that could not be located
+                {"content_id": str, "error": str}
+            ]
+        }
+
+    Example:
+        optimize_itinerary(["126508", "264337", "126512"], [126.9780, 37.5665], True)
+    """
+    deadline = _tool_deadline()
+    content_ids = list(dict.fromkeys(content_ids))
+    if len(content_ids) > MAX_ITINERARY_STOPS:
+        raise ValueError(
+            f"Too many content_ids: {len(content_ids)}. At most "
+            f"{MAX_ITINERARY_STOPS} are accepted per call."
         )
-        additional_details = {"additional_info": additional_result.get("items", [])}
+    start_point = None
+    if isinstance(start, list):
+        start_point = validate_point(start)
+    elif start:
+        content_ids = [start, *(cid for cid in content_ids if cid != start)]
+    if not content_ids:
+        raise ValueError("At least one content ID is required")
 
-    # Combine all details
-    item = common_details.get("items", [{}])[0] if common_details.get("items") else {}
-    return {**item, **intro_details, **additional_details}
+    client = get_api_client()
+    # Looking up hundreds of items is bulk work: it yields to live calls under load
+    with request_lane(BULK):
+        responses = await asyncio.gather(
+            *(
+                client.get_detail_common(
+                    content_id=content_id, language=language, deadline=deadline
+                )
+                for content_id in content_ids
+            ),
+            return_exceptions=True,
+        )
+
+    stops: List[Dict[str, Any]] = []
+    unresolved = []
+    for content_id, response in zip(content_ids, responses):
+        if isinstance(response, BaseException):
+            if not isinstance(response, Exception):
+                raise response
+            error = str(response) or type(response).__name__
+        else:
+            item = (response.get("items") or [{}])[0]
+            point = item_point(item)
+            if point is not None:
+                stops.append(
+                    {
+                        "content_id": content_id,
+                        "title": item.get("title"),
+                        "longitude": point[0],
+                        "latitude": point[1],
+                    }
+                )
+                continue
+            error = "No coordinates found for this item"
+        unresolved.append({"content_id": content_id, "error": error})
+
+    if start_point is not None:
+        stops.insert(0, {"longitude": start_point[0], "latitude": start_point[1]})
+    elif start and (not stops or stops[0].get("content_id") != start):
+        raise ValueError(f"The start item {start} could not be located")
+
+    points = [(stop["longitude"], stop["latitude"]) for stop in stops]
+    matrix = distance_matrix(points)
+    order = order_stops(matrix, round_trip, max(time_budget_ms, 0) / 1000)
+    if round_trip and len(order) > 1:
+        order.append(order[0])
+
+    tour = []
+    total = 0.0
+    for previous, index in zip([None, *order], order):
+        leg = matrix[previous][index] if previous is not None else 0.0
+        total += leg
+        tour.append(
+            {
+                **stops[index],
+                "leg_distance_m": round(leg),
+                "cumulative_distance_m": round(total),
+            }
+        )
+    return {
+        "total_distance_m": round(total),
+        "round_trip": round_trip,
+        "stops": tour,
+        "unresolved": unresolved,
+    }
 
 
 @mcp.tool
@@ -929,9 +2108,14 @@ async def get_tourism_images(
     Example:
         get_tourism_images("126508", "en", 1, 10)
     """
+    deadline = _tool_deadline()
     # Call the API client and return dict directly
     results = await get_api_client().get_detail_images(
-        content_id=content_id, language=language, page=page, rows=rows
+        content_id=content_id,
+        language=language,
+        page=page,
+        rows=rows,
+        deadline=deadline,
     )
     # Add content_id to the results
     return {**results, "content_id": content_id}
@@ -1005,14 +2189,219 @@ async def get_area_codes(
         get_area_codes(None, "en", 1, 50)  # Get top-level areas
         get_area_codes("1", "en", 1, 50)   # Get districts in Seoul
     """
+    deadline = _tool_deadline()
     # Call the API client and return dict directly
     results = await get_api_client().get_area_code_list(
-        area_code=parent_area_code, language=language, page=page, rows=rows
+        area_code=parent_area_code,
+        language=language,
+        page=page,
+        rows=rows,
+        deadline=deadline,
     )
     # Add parent_area_code to the results
     return {**results, "parent_area_code": parent_area_code}
 
 
+@mcp.tool
+async def count_by(
+    by: str,
+    area_code: str | None = None,
+    content_type: str | None = None,
+    keyword: str | None = None,
+    language: str | None = None,
+) -> dict:
+    """
+    Count tourism items in Korea per district, area or content type.
+
+    Use this for questions like "how many restaurants are in each Seoul
+    district?" instead of paging through results. Every count is a single-row
+    request, they all run concurrently, and counts are cached for a long time.
+
+    Args:
+        by (str): What to count per. Valid values:
+            - "sigungu" (every district of area_code, which is required)
+            - "area" (every top-level area, i.e. city or province)
+            - "content_type" (every content type)
+        area_code (str, optional): Area to count in. Same values as for
+            get_tourism_by_area. Not allowed with by="area".
+        content_type (str, optional): Type of content to count. Same values as
+            for get_tourism_by_area. Not allowed with by="content_type".
+        keyword (str, optional): Only count items matching a keyword
+        language (str, optional): Language service to count in (default: "en").
+            Same values as for get_tourism_by_area.
+
+    Returns:
+        dict: Histogram with structure:
+        {
+            "by": str,
+            "total_count": int,     # Sum of the counts
+            "counts": [             # Largest first
+                {
+                    "code": str,    # Sigungu code, area code or content type ID
+                    "name": str,    # Its name
+                    "count": int,
+                }
+                # ... more counts
+            ],
+            "errors": {"<code>": str}   # Counts that could not be fetched
+        }
+
+    Example:
+        count_by("sigungu", area_code="1", content_type="Restaurant")
+    """
+    deadline = _tool_deadline()
+    content_type_id = _content_type_id(content_type)
+    client = get_api_client()
+    if by == "sigungu":
+        if not area_code:
+            raise ValueError("Counting by sigungu requires area_code")
+        districts = await client.get_area_code_list(
+            area_code=area_code, language=language, rows=100, deadline=deadline
+        )
+        groups = [(item["code"], item["name"]) for item in districts.get("items", [])]
+    elif by == "area":
+        if area_code:
+            raise ValueError("area_code cannot be given when counting by area")
+        groups = list(AREA_CODE_MAP.items())
+    elif by == "content_type":
+        if content_type:
+            raise ValueError(
+                "content_type cannot be given when counting by content type"
+            )
+        groups = list(CONTENTTYPE_ID_MAP.items())
+    else:
+        raise ValueError(
+            f"Invalid by: '{by}'. Valid values are: sigungu, area, content_type"
+        )
+
+    async def count(code: str) -> Dict[str, Any]:
+        area = code if by == "area" else area_code
+        sigungu = code if by == "sigungu" else None
+        type_id = code if by == "content_type" else content_type_id
+        if keyword:
+            return await client.search_by_keyword(
+                keyword=keyword,
+                content_type_id=type_id,
+                area_code=area,
+                sigungu_code=sigungu,
+                language=language,
+                deadline=deadline,
+                count_only=True,
+            )
+        return await client.get_area_based_list(
+            area_code=area,
+            sigunguCode=sigungu,
+            content_type_id=type_id,
+            language=language,
+            deadline=deadline,
+            count_only=True,
+        )
+
+    with request_lane(BULK):
+        responses = await asyncio.gather(
+            *(count(code) for code, _ in groups), return_exceptions=True
+        )
+    counts = []
+    errors: Dict[str, str] = {}
+    for (code, name), response in zip(groups, responses):
+        if isinstance(response, BaseException):
+            if not isinstance(response, Exception):
+                raise response
+            errors[code] = str(response) or type(response).__name__
+            continue
+        counts.append({"code": code, "name": name, "count": response["total_count"]})
+    counts.sort(key=lambda entry: -entry["count"])
+    return {
+        "by": by,
+        "total_count": sum(entry["count"] for entry in counts),
+        "counts": counts,
+        "errors": errors,
+    }
+
+
+# Most queries multi_query accepts per call
+MAX_MULTI_QUERIES = 20
+
+
+@mcp.tool
+async def multi_query(queries: list[dict]) -> dict:
+    """
+    Run several independent tool calls at once.
+
+    Use this when planning needs several lookups that do not depend on each
+    other, e.g. nearby attractions, festivals for the travel dates and
+    accommodations in the area. The queries run concurrently under one
+    deadline, identical upstream requests among them are made only once, and
+    one failing query does not affect the others.
+
+    Args:
+        queries (list[dict]): Up to 20 queries, each with structure:
+            {
+                "tool": str,    # Name of another tool, e.g. "find_accommodations"
+                "args": dict,   # Arguments of that tool
+                "id": str,      # Optional key of the result (default: its index)
+            }
+
+    Returns:
+        dict: Results keyed by query id, with structure:
+        {
+            "error_count": int,     # Number of queries that failed
+            "results": {
+                "<id>": {
+                    "tool": str,
+                    "result": dict,     # As returned by the tool
+                }
+                # or, if the query failed:
+                "<id>": {
+                    "tool": str,
+                    "error": str,       # What went wrong
+                }
+                # ... more results
+            }
+        }
+
+    Example:
+        multi_query([
+            {"id": "sights", "tool": "find_nearby_attractions",
+             "args": {"longitude": 126.98, "latitude": 37.57}},
+            {"id": "hotels", "tool": "find_accommodations", "args": {"area_code": "1"}},
+        ])
+    """
+    if len(queries) > MAX_MULTI_QUERIES:
+        raise ValueError(
+            f"Too many queries: {len(queries)}. At most {MAX_MULTI_QUERIES} are "
+            "accepted per call."
+        )
+    keys = [str(query.get("id", index)) for index, query in enumerate(queries)]
+    if len(set(keys)) != len(keys):
+        raise ValueError("Query ids must be unique")
+    tools = await mcp.get_tools()
+
+    async def run(query: Dict[str, Any]) -> Dict[str, Any]:
+        name = query.get("tool")
+        try:
+            if name == "multi_query" or name not in tools:
+                raise ValueError(f"Unknown tool: '{name}'")
+            # Validates and converts the arguments like a regular tool call
+            tool_fn = tools[name].fn  # type: ignore[attr-defined]
+            result = await get_cached_typeadapter(tool_fn).validate_python(
+                query.get("args") or {}
+            )
+        except Exception as e:
+            return {"tool": name, "error": str(e) or type(e).__name__}
+        return {"tool": name, "result": result}
+
+    token = _shared_deadline.set(_tool_deadline())
+    try:
+        results = await asyncio.gather(*(run(query) for query in queries))
+    finally:
+        _shared_deadline.reset(token)
+    return {
+        "error_count": sum(1 for result in results if "error" in result),
+        "results": dict(zip(keys, results)),
+    }
+
+
 # Add health check endpoint for HTTP transports
 @mcp.custom_route("/health", methods=["GET"])
 async def health_check(request: Request) -> JSONResponse:
@@ -1021,21 +2410,26 @@ async def health_check(request: Request) -> JSONResponse:
 
     This endpoint provides a simple health check for the MCP server when running
     in HTTP mode. It verifies that the server is running and the API client is
-    properly configured.
+    properly configured, and reports "degraded" while load is being shed (with
+    status 503 once new tool calls are rejected).
 
     Returns:
         JSONResponse: Health status with server information
     """
     try:
         # Try to get the API client to verify it's properly configured
-        _ = get_api_client()
+        load_level = get_api_client().load_level
+        degraded = load_level in LoadShedder.LEVELS[1:]
         return JSONResponse(
             {
-                "status": "healthy",
+                "status": "degraded" if degraded else "healthy",
+                "load": load_level if degraded else LoadShedder.NORMAL,
                 "service": "Korea Tourism API MCP Server",
                 "transport": os.environ.get("MCP_TRANSPORT", "stdio"),
                 "timestamp": asyncio.get_event_loop().time(),
-            }
+            },
+            # Ask load balancers to divert traffic once new calls are shed
+            status_code=503 if load_level == LoadShedder.SHED_INTERACTIVE else 200,
         )
     except Exception as e:
         return JSONResponse(
@@ -1050,6 +2444,44 @@ async def health_check(request: Request) -> JSONResponse:
         )
 
 
+# Add metrics endpoint for HTTP transports
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> JSONResponse:
+    """
+    Metrics endpoint for HTTP transports.
+
+    Exposes the runtime state of the API client, such as the current adaptive
+    concurrency limit and the number of in-flight upstream requests, and of
+    the fair queue admitting tool calls under "admission" and of the tool
+    result memo under "tool_memo".
+
+    Returns:
+        JSONResponse: Client metrics, or 503 if the client is not configured
+    """
+    try:
+        client_metrics = get_api_client().get_metrics()
+        scheduler = get_scheduler()
+        tool_memo = get_tool_memo()
+    except Exception as e:
+        return JSONResponse(
+            {
+                "service": "Korea Tourism API MCP Server",
+                "error": str(e),
+                "timestamp": asyncio.get_event_loop().time(),
+            },
+            status_code=503,
+        )
+    return JSONResponse(
+        {
+            "service": "Korea Tourism API MCP Server",
+            "timestamp": asyncio.get_event_loop().time(),
+            **client_metrics,
+            "admission": scheduler.get_metrics() if scheduler else None,
+            "tool_memo": tool_memo.get_metrics() if tool_memo else None,
+        }
+    )
+
+
 def parse_server_config(args: list[str] | None = None) -> tuple[str, dict[str, Any]]:
     """
     Parse server configuration from command line arguments and environment variables.
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+
+from mcp_tourism.admission import AdmissionRejected, FairScheduler
+
+
+@pytest.mark.asyncio
+async def test_sessions_take_turns_for_free_slots():
+    """Tests that a busy session cannot starve a session that queued later."""
+    scheduler = FairScheduler(max_concurrent=1)
+    await scheduler.acquire("busy")
+
+    order = []
+
+    async def call(session):
+        await scheduler.acquire(session)
+        order.append(session)
+
+    tasks = [asyncio.create_task(call("busy")) for _ in range(3)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(call("quiet")))
+    await asyncio.sleep(0)
+    assert scheduler.get_metrics()["queued_sessions"] == 2
+
+    for _ in range(4):
+        scheduler.release()
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    assert order == ["busy", "quiet", "busy", "busy"]
+
+
+@pytest.mark.asyncio
+async def test_calls_over_the_limits_are_rejected():
+    """Tests rejection on full session queues and on an exhausted session rate."""
+    scheduler = FairScheduler(max_concurrent=1, max_queued_per_session=1)
+    await scheduler.acquire("a")
+    waiter = asyncio.create_task(scheduler.acquire("a"))
+    await asyncio.sleep(0)
+
+    with pytest.raises(AdmissionRejected):
+        await scheduler.acquire("a")
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    scheduler.release()
+    assert scheduler.in_flight == 0
+
+    scheduler = FairScheduler(session_rate=0.5, session_burst=1, max_rate_wait=0.1)
+    await scheduler.acquire("a")
+    with pytest.raises(AdmissionRejected) as excinfo:
+        await scheduler.acquire("a")
+    assert excinfo.value.retry_after > 1
+    await scheduler.acquire("b")  # Other sessions are not affected
+    assert scheduler.get_metrics()["rejected"] == 1
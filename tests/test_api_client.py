@@ -1,3 +1,8 @@
+import asyncio
+import copy
+import threading
+import time
+
 import pytest
 import respx
 import httpx
@@ -691,5 +696,720 @@ async def test_get_category_code_list_sub_category(client: KoreaTourismApiClient
     assert "items" in results
 
 
+def test_shared_client_is_per_event_loop():
+    """Tests that each event loop (one per worker thread) gets its own pooled client."""
+    clients = {}
+
+    def worker(name):
+        async def run():
+            first = await KoreaTourismApiClient.get_shared_client()
+            second = await KoreaTourismApiClient.get_shared_client()
+            assert first is second
+            clients[name] = first
+            await KoreaTourismApiClient.close_all_connections()
+
+        asyncio.run(run())
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(clients) == 2
+    assert clients[0] is not clients[1]
+    assert all(c.is_closed for c in clients.values())
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_context_manager_lifecycle():
+    """Tests that the last `async with` block on a loop closes that loop's pool."""
+    respx.get(url__startswith=KoreaTourismApiClient.BASE_URL).mock(
+        return_value=httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+    )
+
+    async with KoreaTourismApiClient(api_key="TEST_API_KEY") as outer:
+        async with KoreaTourismApiClient(api_key="TEST_API_KEY") as inner:
+            shared = await KoreaTourismApiClient.get_shared_client()
+            await inner.search_by_keyword(keyword="Namsan")
+        # The outer block still holds the pool open
+        assert not shared.is_closed
+        results = await outer.search_by_keyword(keyword="Bukchon")
+        assert results["total_count"] == 1
+
+    assert shared.is_closed
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_warm_up_opens_connections_and_caches_area_codes(
+    client: KoreaTourismApiClient, monkeypatch
+):
+    """Tests that warm_up resolves the host and pre-fetches area codes per connection."""
+    resolved = []
+
+    async def fake_getaddrinfo(host, port, **kwargs):
+        resolved.append((host, port))
+        return [(None, None, None, "", ("203.0.113.10", port))]
+
+    monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", fake_getaddrinfo)
+    route = respx.get(
+        url__startswith=f"{client.BASE_URL}/EngService2{client.AREA_CODE_LIST_ENDPOINT}"
+    ).mock(return_value=httpx.Response(200, json=MOCK_SUCCESS_RESPONSE))
+
+    await client.warm_up(connections=3)
+
+    assert resolved == [("apis.data.go.kr", 80)]
+    assert route.call_count == 3
+
+    # The warmed entry serves the default area code listing from the cache
+    await client.get_area_code_list(rows=100)
+    assert route.call_count == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_concurrency_metrics_follow_upstream_errors():
+    """Tests that server errors shrink the adaptive concurrency limit."""
+    from mcp_tourism.api_client import TourismApiServerError
+
+    # Single attempt, so the test does not sit through retry backoff
+    client = KoreaTourismApiClient(api_key="TEST_API_KEY", retry_attempts=1)
+    respx.get(url__startswith=client.BASE_URL).mock(
+        return_value=httpx.Response(500, json=MOCK_ERROR_RESPONSE)
+    )
+
+    with pytest.raises(TourismApiServerError):
+        await client._make_request(client.AREA_CODE_LIST_ENDPOINT, {"pageNo": "1"})
+
+    concurrency = client.get_metrics()["concurrency"]
+    assert concurrency["in_flight"] == 0
+    assert concurrency["limit"] < 10
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_circuit_breaker_fails_fast_and_serves_stale():
+    """Tests that an open breaker short-circuits calls and falls back to stale data."""
+    from mcp_tourism.api_client import (
+        TourismApiCircuitOpenError,
+        TourismApiServerError,
+    )
+
+    client = KoreaTourismApiClient(
+        api_key="TEST_API_KEY",
+        breaker_minimum_calls=1,
+        breaker_reset_timeout=60,
+        retry_attempts=1,
+    )
+    respx.get(url__startswith=f"{client.BASE_URL}/EngService2/areaCode2").mock(
+        return_value=httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+    )
+    route = respx.get(url__startswith=client.BASE_URL).mock(
+        side_effect=[
+            httpx.Response(200, json=MOCK_SUCCESS_RESPONSE),
+            httpx.Response(503, json=MOCK_ERROR_RESPONSE),
+        ]
+    )
+    endpoint = client.SEARCH_KEYWORD_ENDPOINT
+
+    await client._make_request(endpoint, {"keyword": "Namsan"})
+    client.cache.clear()  # Let the cached entry expire
+    with pytest.raises(TourismApiServerError):
+        await client._make_request(endpoint, {"keyword": "Jeju"})
+    breakers = client.get_metrics()["circuit_breakers"]
+    assert breakers["EngService2/searchKeyword2"]["state"] == "open"
+
+    # Open breaker: stale data is served, unknown requests fail fast
+    stale = await client._make_request(endpoint, {"keyword": "Namsan"})
+    assert stale["total_count"] == 1
+    with pytest.raises(TourismApiCircuitOpenError):
+        await client._make_request(endpoint, {"keyword": "Jeju"})
+    assert route.call_count == 2
+
+    # Breakers are kept per endpoint
+    result = await client._make_request(client.AREA_CODE_LIST_ENDPOINT, {})
+    assert result["total_count"] == 1
+    await KoreaTourismApiClient.close_all_connections()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_rate_limited_response_is_retried_after_delay():
+    """Tests that a 429 is retried after Retry-After and pauses the rate limiter."""
+    client = KoreaTourismApiClient(api_key="TEST_API_KEY", retry_base_delay=0.01)
+    route = respx.get(url__startswith=client.BASE_URL).mock(
+        side_effect=[
+            httpx.Response(
+                429, json=MOCK_ERROR_RESPONSE, headers={"Retry-After": "0.2"}
+            ),
+            httpx.Response(200, json=MOCK_SUCCESS_RESPONSE),
+        ]
+    )
+
+    started = asyncio.get_running_loop().time()
+    result = await client._make_request(client.AREA_CODE_LIST_ENDPOINT, {})
+
+    assert result["total_count"] == 1
+    assert route.call_count == 2
+    assert asyncio.get_running_loop().time() - started >= 0.2
+    assert client.get_metrics()["retry_budget"]["retries"] == 1
+    await KoreaTourismApiClient.close_all_connections()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_retries_stop_when_budget_is_exhausted():
+    """Tests that failing requests stop retrying once the retry budget is spent."""
+    from mcp_tourism.api_client import TourismApiServerError
+
+    client = KoreaTourismApiClient(
+        api_key="TEST_API_KEY",
+        retry_base_delay=0.0,
+        retry_max_delay=0.0,
+        retry_budget_ratio=0.0,
+        breaker_minimum_calls=100,
+    )
+    client._retry_policy.budget.min_retries_per_second = 0.2  # 2 retries per window
+    route = respx.get(url__startswith=client.BASE_URL).mock(
+        return_value=httpx.Response(500, json=MOCK_ERROR_RESPONSE)
+    )
+
+    for page in range(3):
+        with pytest.raises(TourismApiServerError):
+            await client._make_request(client.AREA_CODE_LIST_ENDPOINT, {"pageNo": page})
+
+    # Three attempts for the first request, one for each of the others
+    assert route.call_count == 5
+    await KoreaTourismApiClient.close_all_connections()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_slow_request_is_hedged():
+    """Tests that a request slower than the endpoint's p90 is hedged and the fast copy wins."""
+    from collections import deque
+
+    client = KoreaTourismApiClient(api_key="TEST_API_KEY", hedge_requests=True)
+    endpoint = client.AREA_CODE_LIST_ENDPOINT
+    client._endpoint_latencies[("EngService2", endpoint)] = deque([0.05] * 20)
+    calls = 0
+
+    async def respond(request):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(5)  # The original request hangs in the latency tail
+        return httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+
+    respx.get(url__startswith=client.BASE_URL).mock(side_effect=respond)
+
+    result = await asyncio.wait_for(client._make_request(endpoint, {}), timeout=2)
+
+    assert result["total_count"] == 1
+    metrics = client.get_metrics()
+    assert metrics["hedging"]["sent"] == 1
+    assert metrics["hedging"]["won"] == 1
+    assert metrics["concurrency"]["in_flight"] == 0
+    await KoreaTourismApiClient.close_all_connections()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_request_is_abandoned_at_deadline():
+    """Tests that a hanging request is cancelled at its deadline and frees its slot."""
+    from mcp_tourism.api_client import TourismApiDeadlineExceeded
+
+    client = KoreaTourismApiClient(api_key="TEST_API_KEY")
+
+    async def hang(request):
+        await asyncio.sleep(5)
+        return httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+
+    respx.get(url__startswith=client.BASE_URL).mock(side_effect=hang)
+
+    with pytest.raises(TourismApiDeadlineExceeded):
+        await client.get_area_code_list(deadline=time.monotonic() + 0.1)
+    assert client.get_metrics()["concurrency"]["in_flight"] == 0
+
+    # A deadline that has already passed never reaches upstream
+    with pytest.raises(TourismApiDeadlineExceeded):
+        await client.search_by_keyword("Seoul", deadline=time.monotonic())
+    await KoreaTourismApiClient.close_all_connections()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_low_quota_serves_cache_only():
+    """Tests that a nearly exhausted daily quota keeps requests off upstream."""
+    from mcp_tourism.api_client import TourismApiQuotaExceededError
+
+    client = KoreaTourismApiClient(api_key="TEST_API_KEY", daily_quota=20)
+    route = respx.get(url__startswith=client.BASE_URL).mock(
+        return_value=httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+    )
+    await client.search_by_keyword("Namsan")
+    for _ in range(18):
+        client._quota.record("EngService2", "TEST_API_KEY")
+    client.cache.clear()  # Let the cached entry expire
+
+    # Expired responses are still served, unknown requests are refused
+    result = await client.search_by_keyword("Namsan")
+    assert result["total_count"] == 1
+    with pytest.raises(TourismApiQuotaExceededError):
+        await client.search_by_keyword("Jeju")
+    assert route.call_count == 1
+
+    # Other language services have their own quota
+    await client.search_by_keyword("Jeju", language="jp")
+    assert route.call_count == 2
+    assert client.get_metrics()["quota"]["services"]
+    await KoreaTourismApiClient.close_all_connections()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_rejected_key_is_rotated_out():
+    """Tests that a key over its quota is skipped in favour of the next key."""
+    client = KoreaTourismApiClient(api_key="KEY_A", api_keys=["KEY_B"])
+    quota_exceeded = {
+        "response": {
+            "header": {
+                "resultCode": "22",
+                "resultMsg": "LIMITED_NUMBER_OF_SERVICE_REQUESTS_EXCEEDS_ERROR",
+            }
+        }
+    }
+    respx.get(url__regex=r".*serviceKey=KEY_A&.*").mock(
+        return_value=httpx.Response(200, json=quota_exceeded)
+    )
+    route_b = respx.get(url__regex=r".*serviceKey=KEY_B&.*").mock(
+        return_value=httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+    )
+
+    for keyword in ("Namsan", "Jeju", "Busan"):
+        result = await client.search_by_keyword(keyword)
+        assert result["total_count"] == 1
+
+    assert route_b.call_count == 3
+    assert client._key_pool.usable_keys("EngService2") == ["KEY_B"]
+    await KoreaTourismApiClient.close_all_connections()
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_tenant_clients_share_cache_but_not_keys(client: KoreaTourismApiClient):
+    """Tests that a client for another key reuses cached responses and its own key."""
+    route = respx.get(url__startswith=client.BASE_URL).mock(
+        return_value=httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+    )
+    tenant = client.with_api_key("TENANT_KEY")
+
+    await client.search_by_keyword("Namsan")
+    await tenant.search_by_keyword("Namsan")
+    assert route.call_count == 1  # Served from the shared cache
+
+    await tenant.search_by_keyword("Jeju")
+    assert "serviceKey=TENANT_KEY" in str(route.calls.last.request.url)
+    assert client._key_pool.keys == ["TEST_API_KEY"]
+    assert len(client.get_metrics()["quota"]["services"]) == 2
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_tenants_do_not_share_upstream_calls(client: KoreaTourismApiClient):
+    """Tests that identical concurrent requests of two tenants use their own keys."""
+
+    async def slow_response(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+
+    route = respx.get(url__startswith=client.BASE_URL).mock(side_effect=slow_response)
+    tenant_a = client.with_api_key("KEY_A")
+    tenant_b = client.with_api_key("KEY_B")
+
+    await asyncio.gather(
+        tenant_a.search_by_keyword("Namsan"), tenant_b.search_by_keyword("Namsan")
+    )
+    keys = {call.request.url.params["serviceKey"] for call in route.calls}
+    assert keys == {"KEY_A", "KEY_B"}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_background_requests_are_shed_under_load(client: KoreaTourismApiClient):
+    """Tests that background work is turned away while upstream is overloaded."""
+    from mcp_tourism.api_client import TourismApiOverloadedError
+    from mcp_tourism.concurrency import BACKGROUND, request_lane
+
+    route = respx.get(url__startswith=client.BASE_URL).mock(
+        return_value=httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+    )
+    client._load_shedder.max_latency = 0.5
+    client._get_concurrency_limiter()._smoothed_latency = 1.0
+
+    with request_lane(BACKGROUND):
+        with pytest.raises(TourismApiOverloadedError):
+            await client.search_by_keyword("Namsan")
+    assert route.call_count == 0
+
+    await client.search_by_keyword("Namsan")  # Tool calls still go through
+    assert client.get_metrics()["overload"]["shed"][BACKGROUND] == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_requests_report_their_cache_keys(client: KoreaTourismApiClient):
+    """Tests that tool calls learn which cache entries their result depends on."""
+    from mcp_tourism.memo import collect_cache_keys
+
+    respx.get(url__startswith=client.BASE_URL).mock(
+        return_value=httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+    )
+    with collect_cache_keys() as cache_keys:
+        await client.search_by_keyword("Namsan")
+    assert len(cache_keys) == 1
+    assert all(client.is_cached(cache_key) for cache_key in cache_keys)
+
+    client.cache.clear()
+    assert not any(client.is_cached(cache_key) for cache_key in cache_keys)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_identical_concurrent_requests_share_one_call(
+    client: KoreaTourismApiClient,
+):
+    """Tests that concurrent requests for the same response reach upstream once."""
+
+    async def slow(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+
+    route = respx.get(url__startswith=client.BASE_URL).mock(side_effect=slow)
+
+    first, second = await asyncio.gather(
+        client.search_by_keyword("Namsan"), client.search_by_keyword("Namsan")
+    )
+    assert first == second
+    assert route.call_count == 1
+    assert client.get_metrics()["single_flight"]["shared"] == 1
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_shared_request_outlives_a_caller_deadline(
+    client: KoreaTourismApiClient,
+):
+    """Tests that a short-deadline caller does not cut a joiner's request short."""
+    from mcp_tourism.api_client import TourismApiDeadlineExceeded
+
+    async def slow(request):
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+
+    route = respx.get(url__startswith=client.BASE_URL).mock(side_effect=slow)
+
+    hurried, patient = await asyncio.gather(
+        client.search_by_keyword("Namsan", deadline=time.monotonic() + 0.03),
+        client.search_by_keyword("Namsan"),
+        return_exceptions=True,
+    )
+    assert isinstance(hurried, TourismApiDeadlineExceeded)
+    assert patient == await client.search_by_keyword("Namsan")  # Now cached
+    assert route.call_count == 1
+
+
+def test_localized_items_are_joined_by_content_id():
+    """Tests that shared fields stay on top and text fields are kept per language."""
+    from mcp_tourism.api_client import merge_localized_items
+
+    merged = merge_localized_items(
+        {
+            "en": [
+                {"contentid": "1", "title": "Namsan", "mapx": "126.9"},
+                {"contentid": "2", "title": "Hanok"},
+            ],
+            "jp": [{"contentid": "1", "title": "南山", "mapx": "126.9"}],
+        }
+    )
+    assert merged[0] == {
+        "contentid": "1",
+        "mapx": "126.9",
+        "languages": ["en", "jp"],
+        "localized": {"en": {"title": "Namsan"}, "jp": {"title": "南山"}},
+    }
+    assert merged[1]["languages"] == ["en"]
+    assert merged[1]["localized"] == {"en": {"title": "Hanok"}}
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_request_fans_out_to_language_services(client: KoreaTourismApiClient):
+    """Tests concurrent per-language requests with a failing language reported."""
+    respx.get(url__startswith=f"{client.BASE_URL}/EngService2").mock(
+        return_value=httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+    )
+    respx.get(url__startswith=f"{client.BASE_URL}/JpnService2").mock(
+        return_value=httpx.Response(400, text="Bad Request")
+    )
+
+    result = await client.for_languages(
+        ["en", "jp", "EN"],
+        lambda lang: client.search_by_keyword("Namsan", language=lang),
+    )
+    assert result["languages"] == ["en", "jp"]
+    assert result["total_count"] == {"en": 1}
+    assert result["items"][0]["languages"] == ["en"]
+    assert "jp" in result["errors"]
+
+    with pytest.raises(ValueError):
+        await client.for_languages(["xx"], client.search_by_keyword)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_client_methods_take_languages(client: KoreaTourismApiClient):
+    """Tests that list and detail methods fan out over the languages they get."""
+    routes = {
+        service: respx.get(url__startswith=f"{client.BASE_URL}/{service}").mock(
+            return_value=httpx.Response(200, json=MOCK_SUCCESS_RESPONSE)
+        )
+        for service in ("EngService2", "JpnService2")
+    }
+
+    result = await client.search_by_keyword("Namsan", languages=["en", "jp"])
+    assert result["languages"] == ["en", "jp"]
+    assert result["total_count"] == {"en": 1, "jp": 1}
+    assert result["items"][0]["languages"] == ["en", "jp"]
+
+    result = await client.get_detail_common("12345", languages=["jp"])
+    assert result["languages"] == ["jp"]
+    assert "contentId=12345" in str(routes["JpnService2"].calls.last.request.url)
+    assert routes["EngService2"].call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_areas_are_merged_and_paginated_lazily(client: KoreaTourismApiClient):
+    """Tests the k-way merge of sorted areas, fetching later pages only as needed."""
+    areas = {
+        "1": ["20250105", "20250103", "20250101"],
+        "6": ["20250104", "20250102"],
+    }
+    calls = []
+
+    async def request(code, page, rows):
+        calls.append((code, page))
+        if code == "39":
+            raise RuntimeError("upstream failed")
+        times = areas[code][(page - 1) * rows : page * rows]
+        return {
+            "total_count": len(areas[code]),
+            "items": [{"contentid": f"{code}-{t}", "modifiedtime": t} for t in times],
+        }
+
+    result = await client.merge_areas(["1", "6", "39", "1"], request, page=2, rows=2)
+    assert [item["modifiedtime"] for item in result["items"]] == [
+        "20250103",
+        "20250102",
+    ]
+    assert result["total_count"] == 5
+    assert result["area_codes"] == ["1", "6", "39"]
+    assert result["errors"] == {"39": "upstream failed"}
+    # The last item of the page does not fetch the next page of its area
+    assert ("1", 2) in calls and ("6", 2) not in calls
+
+    with pytest.raises(ValueError):
+        await client.merge_areas(["99"], request)
+    with pytest.raises(ValueError):
+        await client.merge_areas(["1"], request, sort_by="rating")
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_route_search_ranks_items_along_the_corridor(
+    client: KoreaTourismApiClient,
+):
+    """Tests tiled route queries, deduplication, clipping and travel order."""
+
+    def item(content_id, mapx, mapy):
+        return {"contentid": content_id, "mapx": mapx, "mapy": mapy, "dist": "1"}
+
+    # Every circle returns the same items: one near the end, one near the
+    # start and one far off the route
+    body = {
+        "response": {
+            "header": {"resultCode": "0000", "resultMsg": "OK"},
+            "body": {
+                "items": {
+                    "item": [
+                        item("end", "127.095", "37.001"),
+                        item("start", "127.005", "36.999"),
+                        item("far", "127.05", "37.2"),
+                    ]
+                },
+                "numOfRows": 100,
+                "pageNo": 1,
+                "totalCount": 3,
+            },
+        }
+    }
+    route = respx.get(
+        url__startswith=f"{client.BASE_URL}/EngService2/locationBasedList2"
+    ).mock(return_value=httpx.Response(200, json=body))
+
+    result = await client.search_along_route([[127.0, 37.0], [127.1, 37.0]], 1000)
+    assert [i["contentid"] for i in result["items"]] == ["start", "end"]
+    assert result["items"][0]["offset_m"] == pytest.approx(111, abs=2)
+    assert "dist" not in result["items"][0]
+    assert result["query_count"] == route.call_count == 6
+    assert result["failed_queries"] == result["truncated_queries"] == 0
+
+    # Asking again is served from the cache
+    await client.search_along_route([[127.0, 37.0], [127.1, 37.0]], 1000)
+    assert route.call_count == 6
+
+    with pytest.raises(ValueError):
+        await client.search_along_route([[127.0, 37.0], [129.0, 37.0]], 100)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_bbox_search_clips_results_and_reuses_tiles(
+    client: KoreaTourismApiClient,
+):
+    """Tests that box results are clipped and a panned box hits cached tiles."""
+    body = {
+        "response": {
+            "header": {"resultCode": "0000", "resultMsg": "OK"},
+            "body": {
+                "items": {
+                    "item": [
+                        {"contentid": "edge", "mapx": "126.971", "mapy": "37.551"},
+                        {"contentid": "middle", "mapx": "126.985", "mapy": "37.565"},
+                        {"contentid": "outside", "mapx": "126.95", "mapy": "37.565"},
+                    ]
+                },
+                "numOfRows": 100,
+                "pageNo": 1,
+                "totalCount": 3,
+            },
+        }
+    }
+    route = respx.get(
+        url__startswith=f"{client.BASE_URL}/EngService2/locationBasedList2"
+    ).mock(return_value=httpx.Response(200, json=body))
+
+    result = await client.find_in_bbox(126.97, 37.55, 127.00, 37.58)
+    assert [i["contentid"] for i in result["items"]] == ["middle", "edge"]
+    assert result["query_count"] == route.call_count
+    first_calls = route.call_count
+
+    panned = await client.find_in_bbox(126.975, 37.55, 127.005, 37.58)
+    assert route.call_count - first_calls < panned["query_count"]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_nearest_items_come_from_one_query_then_locally(
+    client: KoreaTourismApiClient,
+):
+    """Tests k-nearest search sorted by distance, then answered from coverage."""
+    # The 100 nearest items of a denser area, sorted by distance
+    items = [
+        {"contentid": str(i), "mapx": str(127.0 + 0.0001 * i), "mapy": "37.0"}
+        for i in range(100)
+    ]
+    body = {
+        "response": {
+            "header": {"resultCode": "0000", "resultMsg": "OK"},
+            "body": {
+                "items": {"item": items},
+                "numOfRows": 100,
+                "pageNo": 1,
+                "totalCount": 500,
+            },
+        }
+    }
+    route = respx.get(
+        url__startswith=f"{client.BASE_URL}/EngService2/locationBasedList2"
+    ).mock(return_value=httpx.Response(200, json=body))
+
+    result = await client.find_nearest(3, 127.00001, 37.0)
+    assert [item["contentid"] for item in result["items"]] == ["0", "1", "2"]
+    assert result["items"][1]["distance_m"] == 8
+    assert result["query_count"] == 1
+    params = route.calls.last.request.url.params
+    assert params["arrange"] == "S" and params["radius"] == "20000"
+
+    # A nearby query within the known circle needs no upstream call
+    result = await client.find_nearest(5, 127.003, 37.0)
+    assert result["query_count"] == 0 and route.call_count == 1
+    assert result["items"][0]["contentid"] == "30"
+
+    with pytest.raises(ValueError):
+        await client.find_nearest(0, 127.0, 37.0)
+
+
+@pytest.mark.asyncio
+async def test_all_pages_are_fetched_concurrently(client: KoreaTourismApiClient):
+    """Tests draining a list: page count, deduplication and failed pages."""
+    pages = []
+
+    async def request(page, rows):
+        pages.append(page)
+        if page == 3:
+            raise RuntimeError("upstream failed")
+        # The last item of a page shows up again at the top of the next one
+        start = max(0, (page - 1) * rows - 1)
+        return {
+            "total_count": 10,
+            "items": [{"contentid": str(i)} for i in range(start, page * rows)],
+        }
+
+    result = await client.fetch_all_pages(request, rows=3)
+    assert sorted(pages) == [1, 2, 3, 4]
+    assert [item["contentid"] for item in result["items"]] == [
+        str(i) for i in (0, 1, 2, 3, 4, 5, 8, 9, 10, 11)
+    ]
+    assert result["failed_pages"] == 1 and not result["truncated"]
+
+    result = await client.fetch_all_pages(request, rows=3, max_pages=2)
+    assert result["page_count"] == 2 and result["truncated"]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_count_only_requests_one_row_and_is_cached_apart(
+    client: KoreaTourismApiClient,
+):
+    """Tests count mode: a one-row request, counts outliving the response cache."""
+    body = copy.deepcopy(MOCK_SUCCESS_RESPONSE)
+    body["response"]["body"]["totalCount"] = 1234
+    route = respx.get(url__startswith=client.BASE_URL).mock(
+        return_value=httpx.Response(200, json=body)
+    )
+
+    result = await client.get_area_based_list(
+        area_code="1", content_type_id="82", rows=50, count_only=True
+    )
+    assert result == {"total_count": 1234}
+    params = route.calls.last.request.url.params
+    assert params["numOfRows"] == "1" and params["pageNo"] == "1"
+
+    client.cache.clear()
+    result = await client.get_area_based_list(
+        area_code="1", content_type_id="82", page=3, count_only=True
+    )
+    assert result == {"total_count": 1234}
+    assert route.call_count == 1
+
+    await client.search_stay(area_code="1", count_only=True)
+    await client.search_by_keyword("Hanok", count_only=True)
+    assert route.call_count == 3
+    assert client.get_metrics()["counts_cached"] == 3
+
+
 # TODO: Add more tests for specific parameter combinations if needed.
 # TODO: Consider adding tests for rate limiting and retry behavior, although they can be complex to mock accurately.
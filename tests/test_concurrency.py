@@ -0,0 +1,187 @@
+import asyncio
+
+import pytest
+
+from mcp_tourism.concurrency import (
+    BACKGROUND,
+    BULK,
+    INTERACTIVE,
+    AdaptiveConcurrencyLimiter,
+    SingleFlight,
+    TokenBucket,
+    current_lane,
+    request_lane,
+)
+
+
+@pytest.mark.asyncio
+async def test_limit_grows_while_latency_is_flat():
+    """Tests that a full window of fast successes raises the limit by one."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+
+    for _ in range(2):
+        await limiter.acquire()
+        limiter.release(latency=0.1)
+    assert limiter.limit == 3
+
+    for _ in range(20):
+        await limiter.acquire()
+        limiter.release(latency=0.1)
+    assert limiter.limit == 4  # Capped at max_limit
+
+
+@pytest.mark.asyncio
+async def test_limit_backs_off_on_drops_and_rising_latency():
+    """Tests that dropped requests and latency spikes shrink the limit."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff_ratio=0.5)
+
+    await limiter.acquire()
+    limiter.release(dropped=True)
+    assert limiter.limit == 5
+
+    limiter = AdaptiveConcurrencyLimiter(
+        initial_limit=10, backoff_ratio=0.5, smoothing=1.0
+    )
+    await limiter.acquire()
+    limiter.release(latency=0.1)
+    await limiter.acquire()
+    limiter.release(latency=1.0)  # 10x the baseline latency
+    assert limiter.limit == 5
+
+
+@pytest.mark.asyncio
+async def test_waiters_queue_beyond_limit_and_cancel_cleanly():
+    """Tests queuing past the limit, hand-over on release and waiter cancellation."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    cancelled = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.get_metrics()["queued"] == 2
+
+    cancelled.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert limiter.queued == 1
+
+    limiter.release()
+    await waiter
+    assert limiter.in_flight == 1
+    limiter.release()
+    assert limiter.get_metrics()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests_and_honours_pause():
+    """Tests that an empty bucket delays callers and a pause holds them off."""
+    bucket = TokenBucket(rate=20.0, capacity=2)
+    loop = asyncio.get_running_loop()
+
+    started = loop.time()
+    for _ in range(3):
+        await bucket.acquire()
+    assert loop.time() - started >= 0.04  # Third token refilled at 20/s
+
+    bucket.pause(0.1)
+    assert bucket.get_metrics()["paused_for"] > 0
+    started = loop.time()
+    await bucket.acquire()
+    assert loop.time() - started >= 0.1
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_gives_up_when_token_is_due_too_late():
+    """Tests that acquire with a timeout returns at once instead of oversleeping."""
+    bucket = TokenBucket(rate=1.0, capacity=1)
+    assert await bucket.acquire(timeout=0.1) is True
+
+    assert await bucket.acquire(timeout=0.1) is False
+    assert bucket.tokens > -1  # The reservation was handed back
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_skip_ahead_of_background_ones():
+    """Tests lane priority and the slots kept free for interactive requests."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, background_share=0.5)
+
+    with request_lane(BACKGROUND):
+        await limiter.acquire(current_lane())
+    # Background requests may only hold half of the limit
+    assert limiter.try_acquire(BACKGROUND) is False
+    background = asyncio.create_task(limiter.acquire(BACKGROUND))
+    await asyncio.sleep(0)
+
+    # The interactive request still finds the free slot
+    await limiter.acquire(INTERACTIVE)
+    interactive = asyncio.create_task(limiter.acquire(INTERACTIVE))
+    await asyncio.sleep(0)
+
+    limiter.release()
+    await interactive  # Served first although it queued last
+    assert not background.done()
+    limiter.release()
+    limiter.release()
+    await background
+    lanes = limiter.get_metrics()["lanes"]
+    assert lanes[INTERACTIVE]["acquired"] == 2
+    assert lanes[BACKGROUND]["acquired"] == 2
+    assert lanes[BULK]["queued"] == 0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_reserve_is_left_to_other_callers():
+    """Tests that a reserve keeps tokens back for callers without one."""
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    assert bucket.try_acquire(reserve=1.0) is True
+    assert bucket.try_acquire(reserve=1.0) is False
+    assert await bucket.acquire(timeout=0.1, reserve=1.0) is False
+    assert bucket.try_acquire() is True
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_run_per_key():
+    """Tests coalescing of concurrent calls and cancellation by the last caller."""
+    flights = SingleFlight()
+    runs = []
+
+    async def work(value):
+        runs.append(value)
+        await asyncio.sleep(0.01)
+        return value
+
+    results = await asyncio.gather(
+        flights.do("a", lambda: work(1)),
+        flights.do("a", lambda: work(2)),
+        flights.do("b", lambda: work(3)),
+    )
+    assert results == [1, 1, 3]
+    assert runs == [1, 3]
+    assert flights.get_metrics() == {"in_flight": 0, "shared": 1}
+
+    waiter = asyncio.create_task(flights.do("slow", lambda: asyncio.sleep(10)))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert flights.in_flight == 0  # Nobody was left waiting, so the run stopped
+
+
+@pytest.mark.asyncio
+async def test_single_flight_runs_in_the_most_urgent_callers_lane():
+    """Tests that an interactive caller lifts a shared bulk run into its lane."""
+    flights = SingleFlight()
+    lanes = []
+
+    async def work():
+        lanes.append(current_lane())
+        await asyncio.sleep(0.01)
+        lanes.append(current_lane())
+        return "done"
+
+    with request_lane(BULK):
+        bulk = asyncio.create_task(flights.do("a", work))
+    await asyncio.sleep(0.005)  # The run is waiting in the bulk lane
+    assert await flights.do("a", work) == "done"
+    assert await bulk == "done"
+    assert lanes == [BULK, INTERACTIVE]
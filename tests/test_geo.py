@@ -0,0 +1,173 @@
+import math
+import random
+
+import pytest
+
+from mcp_tourism.geo import (
+    CoverageIndex,
+    Route,
+    distance_matrix,
+    grid_clusters,
+    grid_cover,
+    haversine_m,
+    in_bbox,
+    item_point,
+    order_stops,
+    validate_bbox,
+    validate_point,
+)
+
+SEOUL = (126.9780, 37.5665)
+GANGNEUNG = (128.8761, 37.7519)
+
+
+def test_haversine_distance():
+    """Tests the great-circle distance against a known value."""
+    assert haversine_m(SEOUL, GANGNEUNG) == pytest.approx(168_000, rel=0.01)
+    assert haversine_m(SEOUL, SEOUL) == 0
+
+
+def test_points_are_validated():
+    """Tests coordinate validation and reading coordinates from API items."""
+    assert validate_point([126.9, 37.5]) == (126.9, 37.5)
+    with pytest.raises(ValueError):
+        validate_point([126.9])
+    with pytest.raises(ValueError):
+        validate_point([37.5, 200])
+    assert item_point({"mapx": "126.9", "mapy": "37.5"}) == (126.9, 37.5)
+    assert item_point({"mapx": "", "mapy": "37.5"}) is None
+    assert item_point({"mapx": "0", "mapy": "0"}) is None
+
+
+def test_route_cover_reaches_the_whole_corridor():
+    """Tests that every point within the buffer of the route lies in a circle."""
+    route = Route([SEOUL, (127.5, 37.6), GANGNEUNG])
+    buffer_m = 2000
+    centers, radius = route.cover(buffer_m)
+    assert radius == pytest.approx(buffer_m * math.sqrt(2))
+    # Spacing of 2 * buffer along the route, plus the vertices
+    assert len(centers) == pytest.approx(route.length_m / (2 * buffer_m), abs=3)
+    assert centers[0] == SEOUL and centers[-1] == GANGNEUNG
+
+    projection = route.projection
+    for along in range(0, int(route.length_m), 997):
+        # Walk the route and step sideways to the edge of the corridor
+        lon, lat = _point_along(route, along)
+        x, y = projection.to_xy((lon, lat))
+        for dx, dy in ((0, buffer_m * 0.99), (0, -buffer_m * 0.99)):
+            edge = projection.to_point(x + dx, y + dy)
+            if route.locate(edge)[1] > buffer_m:
+                continue
+            assert min(haversine_m(edge, c) for c in centers) <= radius * 1.01
+
+    with pytest.raises(ValueError):
+        route.cover(0)
+    with pytest.raises(ValueError):
+        Route([SEOUL])
+
+
+def test_locate_projects_onto_the_route():
+    """Tests distance along and distance from a straight route."""
+    route = Route([(127.0, 37.0), (127.1, 37.0)])
+    along, offset = route.locate((127.05, 37.01))
+    assert along == pytest.approx(route.length_m / 2, rel=0.01)
+    assert offset == pytest.approx(1112, rel=0.01)
+    # Beyond the end, the distance is measured from the last vertex
+    along, _ = route.locate((127.2, 37.0))
+    assert along == pytest.approx(route.length_m)
+
+
+def test_grid_cover_is_aligned_and_covers_the_box():
+    """Tests that panned boxes share tiles and every point of a box is covered."""
+    bbox = validate_bbox(126.97, 37.55, 127.00, 37.58)
+    centers, radius, side = grid_cover(bbox, 25)
+    assert side == 1000 and len(centers) <= 25
+
+    for i in range(11):
+        for j in range(11):
+            point = (126.97 + 0.003 * i, 37.55 + 0.003 * j)
+            assert in_bbox(point, bbox)
+            assert min(haversine_m(point, c) for c in centers) <= radius
+
+    # Panning a little east keeps most tiles, with identical centers
+    panned, _, _ = grid_cover((126.975, 37.55, 127.005, 37.58), 25)
+    assert len(set(centers) & set(panned)) >= len(centers) // 2
+
+    # Larger boxes get larger tiles, too large ones are rejected
+    assert grid_cover((126.5, 37.3, 127.3, 37.8), 25)[2] == 16000
+    with pytest.raises(ValueError):
+        grid_cover((126.0, 35.0, 129.0, 38.0), 25)
+    with pytest.raises(ValueError):
+        validate_bbox(127.0, 37.5, 126.9, 37.6)
+
+
+def test_coverage_answers_only_settled_queries():
+    """Tests that a known circle answers nearest queries only when it can be sure."""
+    index = CoverageIndex()
+    items = [
+        {"contentid": str(i), "mapx": str(127.0 + 0.001 * i), "mapy": "37.0"}
+        for i in range(5)
+    ]
+    index.add(("en", None), (127.0, 37.0), 1000, items)
+
+    nearest = index.nearest(("en", None), (127.0005, 37.0), 2)
+    assert [item["contentid"] for _, item in nearest] == ["0", "1"]
+    assert nearest[0][0] == pytest.approx(44, abs=1)
+    # The disk reaching the 2nd nearest item leaves the known circle
+    assert index.nearest(("en", None), (127.008, 37.0), 2) is None
+    # Not enough known items, or another scope
+    assert index.nearest(("en", None), (127.0, 37.0), 6) is None
+    assert index.nearest(("jp", None), (127.0, 37.0), 1) is None
+
+
+def test_grid_clusters_group_items_by_cell():
+    """Tests cluster counts, centroids and representatives."""
+    items = [
+        {"contentid": "a", "mapx": "126.9801", "mapy": "37.5601"},
+        {"contentid": "b", "mapx": "126.9803", "mapy": "37.5603"},
+        {"contentid": "c", "mapx": "126.9802", "mapy": "37.5602"},
+        {"contentid": "far", "mapx": "127.05", "mapy": "37.60"},
+        {"contentid": "nowhere", "mapx": "", "mapy": ""},
+    ]
+    clusters = grid_clusters(items, 1000, representatives=1)
+    assert [cluster["count"] for cluster in clusters] == [3, 1]
+    assert clusters[0]["longitude"] == pytest.approx(126.9802)
+    assert clusters[0]["items"] == [items[2]]
+
+
+def test_stops_are_ordered_without_crossings():
+    """Tests the tour around a square and that 2-opt improves nearest neighbour."""
+    square = [(127.0, 37.0), (127.0, 37.01), (127.011, 37.0), (127.011, 37.011)]
+    matrix = distance_matrix(square)
+    assert matrix[0][1] == matrix[1][0] == pytest.approx(1112, rel=0.01)
+    assert matrix[2][2] == 0
+
+    def length(tour):
+        return sum(matrix[a][b] for a, b in zip(tour, tour[1:] + tour[:1]))
+
+    tour = order_stops(matrix, round_trip=True)
+    assert tour[0] == 0 and sorted(tour) == [0, 1, 2, 3]
+    assert length(tour) == pytest.approx(
+        matrix[0][1] + matrix[1][3] + matrix[3][2] + matrix[2][0]
+    )
+    # An open tour ends wherever is shortest
+    path = order_stops(distance_matrix([(127.0, 37.0), (127.02, 37.0), (127.01, 37.0)]))
+    assert path == [0, 2, 1]
+    assert order_stops([]) == []
+
+    rng = random.Random(7)
+    points = [(127 + rng.random() / 10, 37 + rng.random() / 10) for _ in range(60)]
+    matrix = distance_matrix(points)
+    assert length(order_stops(matrix, round_trip=True)) < length(
+        order_stops(matrix, round_trip=True, time_budget=0)
+    )
+
+
+def _point_along(route, distance):
+    for a, b in zip(route.points, route.points[1:]):
+        length = route.locate(b)[0] - route.locate(a)[0]
+        if distance <= length:
+            t = distance / length
+            return a[0] + (b[0] - a[0]) * t, a[1] + (b[1] - a[1]) * t
+        distance -= length
+    return route.points[-1]
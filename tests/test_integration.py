@@ -4,7 +4,7 @@ Tests server initialization, tool registration, and basic functionality.
 """
 
 import pytest
-from unittest.mock import patch, MagicMock, AsyncMock
+from unittest.mock import ANY, patch, MagicMock, AsyncMock
 from fastmcp import Client
 from mcp_tourism.server import mcp
 from mcp_tourism.api_client import KoreaTourismApiClient
@@ -62,8 +62,15 @@ async def test_server_initialization_and_tools_list(mock_env_vars):
             "search_festivals_by_date",
             "find_accommodations",
             "get_detailed_information",
+            "get_detailed_information_batch",
             "get_tourism_images",
             "get_area_codes",
+            "multi_query",
+            "find_attractions_along_route",
+            "find_in_bbox",
+            "find_nearest",
+            "optimize_itinerary",
+            "count_by",
         }
 
         # Get actual tool names
@@ -121,6 +128,7 @@ async def test_search_tourism_tool_execution(
             language=None,
             page=1,
             rows=20,
+            deadline=ANY,
         )
 
 
@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+import pytest
+
+from mcp_tourism.key_pool import ApiKeyPool
+from mcp_tourism.quota import QuotaAccountant
+
+
+@pytest.mark.asyncio
+async def test_calls_are_spread_across_keys():
+    """Tests that each key has its own bucket and calls go to the fullest one."""
+    pool = ApiKeyPool(["A", "B", "A"], 1, 1, QuotaAccountant())
+    assert pool.keys == ["A", "B"]
+
+    first = await pool.acquire("EngService2")
+    second = await pool.acquire("EngService2")
+    assert {first, second} == {"A", "B"}
+    assert pool.try_acquire("EngService2") is None  # Both buckets are empty
+
+
+def test_disabled_key_returns_after_daily_reset():
+    """Tests that a rejected key is skipped for its service until the next KST day."""
+    pool = ApiKeyPool(["A", "B"], 5, 1, QuotaAccountant())
+    pool.disable("A", "EngService2", "22")
+
+    assert pool.usable_keys("EngService2") == ["B"]
+    assert pool.usable_keys("JpnService2") == ["A", "B"]
+    assert list(pool.get_metrics().values())[0]["disabled"] == {"EngService2": "22"}
+
+    with patch("mcp_tourism.key_pool.kst_today", return_value="2099-01-01"):
+        assert pool.usable_keys("EngService2") == ["A", "B"]
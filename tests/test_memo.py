@@ -0,0 +1,39 @@
+from mcp_tourism.memo import (
+    ToolResultMemo,
+    collect_cache_keys,
+    memo_key,
+    note_cache_key,
+)
+
+
+def test_memo_key_ignores_unset_arguments_and_order():
+    """Tests that equivalent argument sets map to the same key."""
+    assert memo_key("tool", {"a": 1, "b": None, "c": [1, 2]}) == memo_key(
+        "tool", {"c": [1, 2], "a": 1}
+    )
+    assert memo_key("tool", {"a": 1}) != memo_key("other", {"a": 1})
+    assert memo_key("tool", None) == memo_key("tool", {})
+
+
+def test_result_expires_with_its_cache_entries():
+    """Tests that a memoized result is served only while its sources are cached."""
+    cached = {"k1", "k2"}
+    memo = ToolResultMemo()
+
+    with collect_cache_keys() as cache_keys:
+        note_cache_key("k1")
+        note_cache_key("k2")
+    note_cache_key("k3")  # Outside the block, nothing is collected
+    assert cache_keys == {"k1", "k2"}
+
+    memo.put("call", ["result"], cache_keys, cached.__contains__)
+    assert memo.get("call", cached.__contains__) == ["result"]
+
+    cached.discard("k2")
+    assert memo.get("call", cached.__contains__) is None
+    assert memo.get_metrics() == {"entries": 0, "hits": 1, "misses": 1}
+
+    # Results built from responses that are not cached are never memoized
+    memo.put("call", ["result"], {"k2"}, cached.__contains__)
+    memo.put("empty", ["result"], set(), cached.__contains__)
+    assert memo.get_metrics()["entries"] == 0
@@ -0,0 +1,52 @@
+import asyncio
+import time
+
+import pytest
+
+from mcp_tourism.concurrency import BACKGROUND, BULK, INTERACTIVE
+from mcp_tourism.overload import LoadShedder
+
+
+def test_work_is_shed_by_priority_as_load_rises():
+    """Tests that bulk work goes first, then background work, then tool calls."""
+    shedder = LoadShedder(max_queue_depth=10, max_latency=2.0)
+    shedder.observe(queue_depth=5, latency=0.5)
+    assert shedder.level == LoadShedder.NORMAL
+    assert not shedder.should_shed(BULK)
+
+    shedder.observe(queue_depth=12, latency=0.5)
+    assert shedder.should_shed(BULK)
+    assert not shedder.should_shed(BACKGROUND)
+
+    shedder.observe(queue_depth=0, latency=3.0)  # Latency alone counts too
+    assert shedder.level == LoadShedder.SHED_BACKGROUND
+    assert not shedder.should_shed(INTERACTIVE)
+
+    shedder.observe(queue_depth=25, latency=0.5)
+    assert shedder.should_shed(INTERACTIVE)
+    assert shedder.get_metrics()["shed"] == {INTERACTIVE: 1, BACKGROUND: 0, BULK: 1}
+
+
+@pytest.mark.asyncio
+async def test_blocked_event_loop_is_detected():
+    """Tests that the lag monitor notices a callback hogging the loop."""
+    shedder = LoadShedder(max_loop_lag=0.01, lag_interval=0.01, smoothing=1.0)
+    shedder.ensure_monitor()
+    await asyncio.sleep(0.005)
+    time.sleep(0.05)  # Block the loop past the next sample
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert shedder.loop_lag >= 0.01
+    assert shedder.level != LoadShedder.NORMAL
+
+
+@pytest.mark.asyncio
+async def test_lag_monitor_is_stopped():
+    """Tests that stopping the monitor cancels the loop's sampling task."""
+    shedder = LoadShedder(lag_interval=0.01)
+    shedder.ensure_monitor()
+    task = shedder._monitors[asyncio.get_running_loop()]
+
+    await shedder.stop_monitor()
+    assert task.cancelled()
+    await shedder.stop_monitor()  # Stopping twice is harmless
@@ -0,0 +1,74 @@
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from mcp_tourism.quota import QuotaAccountant, key_fingerprint
+
+
+def test_levels_follow_usage():
+    """Tests that degradation levels step up as the daily quota is used."""
+    quota = QuotaAccountant(daily_quota=20)
+    assert quota.level("EngService2", "KEY") == QuotaAccountant.NORMAL
+
+    for _ in range(14):
+        quota.record("EngService2", "KEY")
+    assert quota.level("EngService2", "KEY") == QuotaAccountant.EXTENDED_CACHE
+
+    for _ in range(3):
+        quota.record("EngService2", "KEY")
+    assert quota.is_at_least("EngService2", "KEY", QuotaAccountant.NO_PREFETCH)
+    assert not quota.is_at_least("EngService2", "KEY", QuotaAccountant.CACHE_ONLY)
+
+    for _ in range(2):
+        quota.record("EngService2", "KEY")
+    assert quota.level("EngService2", "KEY") == QuotaAccountant.CACHE_ONLY
+
+    # Each language service has its own quota
+    assert quota.level("JpnService2", "KEY") == QuotaAccountant.NORMAL
+
+
+def test_counters_persist_per_kst_day(tmp_path):
+    """Tests that counters survive a restart but not the end of the KST day."""
+    path = tmp_path / "quota.json"
+    quota = QuotaAccountant(path=str(path))
+    quota.record("EngService2", "KEY")
+    quota.record("EngService2", "KEY")
+    quota.save()
+
+    data = json.loads(path.read_text())
+    assert data["counts"] == {f"EngService2:{key_fingerprint('KEY')}": 2}
+    assert "KEY" not in path.read_text()  # Keys are only stored as fingerprints
+
+    assert QuotaAccountant(path=str(path)).used("EngService2", "KEY") == 2
+
+    with patch("mcp_tourism.quota.kst_today", return_value="2099-01-01"):
+        assert QuotaAccountant(path=str(path)).used("EngService2", "KEY") == 0
+        assert quota.used("EngService2", "KEY") == 0  # Rolled over at midnight
+
+
+@pytest.mark.asyncio
+async def test_periodic_save_runs_off_the_event_loop(tmp_path):
+    """Tests that writes due while recording inside a loop go to a worker thread."""
+    path = tmp_path / "quota.json"
+    quota = QuotaAccountant(daily_quota=100, path=str(path), save_interval=0.0)
+    save = quota.save
+    threads = []
+
+    def tracking_save():
+        threads.append(threading.get_ident())
+        save()
+
+    quota.save = tracking_save
+    quota.record("EngService2", "KEY")
+    for _ in range(50):
+        if path.exists():
+            break
+        await asyncio.sleep(0.01)
+
+    assert threads and threads[0] != threading.get_ident()
+    assert json.loads(path.read_text())["counts"] == {
+        f"EngService2:{key_fingerprint('KEY')}": 1
+    }
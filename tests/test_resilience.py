@@ -0,0 +1,99 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+from mcp_tourism.resilience import (
+    CircuitBreaker,
+    RetryBudget,
+    RetryPolicy,
+    parse_retry_after,
+)
+
+
+def test_breaker_opens_at_failure_rate():
+    """Tests that the breaker opens only once enough calls fail."""
+    breaker = CircuitBreaker(failure_rate_threshold=0.5, minimum_calls=4)
+
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED  # Below minimum_calls
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.allow_request() is False
+    assert breaker.retry_after > 0
+
+
+def test_breaker_half_open_allows_single_probe():
+    """Tests half-open probing after the reset timeout."""
+    breaker = CircuitBreaker(minimum_calls=1, reset_timeout=30.0)
+    with patch("mcp_tourism.resilience.time.monotonic", return_value=100.0):
+        breaker.record_failure()
+    assert breaker._state == CircuitBreaker.OPEN
+
+    with patch("mcp_tourism.resilience.time.monotonic", return_value=131.0):
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow_request() is True
+        assert breaker.allow_request() is False  # Only one probe at a time
+
+        # A probe without a verdict frees the slot for the next one
+        breaker.release()
+        assert breaker.allow_request() is True
+
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+
+    with patch("mcp_tourism.resilience.time.monotonic", return_value=162.0):
+        assert breaker.allow_request() is True
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+        assert breaker.get_metrics()["calls"] == 0
+
+
+def test_parse_retry_after():
+    """Tests Retry-After parsing of delay-seconds and HTTP dates."""
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0  # In the past
+
+
+def test_retry_budget_tracks_traffic():
+    """Tests that the budget grows with requests and is spent by retries."""
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=0.0, window=10.0)
+    assert budget.try_spend() is False
+
+    for _ in range(4):
+        budget.record_request()
+    assert budget.try_spend() is True
+    assert budget.try_spend() is True
+    assert budget.try_spend() is False
+
+    # Old traffic leaves the window along with the budget it earned
+    with patch("mcp_tourism.resilience.time.monotonic", return_value=1e9):
+        assert budget.available == 0
+        assert budget.get_metrics()["requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_retry_past_deadline_does_not_spend_budget():
+    """Tests that a retry skipped for the deadline leaves the budget untouched."""
+    budget = RetryBudget(ratio=0.0, min_retries_per_second=1.0, window=10.0)
+    policy = RetryPolicy(
+        max_attempts=3, base_delay=0.1, retry_on=(ValueError,), budget=budget
+    )
+    calls = 0
+
+    async def fail():
+        nonlocal calls
+        calls += 1
+        error = ValueError("rate limited")
+        error.retry_after = 3.0  # Longer than the time left
+        raise error
+
+    with pytest.raises(ValueError):
+        await policy.retrying(deadline=time.monotonic() + 1.0)(fail)
+    assert calls == 1
+    assert budget.available == 10
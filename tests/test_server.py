@@ -1,7 +1,13 @@
+import asyncio
+import json
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from fastmcp import Client
+import mcp_tourism.server as server_module
 from mcp_tourism.server import mcp, get_api_client  # Import necessary items
+from mcp_tourism.admission import FairScheduler
+from mcp_tourism.concurrency import INTERACTIVE, current_lane
+from mcp_tourism.memo import ToolResultMemo, note_cache_key
 from mcp_tourism.api_client import KoreaTourismApiClient
 
 
@@ -82,3 +88,625 @@ def test_get_api_client_invalid_env_var(monkeypatch, env_var, invalid_value):
 
     # More flexible assertion: Check if the invalid value is mentioned in the error message.
     assert invalid_value in str(excinfo.value)
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_lifespan_warms_up_connections(
+    mock_get_api_client, mock_api_client, monkeypatch
+):
+    """
+    Test that the server lifespan warms up and keeps connections warm when enabled.
+    """
+    monkeypatch.setenv("MCP_TOURISM_WARMUP_CONNECTIONS", "3")
+    monkeypatch.setenv("MCP_TOURISM_KEEPALIVE_INTERVAL", "30")
+    mock_api_client.warm_up = AsyncMock()
+    mock_api_client.keep_warm = AsyncMock()
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        await client.ping()
+        mock_api_client.warm_up.assert_awaited_once_with(3)
+        mock_api_client.keep_warm.assert_called_once_with(3, 30.0)
+
+    # The keep-warm task is stopped once the last session has ended
+    assert server_module._keepalive_task is None
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_lifespan_without_warm_up(
+    mock_get_api_client, mock_api_client, monkeypatch
+):
+    """
+    Test that warm-up is skipped by default.
+    """
+    monkeypatch.delenv("MCP_TOURISM_WARMUP_CONNECTIONS", raising=False)
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        await client.ping()
+
+    mock_get_api_client.assert_not_called()
+
+
+def test_multi_tenant_clients_follow_request_header(monkeypatch):
+    """Tests that tenants get their own client for the key in the request header."""
+    monkeypatch.setattr(server_module, "_api_client", None)
+    monkeypatch.setattr(server_module, "_tenant_header", None)
+    monkeypatch.setattr(server_module, "_tenant_clients", None)
+    monkeypatch.delenv("KOREA_TOURISM_API_KEY", raising=False)
+    monkeypatch.setenv("MCP_TOURISM_MULTI_TENANT", "true")
+    monkeypatch.setenv("MCP_TOURISM_QUOTA_FILE", "")
+
+    headers = {"x-tourism-api-key": "TENANT_A"}
+    with patch.object(server_module, "get_http_headers", lambda: headers):
+        tenant_a = get_api_client()
+        assert tenant_a.api_key == "TENANT_A"
+        assert get_api_client() is tenant_a
+
+        headers = {"x-tourism-api-key": "TENANT_B"}
+        tenant_b = get_api_client()
+        assert tenant_b.api_key == "TENANT_B"
+        assert tenant_b.cache is tenant_a.cache
+
+        # Requests without the header use the server's own (here missing) key
+        headers = {}
+        assert get_api_client() is server_module._api_client
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_session_over_its_rate_is_rejected(
+    mock_get_api_client, mock_api_client, monkeypatch
+):
+    """Tests that admission control turns away calls over a session's rate."""
+    mock_api_client.get_area_code_list = AsyncMock(return_value={"items": []})
+    mock_get_api_client.return_value = mock_api_client
+    monkeypatch.setattr(
+        server_module,
+        "_scheduler",
+        FairScheduler(session_rate=0.1, session_burst=1, max_rate_wait=0.0),
+    )
+    monkeypatch.setattr(server_module, "_admission_key", lambda context: "session")
+
+    async with Client(mcp) as client:
+        await client.call_tool("get_area_codes", {})
+        with pytest.raises(Exception) as excinfo:
+            await client.call_tool("get_area_codes", {})
+
+    assert "Server busy" in str(excinfo.value)
+    assert mock_api_client.get_area_code_list.await_count == 1
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_repeated_tool_calls_are_memoized(
+    mock_get_api_client, mock_api_client, monkeypatch
+):
+    """Tests that tool results are reused until their cache entries expire."""
+    cached = {"area-codes"}
+
+    async def get_area_code_list(**kwargs):
+        note_cache_key("area-codes")
+        return {"items": []}
+
+    mock_api_client.get_area_code_list = AsyncMock(side_effect=get_area_code_list)
+    mock_api_client.is_cached = cached.__contains__
+    mock_get_api_client.return_value = mock_api_client
+    monkeypatch.setattr(server_module, "_tool_memo", ToolResultMemo())
+
+    async with Client(mcp) as client:
+        first = await client.call_tool("get_area_codes", {"language": None})
+        second = await client.call_tool("get_area_codes", {})
+        assert first[0].text == second[0].text
+        assert mock_api_client.get_area_code_list.await_count == 1
+
+        cached.clear()
+        await client.call_tool("get_area_codes", {})
+        assert mock_api_client.get_area_code_list.await_count == 2
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_batch_details_are_deduplicated_and_keep_input_order(
+    mock_get_api_client, mock_api_client
+):
+    """Tests deduplication, ordering and per-item errors of the batch tool."""
+    lanes = set()
+
+    async def get_detail_common(content_id, **kwargs):
+        lanes.add(current_lane())
+        if content_id == "bad":
+            raise RuntimeError("upstream failed")
+        return {"items": [{"contentid": content_id, "title": f"Item {content_id}"}]}
+
+    mock_api_client.get_detail_common = AsyncMock(side_effect=get_detail_common)
+    mock_api_client.get_detail_intro = AsyncMock(
+        return_value={"items": [{"usetime": "09:00"}]}
+    )
+    mock_api_client.get_detail_info = AsyncMock(return_value={"items": []})
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "get_detailed_information_batch",
+            {
+                "content_ids": ["2", "bad", "1", "2"],
+                "content_types": ["Tourist Attraction"],
+                "filter": ["contentid", "usetime"],
+            },
+        )
+
+    data = json.loads(result[0].text)
+    assert [item["content_id"] for item in data["items"]] == ["2", "bad", "1", "2"]
+    assert data["items"][0]["result"] == {"contentid": "2", "usetime": "09:00"}
+    assert data["items"][1]["error"] == "upstream failed"
+    assert data["error_count"] == 1
+    assert mock_api_client.get_detail_common.await_count == 3
+    assert lanes == {INTERACTIVE}  # A batch is as urgent as single calls
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_multi_query_runs_tools_concurrently_under_one_deadline(
+    mock_get_api_client, mock_api_client, monkeypatch
+):
+    """Tests that multi_query runs each query and reports failures per query."""
+    deadlines = []
+
+    async def get_area_code_list(**kwargs):
+        deadlines.append(kwargs["deadline"])
+        return {"items": [{"code": "1"}]}
+
+    mock_api_client.get_area_code_list = AsyncMock(side_effect=get_area_code_list)
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "multi_query",
+            {
+                "queries": [
+                    {"id": "areas", "tool": "get_area_codes", "args": {}},
+                    {"tool": "get_area_codes", "args": {"parent_area_code": "1"}},
+                    {"tool": "multi_query", "args": {"queries": []}},
+                    {"tool": "get_area_codes", "args": {"rows": "many"}},
+                ]
+            },
+        )
+
+    data = json.loads(result[0].text)
+    assert data["results"]["areas"]["result"]["items"] == [{"code": "1"}]
+    assert data["results"]["1"]["result"]["parent_area_code"] == "1"
+    assert "Unknown tool" in data["results"]["2"]["error"]
+    assert "rows" in data["results"]["3"]["error"]
+    assert data["error_count"] == 2
+    assert len(deadlines) == 2 and deadlines[0] == deadlines[1]
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_search_in_several_languages_filters_localized_fields(
+    mock_get_api_client, mock_api_client
+):
+    """Tests that the filter also applies to the per-language fields."""
+    mock_api_client.for_languages = AsyncMock(
+        return_value={
+            "languages": ["en", "jp"],
+            "total_count": {"en": 1, "jp": 1},
+            "items": [
+                {
+                    "contentid": "1",
+                    "mapx": "126.9",
+                    "languages": ["en", "jp"],
+                    "localized": {
+                        "en": {"title": "Namsan", "addr1": "Seoul"},
+                        "jp": {"title": "南山", "addr1": "ソウル"},
+                    },
+                }
+            ],
+            "errors": {},
+        }
+    )
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "search_tourism_by_keyword",
+            {"keyword": "Namsan", "languages": ["en", "jp"], "filter": ["title"]},
+        )
+
+    item = json.loads(result[0].text)["items"][0]
+    assert item == {
+        "languages": ["en", "jp"],
+        "localized": {"en": {"title": "Namsan"}, "jp": {"title": "南山"}},
+    }
+    assert mock_api_client.for_languages.await_args.args[0] == ["en", "jp"]
+    mock_api_client.search_by_keyword.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_all_areas_are_fetched_through_the_merge(
+    mock_get_api_client, mock_api_client
+):
+    """Tests that area_codes="all" merges every top-level area in the given order."""
+    mock_api_client.merge_areas = AsyncMock(
+        return_value={"total_count": 1, "items": [{"title": "A", "tel": "1"}]}
+    )
+    mock_api_client.search_stay = AsyncMock(return_value={"items": []})
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "find_accommodations",
+            {"area_codes": "all", "sort_by": "title", "filter": ["title"]},
+        )
+        with pytest.raises(Exception, match="area_codes cannot be combined"):
+            await client.call_tool(
+                "find_accommodations", {"area_codes": ["1"], "area_code": "1"}
+            )
+
+    assert json.loads(result[0].text)["items"] == [{"title": "A"}]
+    args, kwargs = mock_api_client.merge_areas.await_args
+    assert len(args[0]) == 17 and kwargs["sort_by"] == "title"
+    await args[1]("6", 2, 20)
+    assert mock_api_client.search_stay.await_args.kwargs == {
+        "area_code": "6",
+        "language": None,
+        "page": 2,
+        "rows": 20,
+        "deadline": mock_api_client.search_stay.await_args.kwargs["deadline"],
+        "arrange": "O",
+    }
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_route_results_are_paginated_in_travel_order(
+    mock_get_api_client, mock_api_client
+):
+    """Tests paging and filtering of the ranked items of a route search."""
+    mock_api_client.search_along_route = AsyncMock(
+        return_value={
+            "total_count": 3,
+            "route_length_m": 9000,
+            "query_count": 6,
+            "query_radius": 1415,
+            "failed_queries": 0,
+            "truncated_queries": 0,
+            "items": [
+                {"contentid": str(i), "title": f"T{i}", "distance_along_m": i}
+                for i in range(3)
+            ],
+        }
+    )
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "find_attractions_along_route",
+            {
+                "polyline": [[127.0, 37.0], [127.1, 37.0]],
+                "buffer_m": 1000,
+                "content_type": "Restaurant",
+                "page": 2,
+                "rows": 2,
+                "filter": ["contentid"],
+            },
+        )
+
+    data = json.loads(result[0].text)
+    assert data["items"] == [{"contentid": "2"}]
+    assert data["total_count"] == 3 and data["page_no"] == 2
+    kwargs = mock_api_client.search_along_route.await_args.kwargs
+    assert kwargs["content_type_id"] == "82"
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_bbox_search_passes_the_box_and_content_type(
+    mock_get_api_client, mock_api_client
+):
+    """Tests argument handling and paging of the bounding box tool."""
+    mock_api_client.find_in_bbox = AsyncMock(
+        return_value={
+            "total_count": 1,
+            "tile_size_m": 1000,
+            "query_count": 4,
+            "failed_queries": 0,
+            "truncated_queries": 0,
+            "items": [{"contentid": "1", "title": "A"}],
+        }
+    )
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "find_in_bbox",
+            {
+                "min_lon": 126.97,
+                "min_lat": 37.55,
+                "max_lon": 127.0,
+                "max_lat": 37.58,
+                "content_type": "Shopping",
+                "filter": ["title"],
+            },
+        )
+
+    data = json.loads(result[0].text)
+    assert data["items"] == [{"title": "A"}] and data["tile_size_m"] == 1000
+    call = mock_api_client.find_in_bbox.await_args
+    assert call.args == (126.97, 37.55, 127.0, 37.58)
+    assert call.kwargs["content_type_id"] == "79"
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_nearest_items_are_filtered(mock_get_api_client, mock_api_client):
+    """Tests argument handling and filtering of the nearest items tool."""
+    mock_api_client.find_nearest = AsyncMock(
+        return_value={
+            "total_count": 1,
+            "query_count": 0,
+            "items": [{"contentid": "1", "title": "A", "distance_m": 12}],
+        }
+    )
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "find_nearest",
+            {
+                "k": 1,
+                "longitude": 126.978,
+                "latitude": 37.5665,
+                "content_type": "Restaurant",
+                "filter": ["title", "distance_m"],
+            },
+        )
+
+    assert json.loads(result[0].text)["items"] == [{"title": "A", "distance_m": 12}]
+    call = mock_api_client.find_nearest.await_args
+    assert call.args == (1, 126.978, 37.5665)
+    assert call.kwargs["content_type_id"] == "82"
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_nearby_results_can_be_clustered(mock_get_api_client, mock_api_client):
+    """Tests that cluster=True drains the radius and returns grid clusters."""
+    mock_api_client.fetch_all_pages = AsyncMock(
+        return_value={
+            "total_count": 3,
+            "page_count": 1,
+            "failed_pages": 0,
+            "truncated": False,
+            "items": [
+                {"contentid": "1", "title": "A", "mapx": "126.98", "mapy": "37.56"},
+                {"contentid": "2", "title": "B", "mapx": "126.9801", "mapy": "37.56"},
+                {"contentid": "3", "title": "C", "mapx": "127.1", "mapy": "37.6"},
+            ],
+        }
+    )
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "find_nearby_attractions",
+            {
+                "longitude": 126.98,
+                "latitude": 37.56,
+                "radius": 20000,
+                "cluster": True,
+                "filter": ["title"],
+            },
+        )
+
+    data = json.loads(result[0].text)
+    assert data["cluster_size_m"] == 4000
+    assert [cluster["count"] for cluster in data["clusters"]] == [2, 1]
+    assert data["clusters"][1]["items"] == [{"title": "C"}]
+    mock_api_client.get_location_based_list.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_itinerary_orders_located_items(mock_get_api_client, mock_api_client):
+    """Tests the visiting order from a start point, with unresolved items reported."""
+    locations = {"a": ("127.02", "37.0"), "b": ("127.01", "37.0"), "c": ("", "")}
+
+    async def get_detail_common(content_id, **kwargs):
+        if content_id == "bad":
+            raise RuntimeError("upstream failed")
+        mapx, mapy = locations[content_id]
+        return {"items": [{"title": content_id.upper(), "mapx": mapx, "mapy": mapy}]}
+
+    mock_api_client.get_detail_common = AsyncMock(side_effect=get_detail_common)
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "optimize_itinerary",
+            {
+                "content_ids": ["a", "b", "c", "bad", "a"],
+                "start": [127.0, 37.0],
+                "round_trip": True,
+            },
+        )
+
+    data = json.loads(result[0].text)
+    assert [stop.get("content_id") for stop in data["stops"]] == [None, "b", "a", None]
+    assert data["stops"][1]["leg_distance_m"] == 888
+    assert data["total_distance_m"] == data["stops"][-1]["cumulative_distance_m"]
+    assert {u["content_id"] for u in data["unresolved"]} == {"c", "bad"}
+    assert mock_api_client.get_detail_common.await_count == 4
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_counts_per_district_form_a_histogram(
+    mock_get_api_client, mock_api_client
+):
+    """Tests that count_by counts every district of an area in count mode."""
+    mock_api_client.get_area_code_list = AsyncMock(
+        return_value={
+            "items": [
+                {"code": "1", "name": "Gangnam-gu"},
+                {"code": "2", "name": "Gangdong-gu"},
+                {"code": "3", "name": "Broken-gu"},
+            ]
+        }
+    )
+
+    async def get_area_based_list(**kwargs):
+        assert kwargs["count_only"] and kwargs["content_type_id"] == "82"
+        if kwargs["sigunguCode"] == "3":
+            raise RuntimeError("upstream failed")
+        return {"total_count": {"1": 120, "2": 340}[kwargs["sigunguCode"]]}
+
+    mock_api_client.get_area_based_list = AsyncMock(side_effect=get_area_based_list)
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "count_by",
+            {"by": "sigungu", "area_code": "1", "content_type": "Restaurant"},
+        )
+        with pytest.raises(Exception, match="requires area_code"):
+            await client.call_tool("count_by", {"by": "sigungu"})
+
+    data = json.loads(result[0].text)
+    assert data["counts"] == [
+        {"code": "2", "name": "Gangdong-gu", "count": 340},
+        {"code": "1", "name": "Gangnam-gu", "count": 120},
+    ]
+    assert data["total_count"] == 460
+    assert data["errors"] == {"3": "upstream failed"}
+
+
+@pytest.mark.asyncio
+@patch("mcp_tourism.server.get_api_client")
+async def test_enrich_merges_requested_detail_fields(
+    mock_get_api_client, mock_api_client, monkeypatch
+):
+    """Tests that enrich fetches details concurrently and merges only asked fields."""
+    monkeypatch.setenv("MCP_TOURISM_ENRICH_CONCURRENCY", "2")
+    deadlines = set()
+    mock_api_client.get_area_based_list = AsyncMock(
+        return_value={
+            "total_count": 3,
+            "items": [
+                {"contentid": "1", "contenttypeid": "12", "title": "A"},
+                {"contentid": "2", "contenttypeid": "12", "title": "B"},
+                {"contentid": "3", "contenttypeid": "12", "title": "C"},
+            ],
+        }
+    )
+
+    async def get_detail_common(content_id, **kwargs):
+        return {
+            "items": [
+                {"contentid": content_id, "overview": f"About {content_id}", "tel": "x"}
+            ]
+        }
+
+    async def get_detail_intro(content_id, content_type_id, **kwargs):
+        deadlines.add(kwargs["deadline"])
+        if content_id == "2":
+            raise RuntimeError("upstream failed")
+        await asyncio.sleep(0.01)
+        return {"items": [{"usetime": "09:00-18:00", "restdate": "Mondays"}]}
+
+    mock_api_client.get_detail_common = AsyncMock(side_effect=get_detail_common)
+    mock_api_client.get_detail_intro = AsyncMock(side_effect=get_detail_intro)
+    mock_get_api_client.return_value = mock_api_client
+
+    async with Client(mcp) as client:
+        result = await client.call_tool(
+            "get_tourism_by_area",
+            {
+                "area_code": "1",
+                "filter": ["title"],
+                "enrich": ["overview", "usetime"],
+            },
+        )
+        with pytest.raises(Exception, match="cluster"):
+            await client.call_tool(
+                "find_nearby_attractions",
+                {
+                    "longitude": 126.98,
+                    "latitude": 37.57,
+                    "cluster": True,
+                    "enrich": ["overview"],
+                },
+            )
+
+    data = json.loads(result[0].text)
+    assert data["items"][0] == {
+        "title": "A",
+        "overview": "About 1",
+        "usetime": "09:00-18:00",
+    }
+    assert data["items"][1] == {"title": "B"}
+    assert data["items"][2]["usetime"] == "09:00-18:00"
+    assert data["enrich_errors"] == {"2": "upstream failed"}
+    assert None not in deadlines  # Every item has a deadline of its own
+    assert mock_api_client.get_detail_common.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_enrich_leaves_cached_list_responses_untouched(client, monkeypatch):
+    """Tests that enriched fields never leak into the cached list response."""
+
+    async def send_request(endpoint, params, request_language, api_key):
+        if endpoint == client.DETAIL_COMMON_ENDPOINT:
+            items = [{"contentid": params["contentId"], "overview": "OV"}]
+        else:
+            items = [{"contentid": "1", "contenttypeid": "12", "title": "A"}]
+        return {"total_count": 1, "num_of_rows": 1, "page_no": 1, "items": items}
+
+    monkeypatch.setattr(client, "_send_request", send_request)
+    monkeypatch.setattr(server_module, "get_api_client", lambda: client)
+
+    async with Client(mcp) as mcp_client:
+        enriched = await mcp_client.call_tool(
+            "get_tourism_by_area", {"area_code": "1", "enrich": ["overview"]}
+        )
+        plain = await mcp_client.call_tool("get_tourism_by_area", {"area_code": "1"})
+
+    assert json.loads(enriched[0].text)["items"][0]["overview"] == "OV"
+    assert "overview" not in json.loads(plain[0].text)["items"][0]
+
+
+@pytest.mark.asyncio
+async def test_enrich_times_out_slow_items_only(client, monkeypatch):
+    """Tests the per-item timeout, which starts once the item has its turn."""
+    monkeypatch.setenv("MCP_TOURISM_ENRICH_CONCURRENCY", "1")
+    monkeypatch.setenv("MCP_TOURISM_ENRICH_TIMEOUT", "0.1")
+
+    async def send_request(endpoint, params, request_language, api_key):
+        if endpoint == client.DETAIL_COMMON_ENDPOINT:
+            content_id = params["contentId"]
+            await asyncio.sleep(1 if content_id == "2" else 0.05)
+            items = [{"contentid": content_id, "overview": f"About {content_id}"}]
+        else:
+            items = [{"contentid": str(i), "title": str(i)} for i in (1, 2, 3)]
+        return {"total_count": 3, "num_of_rows": 3, "page_no": 1, "items": items}
+
+    monkeypatch.setattr(client, "_send_request", send_request)
+    monkeypatch.setattr(server_module, "get_api_client", lambda: client)
+
+    async with Client(mcp) as mcp_client:
+        result = await mcp_client.call_tool(
+            "get_tourism_by_area", {"area_code": "1", "enrich": ["overview"]}
+        )
+
+    data = json.loads(result[0].text)
+    # Item 3 waited for its turn longer than the timeout and still merged
+    assert [item.get("overview") for item in data["items"]] == [
+        "About 1",
+        None,
+        "About 3",
+    ]
+    assert list(data["enrich_errors"]) == ["2"]
@@ -3,7 +3,7 @@ from unittest.mock import patch, MagicMock
 from starlette.testclient import TestClient
 from starlette.applications import Starlette
 
-from mcp_tourism.server import health_check, parse_server_config
+from mcp_tourism.server import health_check, metrics, parse_server_config
 
 
 class TestTransportConfiguration:
@@ -393,6 +393,29 @@ class TestServerIntegration:
                 assert data["transport"] == "streamable-http"
                 assert "timestamp" in data
 
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint_integration(self, monkeypatch):
+        """Test metrics endpoint exposes the API client metrics."""
+        app = Starlette()
+        app.add_route("/metrics", metrics, methods=["GET"])
+
+        with TestClient(app) as client:
+            with patch("mcp_tourism.server.get_api_client") as mock_get_client:
+                mock_client = MagicMock()
+                mock_client.get_metrics.return_value = {
+                    "concurrency": {"limit": 12, "in_flight": 3, "queued": 0}
+                }
+                mock_get_client.return_value = mock_client
+
+                response = client.get("/metrics")
+
+                assert response.status_code == 200
+                data = response.json()
+                assert data["service"] == "Korea Tourism API MCP Server"
+                assert data["concurrency"]["limit"] == 12
+                assert data["concurrency"]["in_flight"] == 3
+                assert "timestamp" in data
+
 
 class TestEnvironmentVariablePriority:
     """Test environment variable priority and fallback behavior."""